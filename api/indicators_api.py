@@ -2,18 +2,31 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
 
-import os, json, time, uuid
+import os, sys, json, time, uuid, socket
 from typing import Any, Dict, Optional, Tuple, List
 import threading
 
 import requests
 import pandas as pd
 from requests.adapters import HTTPAdapter
+
+try:  # optional: msgpack-Antworten für /indicator (nur wenn der Client es per Accept will)
+    import msgpack  # type: ignore
+except Exception:  # pragma: no cover
+    msgpack = None  # type: ignore
+try:  # optional: orjson parst Upstream-Antworten (rows/columns) 2-4x schneller
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
+import urllib3
+from urllib.parse import urlencode
 from urllib3.util.retry import Retry
 from config import PRICE_API_ENDPOINT
 
 
-from fastapi import APIRouter, FastAPI, HTTPException, Query, Request
+from concurrent.futures import ThreadPoolExecutor
+
+from fastapi import APIRouter, Body, FastAPI, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 
@@ -48,12 +61,47 @@ TO_SIGNAL = float(os.getenv("IND_TO_SIGNAL", "25"))
 TO_CUSTOM = float(os.getenv("IND_TO_CUSTOM", "25"))
 TO_SCREENER = float(os.getenv("IND_TO_SCREENER", "15"))
 
+# Connection-Pool (Upstream price_api): viele kleine /indicator-Calls → Verbindungen wiederverwenden
+POOL_CONNECTIONS = int(os.getenv("IND_PROXY_POOL_CONNECTIONS", "64"))
+POOL_MAXSIZE = int(os.getenv("IND_PROXY_POOL_MAXSIZE", "128"))
+
+# Inkrementeller Chart-Refresh: letzte Charts länger halten und nach Ablauf von
+# SMALL_TTL nur die letzten CHART_INCR_TAIL Bars nachladen (0 = aus)
+CHART_INCR_TTL = float(os.getenv("IND_PROXY_CHART_INCR_TTL", "600"))
+CHART_INCR_TAIL = int(os.getenv("IND_PROXY_CHART_INCR_TAIL", "10"))
+# optional: Chart-Basen zusätzlich in SQLite (überlebt Neustarts -> nach Restart
+# nur Tail-Refresh statt voller Charts). Leer = aus.
+CHART_DISK_CACHE = os.getenv("IND_PROXY_CHART_DISK_CACHE", "").strip()
+# dtype der gecachten OHLCV-Spalten: float32 halbiert den Speicher der Chart-Frames,
+# float64 (Default) hält volle Präzision (eq mit engem abs_tol).
+VALUE_DTYPE = os.getenv("IND_PROXY_VALUE_DTYPE", "float64").strip().lower()
+if VALUE_DTYPE not in ("float32", "float64"):
+    VALUE_DTYPE = "float64"
+
+# POST /indicator/batch: max items per call + parallel upstream fan-out
+BATCH_MAX_ITEMS = int(os.getenv("IND_PROXY_BATCH_MAX", "500"))
+BATCH_WORKERS = int(os.getenv("IND_PROXY_BATCH_WORKERS", "16"))
+
 PROXY_NAME = "IndicatorsProxy"
 PROXY_VERSION = "1.4.0"  # kombiniert
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Requests-Session mit Retries
 # ──────────────────────────────────────────────────────────────────────────────
+_SOCKET_OPTIONS = [
+    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),  # kleine Requests nicht puffern (Nagle)
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),  # idle Verbindungen im Pool am Leben halten
+]
+
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter, der TCP_NODELAY/SO_KEEPALIVE an urllib3 durchreicht."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs.setdefault("socket_options", _SOCKET_OPTIONS)
+        return super().init_poolmanager(*args, **kwargs)
+
+
 def _session() -> requests.Session:
     s = requests.Session()
     retry = Retry(
@@ -63,17 +111,50 @@ def _session() -> requests.Session:
         allowed_methods=frozenset(["GET"]),
         raise_on_status=False,
     )
-    s.mount("http://", HTTPAdapter(max_retries=retry))
-    s.mount("https://", HTTPAdapter(max_retries=retry))
+    for prefix in ("http://", "https://"):
+        s.mount(
+            prefix,
+            _KeepAliveAdapter(
+                max_retries=retry,
+                pool_connections=POOL_CONNECTIONS,
+                pool_maxsize=POOL_MAXSIZE,
+                pool_block=False,
+            ),
+        )
     s.headers.update({
         "User-Agent": f"{PROXY_NAME}/{PROXY_VERSION} (+api-manager)",
         "Accept": "application/json",
+        "Accept-Encoding": "gzip",
+        "Connection": "keep-alive",
         "X-Proxy-Name": PROXY_NAME,
         "X-Proxy-Version": PROXY_VERSION,
     })
     return s
 
 S = _session()
+
+# /indicator (heißester Pfad, auch aus /indicator/batch-Workern): direkt über urllib3,
+# ohne requests-Overhead (PreparedRequest, Cookie-Jar, Hooks, Redirect-Logik).
+# Admin-/Passthrough-Endpunkte bleiben auf S.
+_POOL = urllib3.PoolManager(
+    num_pools=POOL_CONNECTIONS,
+    maxsize=POOL_MAXSIZE,
+    block=False,
+    socket_options=_SOCKET_OPTIONS,
+    retries=Retry(
+        total=3, connect=3, read=3,
+        backoff_factor=0.25,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(["GET"]),
+        raise_on_status=False,
+    ),
+    headers={k: str(v) for k, v in S.headers.items()},
+)
+
+# /indicator/batch: Worker leben so lange wie das Modul (wie S/_POOL) -> kein Thread-
+# Start/Join pro Request; BATCH_WORKERS begrenzt den Upstream-Fan-out über alle Batches.
+_BATCH_POOL = ThreadPoolExecutor(max_workers=max(1, BATCH_WORKERS), thread_name_prefix="ind-batch")
+
 router = APIRouter()
 
 # (Optional) Mini-App für Standalone-Betrieb/Tests
@@ -84,7 +165,7 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
     allow_credentials=False,
-    allow_methods=["GET", "OPTIONS"],
+    allow_methods=["GET", "POST", "OPTIONS"],
     allow_headers=["*"],
 )
 
@@ -115,8 +196,10 @@ def _cache_set(key: str, val: Any) -> None:
 # ──────────────────────────────────────────────────────────────────────────────
 # Utils
 # ──────────────────────────────────────────────────────────────────────────────
+_ENC_STABLE = json.JSONEncoder(sort_keys=True, separators=(",", ":")).encode  # einmal bauen, nicht pro Call
+
 def _sj(d: Dict[str, Any]) -> str:
-    return json.dumps(d, sort_keys=True, separators=(",", ":"))
+    return _ENC_STABLE(d)
 
 def _new_req_id(client_req: Optional[str]) -> str:
     try:
@@ -126,13 +209,22 @@ def _new_req_id(client_req: Optional[str]) -> str:
         pass
     return uuid.uuid4().hex[:8]
 
+def _resp_json(resp: requests.Response) -> Any:
+    """resp.json() – mit orjson direkt aus den Bytes, wenn vorhanden (Nicht-UTF-8 → requests/stdlib)."""
+    if orjson is not None:
+        try:
+            return orjson.loads(resp.content)
+        except orjson.JSONDecodeError:
+            pass
+    return resp.json()
+
 def _parse_json_or_raise(resp: requests.Response) -> Any:
     """
     Saubere JSON-Verarbeitung: Wenn Upstream keinen JSON liefert → 502 mit Text-Snippet.
     Wenn Upstream-Status !ok mit JSON → strukturiert durchreichen.
     """
     try:
-        data = resp.json()
+        data = _resp_json(resp)
     except ValueError:
         text_snip = (resp.text or "")[:400]
         if DEBUG:
@@ -226,6 +318,54 @@ def _get_upstream(
             print(f"[PROXY][IND][{req_id}] GET {url} REXC {type(e).__name__}: {e} dt_ms={dt:.1f}")
         raise HTTPException(status_code=502, detail=str(e))
 
+def _get_upstream_fast(
+    path: str, *,
+    params: Optional[Dict[str, Any]] = None,
+    timeout: float = DEFAULT_TIMEOUT,
+    req_id: str = "-"
+) -> Any:
+    """Wie _get_upstream (gleiche Fehler-Semantik), aber über _POOL statt requests."""
+    url = f"{PRICE_API_BASE}{path}"
+    if params:
+        qs = urlencode([(k, v) for k, v in params.items() if v is not None], doseq=True)
+        if qs:
+            url = f"{url}?{qs}"
+    t0 = time.time()
+    if DEBUG:
+        pv = url if len(url) <= 500 else (url[:500] + "…")
+        print(f"[PROXY][IND][{req_id}] GET {pv}")
+    try:
+        r = _POOL.request(
+            "GET", url,
+            headers={**_POOL.headers, "X-Proxy-Req-ID": req_id},
+            timeout=urllib3.Timeout(connect=timeout, read=timeout),
+        )
+    except urllib3.exceptions.HTTPError as e:
+        if DEBUG:
+            dt = (time.time() - t0) * 1000.0
+            print(f"[PROXY][IND][{req_id}] GET {path} REXC {type(e).__name__}: {e} dt_ms={dt:.1f}")
+        raise HTTPException(status_code=502, detail=str(e))
+
+    raw = r.data
+    try:
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except ValueError:
+        text_snip = raw[:400].decode("utf-8", errors="replace")
+        if DEBUG:
+            print(f"[PROXY][IND][ERR] upstream_non_json status={r.status} text={text_snip!r}")
+        raise HTTPException(status_code=502, detail={"status": r.status, "text": text_snip})
+
+    if r.status >= 400:
+        if DEBUG:
+            print(f"[PROXY][IND][ERR] upstream_error status={r.status} body={raw[:3000].decode('utf-8', errors='replace')}")
+        # Upstream-Fehler JSON bleibt erhalten
+        raise HTTPException(status_code=r.status, detail=data)
+
+    if DEBUG:
+        dt = (time.time() - t0) * 1000.0
+        print(f"[PROXY][IND][{req_id}] GET {path} status={r.status} dt_ms={dt:.1f}")
+    return data
+
 def _coerce_params_types(d: Dict[str, Any]) -> Dict[str, Any]:
     """
     Wandelt stringifizierte Zahlen/Bools in echte Typen um: "22"->22, "3.14"->3.14, "true"->True.
@@ -520,6 +660,140 @@ _local_chart_cache = TTLCache(maxsize=64, ttl=SMALL_TTL)
 
 _local_chart_lock = threading.RLock()
 
+# key -> letzter voller Chart-Payload (Basis für inkrementellen Refresh)
+_local_chart_incr = TTLCache(maxsize=64, ttl=CHART_INCR_TTL)
+
+_chart_disk = None
+if CHART_DISK_CACHE:
+    try:
+        import sqlite3
+        _chart_disk = sqlite3.connect(CHART_DISK_CACHE, isolation_level=None, check_same_thread=False)
+        _chart_disk.execute("PRAGMA journal_mode=WAL")
+        _chart_disk.execute("PRAGMA synchronous=NORMAL")  # Cache: Verlust der letzten Writes ist ok
+        _chart_disk.execute("CREATE TABLE IF NOT EXISTS chart (k TEXT PRIMARY KEY, ts REAL, v BLOB)")
+        if DEBUG:
+            print(f"[BOOT][INDPROXY] chart disk cache {CHART_DISK_CACHE!r}")
+    except Exception as e:
+        print(f"[BOOT][INDPROXY] chart disk cache disabled: {type(e).__name__}: {e}")
+        _chart_disk = None
+
+
+def _chart_disk_key(key: Tuple[Any, ...]) -> str:
+    return "|".join("" if x is None else str(x) for x in key)
+
+
+def _chart_disk_get(key: Tuple[Any, ...]) -> Optional[Any]:
+    """Chart-Basis von Platte (nur jünger als CHART_INCR_TTL). Aufruf unter _local_chart_lock."""
+    if _chart_disk is None:
+        return None
+    try:
+        row = _chart_disk.execute(
+            "SELECT v FROM chart WHERE k=? AND ts>?", (_chart_disk_key(key), time.time() - CHART_INCR_TTL)
+        ).fetchone()
+        if row is None:
+            return None
+        return orjson.loads(row[0]) if orjson is not None else json.loads(row[0])
+    except Exception as e:
+        print(f"[PROXY][IND] chart disk get failed: {type(e).__name__}: {e}")
+        return None
+
+
+def _chart_disk_put(key: Tuple[Any, ...], data: Any) -> None:
+    """Aufruf unter _local_chart_lock (eine Connection, serialisiert)."""
+    if _chart_disk is None:
+        return
+    try:
+        blob = orjson.dumps(data) if orjson is not None else json.dumps(data).encode("utf-8")
+        _chart_disk.execute(
+            "INSERT OR REPLACE INTO chart (k, ts, v) VALUES (?, ?, ?)", (_chart_disk_key(key), time.time(), blob)
+        )
+    except Exception as e:
+        print(f"[PROXY][IND] chart disk put failed: {type(e).__name__}: {e}")
+
+
+_ROW_TS_KEYS = ("Timestamp", "timestamp", "Timestamp_ISO", "timestamp_iso", "timestamp_ms", "time", "ts", "date", "datetime")
+
+
+def _chart_rows(payload: Any) -> Tuple[Optional[str], Optional[List[Any]]]:
+    if isinstance(payload, dict):
+        for k in ("rows", "data", "candles", "klines"):
+            rows = payload.get(k)
+            if isinstance(rows, list):
+                return k, rows
+    return None, None
+
+
+def _row_ts(row: Any) -> Any:
+    if isinstance(row, dict):
+        for k in _ROW_TS_KEYS:
+            v = row.get(k)
+            if v is not None:
+                return v
+    return None
+
+
+def _merge_chart_tail(old: Any, tail: Any, count: int) -> Optional[Dict[str, Any]]:
+    """
+    Hängt die frisch geladenen Tail-Bars an den alten Chart an (gleicher Timestamp → neu gewinnt).
+    None, wenn nicht sicher mergebar (Format unbekannt, Lücke zwischen alt und neu).
+    """
+    rk, old_rows = _chart_rows(old)
+    tk, new_rows = _chart_rows(tail)
+    if rk is None or tk != rk or not old_rows or not new_rows:
+        return None
+    first_new = _row_ts(new_rows[0])
+    last_old = _row_ts(old_rows[-1])
+    if first_new is None or last_old is None or type(first_new) is not type(last_old):
+        return None
+    if first_new > last_old:
+        # kein Überlappen → es könnten Bars dazwischen fehlen → voller Fetch
+        return None
+    keep = [r for r in old_rows if (_row_ts(r) is not None and _row_ts(r) < first_new)]
+    rows = (keep + list(new_rows))[-count:]
+    out = dict(old)
+    out[rk] = rows
+    if "count" in out:
+        out["count"] = len(rows)
+    return out
+
+# Ergebnis-Memo für lokale Customs: mehrere Gruppen/Batch-Items mit gleichem
+# (name, symbol, intervals, params, count) rechnen innerhalb SMALL_TTL nur einmal.
+_local_compute_cache = TTLCache(maxsize=256, ttl=SMALL_TTL)
+
+
+def _canon_param(v: Any) -> Any:
+    """
+    Hashbarer, kanonischer Cache-Key-Teil (statt json.dumps(sort_keys) pro Call):
+    Floats auf 12 Stellen, Dicts -> sortierte Item-Tupel, Listen -> Tupel.
+    Skalare tragen ihren Typ mit, damit 1 / 1.0 / True (wie im JSON-Key) verschieden bleiben.
+    """
+    if isinstance(v, dict):
+        return tuple(sorted((str(k), _canon_param(x)) for k, x in v.items()))
+    if isinstance(v, (list, tuple)):
+        return (list, tuple(_canon_param(x) for x in v))
+    if isinstance(v, float):
+        return (float, round(v, 12))
+    try:
+        hash(v)
+    except TypeError:
+        return (str, str(v))
+    return (v.__class__, v)
+
+
+def _local_compute_key(
+    lname: str,
+    symbol: str,
+    chart_interval: str,
+    indicator_interval: str,
+    shaped_params: Dict[str, Any],
+    count: Optional[int],
+) -> Optional[Tuple[Any, ...]]:
+    try:
+        pk = _canon_param(shaped_params or {})
+    except Exception:
+        return None
+    return (lname, symbol, chart_interval, indicator_interval, pk, count)
+
 
 def _get_chart_cached_local(symbol: str, interval: str, req_id: str, count: Optional[int] = None):
     capped_count = _cap_count(count)
@@ -537,12 +811,32 @@ def _get_chart_cached_local(symbol: str, interval: str, req_id: str, count: Opti
     if capped_count is not None:
         params["count"] = capped_count
 
-    data = _get_upstream(
-        "/chart",
-        params=params,
-        timeout=TO_CHART,
-        req_id=req_id,
-    )
+    data = None
+    with _local_chart_lock:
+        base = _local_chart_incr.get(key)
+        if base is None:
+            base = _chart_disk_get(key)
+    if base is not None and capped_count is not None and 0 < CHART_INCR_TAIL < capped_count:
+        try:
+            tail = _get_upstream(
+                "/chart",
+                params={**params, "count": CHART_INCR_TAIL},
+                timeout=TO_CHART,
+                req_id=req_id,
+            )
+            data = _merge_chart_tail(base, tail, capped_count)
+        except HTTPException:
+            data = None
+        if DEBUG:
+            print(f"[PROXY][IND][{req_id}] chart LOCAL incremental {key} tail={CHART_INCR_TAIL} merged={data is not None}")
+
+    if data is None:
+        data = _get_upstream(
+            "/chart",
+            params=params,
+            timeout=TO_CHART,
+            req_id=req_id,
+        )
 
     if DEBUG:
         try:
@@ -555,11 +849,80 @@ def _get_chart_cached_local(symbol: str, interval: str, req_id: str, count: Opti
 
     with _local_chart_lock:
         _local_chart_cache[key] = data
+        _local_chart_incr[key] = data
+        _chart_disk_put(key, data)
 
     return data
 
 
 
+# Spaltenform (SoA) des normalisierten Charts: id(payload) -> (payload, df).
+# Mehrere Customs auf demselben Chart bauen das DataFrame aus list[dict] nur einmal;
+# der `is`-Check schützt gegen wiederverwendete ids.
+_local_df_cache = TTLCache(maxsize=64, ttl=SMALL_TTL)
+
+
+def _chart_df_local(chart: Any, req_id: str) -> pd.DataFrame:
+    with _local_chart_lock:
+        hit = _local_df_cache.get(id(chart))
+    if hit is not None and hit[0] is chart:
+        if DEBUG:
+            print(f"[PROXY][IND][{req_id}] chart LOCAL df cache-hit rows={len(hit[1])}")
+        # Kopie: lokale Indikatoren hängen Spalten an
+        return hit[1].copy()
+
+    df = normalize_chart_df(chart)
+    # Spaltennamen internieren: jeder Frame/Row-Dict teilt dieselben str-Objekte
+    df.columns = [sys.intern(c) if isinstance(c, str) else c for c in df.columns]
+    if VALUE_DTYPE == "float32":
+        for c in ("Open", "High", "Low", "Close", "Volume"):
+            if c in df.columns and pd.api.types.is_float_dtype(df[c]):
+                df[c] = df[c].astype("float32")
+    with _local_chart_lock:
+        _local_df_cache[id(chart)] = (chart, df)
+    return df.copy()
+
+
+_LOOKBACK_MARGIN = 5
+
+
+def _base_lookback(base: Any, bp: Dict[str, Any]) -> Optional[int]:
+    """Bars, die ein Base-Indikator vor dem ersten gültigen Wert braucht (None = unbekannt)."""
+    b = str(base or "").strip().lower()
+    if b in ("", "price", "close", "open", "high", "low", "volume", "value"):
+        return 0
+    if b == "rsi":
+        return int(bp.get("length", bp.get("period", 14))) + 1
+    if b == "macd":
+        return int(bp.get("slow", 26)) + int(bp.get("signal", 9))
+    return None
+
+
+def _lookback_for(lname: str, shaped_params: Dict[str, Any]) -> Optional[int]:
+    """
+    Benötigte Vorlauf-Bars für einen lokalen Custom.
+    None = unbekannt → volle Historie (z.B. change mit timestamp).
+    """
+    try:
+        sp = shaped_params or {}
+        if lname in ("price", "value"):
+            return 0
+        bp = dict(sp.get("base_params") or {})
+        bp.update(sp.get("unspecified") or {})
+        base_lb = _base_lookback(sp.get("base"), bp)
+        if base_lb is None:
+            return None
+        if lname == "slope":
+            return int(sp.get("window") or 1) + base_lb
+        if lname == "change":
+            if sp.get("timestamp"):
+                return None
+            return int(bp.get("length", 1)) + base_lb
+    except Exception:
+        return None
+    return None
+
+
 def _local_compute_custom(
     name: str,
     symbol: str,
@@ -579,21 +942,40 @@ def _local_compute_custom(
     if DEBUG:
         print(f"[PROXY][IND][{req_id}] /custom LOCAL DISPATCH name={lname} shaped={shaped_params}")
 
+    # Key VOR der base_params-Injection bilden (die mutiert shaped_params)
+    ckey = _local_compute_key(lname, symbol, chart_interval, indicator_interval, shaped_params, count)
+    if ckey is not None:
+        with _local_chart_lock:
+            hit = _local_compute_cache.get(ckey)
+        if hit is not None:
+            if DEBUG:
+                print(f"[PROXY][IND][{req_id}] /custom LOCAL compute cache-hit name={lname} symbol={symbol}")
+            # flache Kopie: Aufrufer hängen eigene Keys an (name/output/...)
+            return dict(hit)
+
     # 1) Chart holen (für alle, inkl. value; bei value gibt es optionalen Synthetic-Fallback)
     # Heuristik: wenn der Client nur 5 will, brauchst du für price/value nicht mehr.
     # Für echte Indikatoren ggf. später Lookback hochziehen (z.B. 200).
-    chart = _get_chart_cached_local(symbol, chart_interval, req_id, count=count)
+    # Gebundenes Fenster: count + Lookback + Marge statt nur count bzw. voller Historie.
+    lookback = _lookback_for(lname, shaped_params)
+    needed_bars: Optional[int] = None
+    if count is not None and lookback is not None:
+        needed_bars = _cap_count(int(count) + lookback + _LOOKBACK_MARGIN)
+    chart = _get_chart_cached_local(symbol, chart_interval, req_id, count=needed_bars or count)
 
 
 
     # 2) Einheitlich via Utils normalisieren
     try:
-        df = normalize_chart_df(chart)
+        df = _chart_df_local(chart, req_id)
     except Exception as e:
         raise HTTPException(status_code=424, detail={"error": "chart_normalize_failed", "reason": str(e)})
 
+    if needed_bars is not None and len(df) > needed_bars:
+        df = df.tail(needed_bars)
+
     if DEBUG:
-        print(f"[PROXY][IND][{req_id}] /custom LOCAL df.shape={df.shape} cols={list(df.columns)[:12]}")
+        print(f"[PROXY][IND][{req_id}] /custom LOCAL df.shape={df.shape} cols={list(df.columns)[:12]} lookback={lookback}")
 
     # 3) Dispatch (dynamisch über Registry)
     try:
@@ -661,6 +1043,10 @@ def _local_compute_custom(
     }
     if DEBUG:
         print(f"[PROXY][IND][{req_id}] /custom LOCAL OUT rows={out['count']} columns={out['columns']}")
+    if ckey is not None:
+        with _local_chart_lock:
+            _local_compute_cache[ckey] = out
+        return dict(out)
     return out
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -766,6 +1152,39 @@ def indicator(
 ):
 
     req_id = _new_req_id(request.headers.get("X-Request-ID"))
+    out = _indicator_core(
+        req_id=req_id,
+        name=name,
+        symbol=symbol,
+        chart_interval=chart_interval,
+        indicator_interval=indicator_interval,
+        params=params,
+        count=count,
+        exchange=exchange,
+        output=output,
+        mode=mode,
+        as_of=as_of,
+    )
+    if msgpack is not None and "application/msgpack" in (request.headers.get("accept") or ""):
+        return Response(content=msgpack.packb(out, default=str, use_bin_type=True), media_type="application/msgpack")
+    return out
+
+
+def _indicator_core(
+    *,
+    req_id: str,
+    name: str,
+    symbol: str,
+    chart_interval: str,
+    indicator_interval: str,
+    params: str,
+    count: Optional[int] = None,
+    exchange: Optional[str] = None,
+    output: Optional[str] = None,
+    mode: Optional[str] = None,
+    as_of: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Shared body of GET /indicator and POST /indicator/batch."""
     capped_count = _cap_count(count)
 
     lname = (name or "").strip().lower()
@@ -857,11 +1276,69 @@ def indicator(
     if as_of:
         query["as_of"] = as_of
 
-    out = _get_upstream("/indicator", params=query, req_id=req_id, timeout=TO_INDICATOR)
+    out = _get_upstream_fast("/indicator", params=query, req_id=req_id, timeout=TO_INDICATOR)
     _dbg_out_preview("/indicator", out, req_id=req_id)
     return out
 
 
+@router.post("/indicator/batch")
+def indicator_batch(request: Request, body: Dict[str, Any] = Body(...)):
+    """
+    Many /indicator calls in one round trip.
+
+    body:    {"items": [{"id": "...", "name", "symbol", "chart_interval", "indicator_interval",
+                         "params", "count", "exchange", "output", "mode", "as_of"}, ...]}
+    returns: {"results": {id: <same payload as GET /indicator | {"ok": false, "error": ...}>}}
+    """
+    req_id = _new_req_id(request.headers.get("X-Request-ID"))
+    items = body.get("items") if isinstance(body, dict) else None
+    if not isinstance(items, list):
+        raise HTTPException(status_code=422, detail="body.items must be a list")
+    if len(items) > BATCH_MAX_ITEMS:
+        raise HTTPException(status_code=413, detail=f"too many items ({len(items)} > {BATCH_MAX_ITEMS})")
+
+    if DEBUG:
+        print(f"[PROXY][IN ][{req_id}] /indicator/batch items={len(items)}")
+
+    def _one(pos_item: Tuple[int, Any]) -> Tuple[str, Dict[str, Any]]:
+        pos, it = pos_item
+        if not isinstance(it, dict):
+            return str(pos), {"ok": False, "error": "invalid_item"}
+        item_id = str(it.get("id", pos))
+        sub_id = f"{req_id}.{item_id}"
+        params = it.get("params", "{}")
+        if isinstance(params, dict):
+            params = _sj(params)
+        try:
+            out = _indicator_core(
+                req_id=sub_id,
+                name=str(it.get("name") or ""),
+                symbol=str(it.get("symbol") or ""),
+                chart_interval=str(it.get("chart_interval") or ""),
+                indicator_interval=str(it.get("indicator_interval") or it.get("chart_interval") or ""),
+                params=str(params or "{}"),
+                count=it.get("count"),
+                exchange=it.get("exchange"),
+                output=it.get("output"),
+                mode=it.get("mode"),
+                as_of=it.get("as_of"),
+            )
+        except HTTPException as e:
+            out = {"ok": False, "error": f"http_{e.status_code}", "detail": e.detail}
+        except Exception as e:
+            out = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+        return item_id, out
+
+    results: Dict[str, Any] = {}
+    for item_id, out in _BATCH_POOL.map(_one, enumerate(items)):
+        results[item_id] = out
+
+    if DEBUG:
+        n_err = sum(1 for v in results.values() if isinstance(v, dict) and v.get("ok") is False)
+        print(f"[PROXY][OUT][{req_id}] /indicator/batch items={len(results)} errors={n_err}")
+    return {"results": results}
+
+
 @router.get("/signal")
 def signal(
     request: Request,
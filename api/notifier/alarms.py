@@ -7,6 +7,7 @@ import logging
 import unicodedata
 import uuid
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 from pathlib import Path
 
@@ -39,7 +40,16 @@ def _parse_ts(s: str) -> Optional[float]:
     """
     if not s:
         return None
-    x = str(s).strip()
+    return _parse_ts_str(str(s))
+
+
+@lru_cache(maxsize=4096)
+def _parse_ts_str(s: str) -> Optional[float]:
+    # pur -> pro String gecacht (Listen-Filter parsen dieselben ts bei jedem Request)
+    x = s.strip()
+    # billiger Prefix-Check: alles ohne "YYYY" am Anfang kann fromisoformat eh nicht
+    if not x[:4].isdigit():
+        return None
     x = x.replace("T", " ").replace("z", "Z")
     if x.endswith("Z"):
         x = x[:-1]
@@ -54,6 +64,21 @@ def _parse_ts(s: str) -> Optional[float]:
         return None
 
 
+def _is_canon_ts(x: Any) -> bool:
+    """
+    True für das _now_iso()-Format "YYYY-mm-dd HH:MM:SS.ffffffZ" (feste Breite, alles
+    zero-padded) -> lexikografischer Vergleich == zeitlicher Vergleich, kein Parsen nötig.
+    """
+    return type(x) is str and len(x) == 27 and x[10] == " " and x[19] == "." and x[26] == "Z"
+
+
+def _canon_ts_bound(raw: str, ts_unix: float) -> str:
+    """Vergleichsgrenze im kanonischen Format (raw selbst, wenn schon kanonisch)."""
+    if _is_canon_ts(raw):
+        return raw
+    return datetime.fromtimestamp(ts_unix, timezone.utc).strftime("%Y-%m-%d %H:%M:%S.%fZ")
+
+
 def _norm_symbol(s: str) -> str:
     """
     Normiert Symbole (Ticker) konsistent:
@@ -63,8 +88,10 @@ def _norm_symbol(s: str) -> str:
     """
     if not isinstance(s, str):
         return ""
-    s = unicodedata.normalize("NFKC", s).strip()
-    return s.upper()
+    # NFKC ist auf reinem ASCII die Identität -> normalize() überspringen
+    if not s.isascii():
+        s = unicodedata.normalize("NFKC", s)
+    return s.strip().upper()
 
 
 # ─────────────────────────────────────────────────────────────
@@ -281,6 +308,9 @@ def add_alarm_entry(alarm_payload: Dict[str, Any]) -> str:
 
     def _transform(current: list):
         items = [x for x in (current or []) if isinstance(x, dict)]
+        # Dedupe per ID: wiederholtes Feuern (Retry) mit derselben ID hängt nichts an
+        if any(str(x.get("id") or "").strip() == aid for x in items):
+            return items, {"status": "exists", "id": aid, "count": len(items)}
         items.append(payload)
         result = {"status": "added", "id": aid, "count": len(items)}
         return items, result
@@ -334,29 +364,30 @@ def search_alarms(
     Filtert in-memory eine Alarm-Liste nach Symbol, Gruppe, Profil und Zeit.
     Gibt die geslicete Liste (offset/limit) zurück.
     """
-    filtered = list(items or [])
-
-    if symbol:
-        s = _norm_symbol(symbol)
-        filtered = [a for a in filtered if _norm_symbol(a.get("symbol", "")) == s]
-
-    if group_id:
-        g = str(group_id).strip()
-        filtered = [a for a in filtered if str(a.get("group_id", "")).strip() == g]
-
-    if profile_id:
-        p = str(profile_id).strip()
-        filtered = [a for a in filtered if str(a.get("profile_id", "")).strip() == p]
-
-    if since:
-        ts_min = _parse_ts(str(since))
+    # Filter einmal vorbereiten, dann EIN Durchlauf (keine Zwischenlisten pro Filter)
+    s = _norm_symbol(symbol) if symbol else None
+    g = str(group_id).strip() if group_id else None
+    p = str(profile_id).strip() if profile_id else None
+    ts_min = _parse_ts(str(since)) if since else None
+    ts_min_s = _canon_ts_bound(str(since), ts_min) if ts_min is not None else None
+
+    def _match(a: dict) -> bool:
+        if g is not None and str(a.get("group_id", "")).strip() != g:
+            return False
+        if p is not None and str(a.get("profile_id", "")).strip() != p:
+            return False
+        if s is not None and _norm_symbol(a.get("symbol", "")) != s:
+            return False
         if ts_min is not None:
-            tmp: List[dict] = []
-            for a in filtered:
-                ts = _parse_ts(str(a.get("ts", "")))
-                if ts is not None and ts >= ts_min:
-                    tmp.append(a)
-            filtered = tmp
+            raw = a.get("ts", "")
+            if _is_canon_ts(raw):
+                return raw >= ts_min_s
+            ts = _parse_ts(str(raw))
+            if ts is None or ts < ts_min:
+                return False
+        return True
+
+    filtered = [a for a in (items or []) if _match(a)]
 
     log.info(
         "Alarms search result_count=%d limit=%d offset=%d",
@@ -406,10 +437,17 @@ def delete_alarms_older_than(items: List[dict], older_than: str) -> List[dict]:
             pass
         return items
 
+    ts_min_s = _canon_ts_bound(str(older_than), ts_min)
     before = len(items or [])
     keep: List[dict] = []
     for a in (items or []):
-        ts = _parse_ts(str((a or {}).get("ts", "")))
+        raw = (a or {}).get("ts", "")
+        if _is_canon_ts(raw):
+            # von uns geschriebene ts: String-Vergleich statt fromisoformat pro Item
+            if raw >= ts_min_s:
+                keep.append(a)
+            continue
+        ts = _parse_ts(str(raw))
         if ts is None or ts >= ts_min:
             keep.append(a)
 
@@ -5,7 +5,7 @@ from __future__ import annotations
 import logging
 from copy import deepcopy
 from datetime import datetime, timezone
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 import uuid  # für eindeutige Command-IDs
 
 from config import OVERRIDES_NOTIFIER, COMMANDS_NOTIFIER
@@ -26,18 +26,20 @@ def _now_iso() -> str:
     return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S.%fZ")
 
 
-def _atomic_update_json_dict(path: str, transform, default: Dict[str, Any]) -> Dict[str, Any]:
+def _atomic_update_json_dict(path: str, transform, default: Dict[str, Any], copy=deepcopy) -> Dict[str, Any]:
     """
     Atomic-ish update for JSON dict files.
 
-    Reads dict (or uses default), applies transform(d) -> (new_dict, outcome),
+    Reads dict (or uses default), applies transform(copy(d)) -> (new_dict, outcome),
     then writes via save_json_any.
+    copy: how the loaded doc is protected from the transform (default deepcopy);
+    append-only transforms can pass a cheaper copy.
 
     NOTE:
     - This keeps the on-disk format stable: always a DICT (not a list-wrapper).
     - True atomicity depends on save_json_any implementation.
     """
-    cur = load_json_any(path, deepcopy(default))
+    cur = load_json_any(path, default)
     if not isinstance(cur, dict):
         log.warning(
             "[CTRL] atomic_update_json_dict: file is not dict (%s) -> reset default",
@@ -46,7 +48,7 @@ def _atomic_update_json_dict(path: str, transform, default: Dict[str, Any]) -> D
         cur = deepcopy(default)
 
     try:
-        new_doc, outcome = transform(deepcopy(cur))
+        new_doc, outcome = transform(copy(cur))
     except Exception as e:
         log.exception("[CTRL] atomic_update_json_dict transform failed: %s", e)
         try:
@@ -58,6 +60,14 @@ def _atomic_update_json_dict(path: str, transform, default: Dict[str, Any]) -> D
     if not isinstance(new_doc, dict):
         raise ValueError("atomic_update_json_dict: transform must return a dict as new_doc")
 
+    if new_doc == cur:
+        # nichts geändert -> kein Re-Serialisieren/Rewrite der Datei
+        try:
+            print(f"[CTRL] atomic_update_json_dict unchanged path={path} -> skip write")
+        except Exception:
+            pass
+        return outcome
+
     save_json_any(path, new_doc)
 
     try:
@@ -77,7 +87,7 @@ def load_overrides() -> Dict[str, Any]:
     Lädt das Overrides-JSON aus OVERRIDES_NOTIFIER.
     Stellt sicher, dass die Struktur mindestens {"overrides": {}} ist.
     """
-    d = load_json_any(OVERRIDES_NOTIFIER, deepcopy(_OVR_TEMPLATE))
+    d = load_json_any(OVERRIDES_NOTIFIER, _OVR_TEMPLATE)
     if not isinstance(d, dict) or "overrides" not in d:
         log.warning(
             "load_overrides: invalid structure (%s) → using template",
@@ -139,29 +149,30 @@ def ensure_override_slot(
         "note": str|None,
       }
     """
-    ovr.setdefault("overrides", {})
-    if not isinstance(ovr.get("overrides"), dict):
-        ovr["overrides"] = {}
+    # eine Lookup-Kette mit lokalen Referenzen statt wiederholter
+    # setdefault/get/index-Zugriffe auf ovr["overrides"][pid][gid]
+    by_pid = ovr.get("overrides")
+    if not isinstance(by_pid, dict):
+        by_pid = ovr["overrides"] = {}
 
-    ovr["overrides"].setdefault(profile_id, {})
-    if not isinstance(ovr["overrides"].get(profile_id), dict):
-        ovr["overrides"][profile_id] = {}
+    by_gid = by_pid.get(profile_id)
+    if not isinstance(by_gid, dict):
+        by_gid = by_pid[profile_id] = {}
 
-    ovr["overrides"][profile_id].setdefault(
-        group_id,
-        {"forced_off": False, "snooze_until": None, "note": None},
-    )
+    slot = by_gid.get(group_id)
+    if slot is None:
+        slot = by_gid[group_id] = {"forced_off": False, "snooze_until": None, "note": None}
 
     try:
         print(
             f"[OVR] ensure-slot pid={profile_id} gid={group_id} "
-            f"forced_off={ovr['overrides'][profile_id][group_id]['forced_off']} "
-            f"snooze_until={ovr['overrides'][profile_id][group_id]['snooze_until']}"
+            f"forced_off={slot['forced_off']} "
+            f"snooze_until={slot['snooze_until']}"
         )
     except Exception:
         pass
 
-    return ovr["overrides"][profile_id][group_id]
+    return slot
 
 
 # ─────────────────────────────────────────────────────────────
@@ -173,7 +184,7 @@ def load_commands() -> Dict[str, Any]:
     Lädt die Command-Queue aus COMMANDS_NOTIFIER.
     Struktur: {"queue": [ ... ]}
     """
-    d = load_json_any(COMMANDS_NOTIFIER, deepcopy(_CMD_TEMPLATE))
+    d = load_json_any(COMMANDS_NOTIFIER, _CMD_TEMPLATE)
     if not isinstance(d, dict) or "queue" not in d:
         log.warning(
             "load_commands: invalid structure (%s) → using template",
@@ -213,6 +224,62 @@ def save_commands(d: Dict[str, Any]) -> None:
         pass
 
 
+def _make_command_item(
+    profile_id: str,
+    group_id: str,
+    rearm: bool,
+    rebaseline: bool,
+    ts: Optional[str] = None,
+) -> Dict[str, Any]:
+    """ts: vorberechneter Zeitstempel (Batch über viele Gruppen); None → jetzt."""
+    return {
+        "id": str(uuid.uuid4()),
+        "profile_id": str(profile_id),
+        "group_id": str(group_id),
+        "rearm": bool(rearm),
+        "rebaseline": bool(rebaseline),
+        "ts": ts or _now_iso(),
+    }
+
+
+def _copy_queue_doc(doc: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Flache Kopie für Append-only-Updates: neue Queue-Liste, Items geteilt.
+    O(n) Pointer-Kopie statt deepcopy jedes Queue-Items pro Enqueue.
+    """
+    out = dict(doc)
+    q = out.get("queue")
+    out["queue"] = list(q) if isinstance(q, list) else []
+    return out
+
+
+def _enqueue_items(items: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Hängt alle items in EINEM read-modify-write an die Queue an
+    (statt einem kompletten Load/Save der Queue pro Item).
+    """
+
+    def _transform(doc: Dict[str, Any]):
+        # doc ist bereits eine Kopie (_copy_queue_doc): eigene Queue-Liste, bestehende
+        # Items werden nur gelesen/weitergereicht, nie verändert
+        doc["queue"].extend(items)
+
+        result = {
+            "status": "enqueued",
+            "ids": [it["id"] for it in items],
+            "queue_len": len(doc["queue"]),
+        }
+        return doc, result
+
+    # Dict-only update. If COMMANDS_NOTIFIER is not dict on disk, we reset to template and continue.
+    return _atomic_update_json_dict(
+        COMMANDS_NOTIFIER,
+        _transform,
+        default=deepcopy(_CMD_TEMPLATE),
+        copy=_copy_queue_doc,
+    )
+
+
 def enqueue_command(
     profile_id: str,
     group_id: str,
@@ -229,14 +296,7 @@ def enqueue_command(
       - rearm      → Gruppe neu scharf stellen
       - rebaseline → History/threshold_state neu setzen
     """
-    item = {
-        "id": str(uuid.uuid4()),
-        "profile_id": str(profile_id),
-        "group_id": str(group_id),
-        "rearm": bool(rearm),
-        "rebaseline": bool(rebaseline),
-        "ts": _now_iso(),
-    }
+    item = _make_command_item(profile_id, group_id, rearm, rebaseline)
 
     try:
         print(
@@ -246,27 +306,7 @@ def enqueue_command(
     except Exception:
         pass
 
-    def _transform(doc: Dict[str, Any]):
-        doc = deepcopy(doc)
-        doc.setdefault("queue", [])
-        if not isinstance(doc.get("queue"), list):
-            doc["queue"] = []
-
-        doc["queue"].append(item)
-
-        result = {
-            "status": "enqueued",
-            "id": item["id"],
-            "queue_len": len(doc["queue"]),
-        }
-        return doc, result
-
-    # Dict-only update. If COMMANDS_NOTIFIER is not dict on disk, we reset to template and continue.
-    outcome = _atomic_update_json_dict(
-        COMMANDS_NOTIFIER,
-        _transform,
-        default=deepcopy(_CMD_TEMPLATE),
-    )
+    outcome = _enqueue_items([item])
 
     log.info(
         "Command enqueued id=%s pid=%s gid=%s rearm=%s rebaseline=%s queue_len=%s",
@@ -332,7 +372,9 @@ def run_activation_routine(
 
     ovr = load_overrides()
     changed = 0
-    enq = 0
+    pending: List[Dict[str, Any]] = []
+    # ein Zeitstempel für die ganze Aktivierung (statt strftime pro Gruppe)
+    now_iso = _now_iso()
 
     try:
         print(f"[ACTIVATE] start pid={pid} groups_in={len(groups)} rebaseline={rebaseline}")
@@ -360,12 +402,20 @@ def run_activation_routine(
         slot["snooze_until"] = None
         changed += 1
 
-        enqueue_command(pid, gid, rearm=True, rebaseline=rebaseline)
-        enq += 1
+        pending.append(_make_command_item(pid, gid, rearm=True, rebaseline=rebaseline, ts=now_iso))
 
     if changed > 0:
         save_overrides(ovr)
 
+    # Alle Commands gesammelt in einem Queue-Write statt einem pro Gruppe
+    enq = len(pending)
+    if pending:
+        outcome = _enqueue_items(pending)
+        try:
+            print(f"[ACTIVATE] enqueued n={enq} queue_len={outcome.get('queue_len')}")
+        except Exception:
+            pass
+
     log.info(
         "Activation routine pid=%s groups_changed=%d enqueued=%d rebaseline=%s",
         pid,
@@ -7,7 +7,6 @@ import logging
 import uuid
 import hashlib
 
-from copy import deepcopy
 from pathlib import Path
 from typing import Any, Dict, List, Literal, Optional
 
@@ -349,7 +348,8 @@ def create_profile(profile: dict) -> dict:
     Create a new profile. If incoming profile has no id, we create one.
     Must be NEW schema.
     """
-    incoming = deepcopy(profile or {})
+    # shallow: only the top-level "id" is touched; Profile(**...) + model_dump build fresh objects
+    incoming = dict(profile or {})
     if not str(incoming.get("id") or "").strip():
         incoming["id"] = str(uuid.uuid4())
 
@@ -382,7 +382,7 @@ def update_profile_by_id(profile_id: str, profile: dict) -> dict:
     if not pid:
         raise ValueError("update_profile_by_id: profile_id darf nicht leer sein")
 
-    incoming = deepcopy(profile or {})
+    incoming = dict(profile or {})
     body_id = str(incoming.get("id") or "").strip()
     if not body_id:
         raise ValueError("update_profile_by_id: body.id darf nicht leer sein")
@@ -422,7 +422,7 @@ def add_or_update_profile_by_name(profile: dict) -> dict:
     Upsert by name: if name exists, replace profile content (keeping the existing id).
     No merging, no normalization.
     """
-    incoming = deepcopy(profile or {})
+    incoming = dict(profile or {})
     name = str(incoming.get("name") or "").strip()
     if not name:
         raise ValueError("Profile braucht ein 'name'-Feld.")
@@ -441,7 +441,7 @@ def add_or_update_profile_by_name(profile: dict) -> dict:
                 existing_id = str(p.get("id") or "").strip() or None
                 break
 
-        inc = deepcopy(incoming)
+        inc = dict(incoming)  # only 'id' is overwritten below
         if existing_id:
             inc["id"] = existing_id
         else:
@@ -464,6 +464,8 @@ def add_or_update_profile_by_name(profile: dict) -> dict:
     _dbg(f"[PROFILES] add_or_update_profile_by_name outcome={outcome}")
     return outcome
 
+_FP_ENCODE = json.JSONEncoder(ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode
+
 def profiles_fingerprint(items: list[dict]) -> str:
     """
     Stable fingerprint of the profiles list.
@@ -479,10 +481,12 @@ def profiles_fingerprint(items: list[dict]) -> str:
     # stable order
     safe_items.sort(key=lambda x: str(x.get("id") or ""))
 
-    payload = json.dumps(
-        safe_items,
-        ensure_ascii=False,
-        sort_keys=True,
-        separators=(",", ":"),
-    )
-    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    # streamed per profile: same bytes as json.dumps(safe_items, ...) (identical digest),
+    # but no giant intermediate string; peak memory = one serialized profile
+    h = hashlib.sha256(b"[")
+    for i, p in enumerate(safe_items):
+        if i:
+            h.update(b",")
+        h.update(_FP_ENCODE(p).encode("utf-8"))
+    h.update(b"]")
+    return h.hexdigest()
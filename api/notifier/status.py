@@ -160,20 +160,66 @@ def save_status_any(data: Dict[str, Any]) -> None:
     Speichert einen Status-Snapshot nach STATUS_NOTIFIER.
     updated_ts/version/flavor werden stabilisiert.
     """
-    data = deepcopy(data)
+    # flache Kopie reicht: nur Top-Level-Felder werden gesetzt, der (große)
+    # profiles-Baum wird nur serialisiert, nie verändert
+    data = dict(data)
     data["updated_ts"] = _now_iso()
     try:
         data["version"] = int(data.get("version", 1))
     except Exception:
         data["version"] = 1
     data.setdefault("flavor", "notifier-api")
-    save_json_any(STATUS_NOTIFIER, data)
+    # nur Maschinen lesen den Status-Snapshot -> kompakt
+    save_json_any(STATUS_NOTIFIER, data, pretty=False)
 
 
 # ─────────────────────────────────────────────────────────────
 # Skeleton aus Profilen (NEW SCHEMA)
 # ─────────────────────────────────────────────────────────────
 
+def _skeleton_group_from_def(g: Dict[str, Any], gid: str) -> Dict[str, Any]:
+    """
+    Frischer Status-Eintrag für eine Gruppen-Definition (NEW SCHEMA).
+    active/conditions werden genau einmal gelesen.
+    """
+    # NEW schema group fields (keep as-is)
+    group_active = bool(g.get("active", True))
+    conds = g.get("conditions") or []
+
+    return {
+        "name": g.get("name") or gid,
+        "group_active": group_active,
+        "effective_active": group_active,
+        "blockers": [],
+        "auto_disabled": False,
+        "cooldown_until": None,
+        "fresh": True,
+        "runtime": {
+            "threshold_state": {},  # evaluator füllt das später
+            "met": 0,
+            "total": len(conds),
+            "details": [],
+        },
+        "last_eval_ts": None,
+        "last_bar_ts": None,
+
+        # Declarative labels for UI
+        "conditions": _label_only_conditions(g),
+        "conditions_status": [],
+
+        # Sichtbar für UI (NEU): symbol sources bleiben getrennt
+        "symbol_group": g.get("symbol_group"),
+        "symbols": g.get("symbols"),
+
+        # Group settings
+        "exchange": g.get("exchange", ""),
+        "interval": g.get("interval", ""),
+        "telegram_id": g.get("telegram_id"),
+        "single_mode": g.get("single_mode"),
+        "deactivate_on": g.get("deactivate_on"),
+    }
+
+
 def build_status_skeleton_from_profiles(profiles: list[dict], debug_print: bool = True) -> Dict[str, Any]:
     """
     Baut aus einer Profil-Liste ein "leeres" Status-Skeleton (NEW SCHEMA):
@@ -217,49 +263,15 @@ def build_status_skeleton_from_profiles(profiles: list[dict], debug_print: bool
             if not gid:
                 continue
 
-            # NEW schema group fields (keep as-is)
-            group_active = bool(g.get("active", True))
-
-            g_entry = {
-                "name": g.get("name") or gid,
-                "group_active": group_active,
-                "effective_active": group_active,
-                "blockers": [],
-                "auto_disabled": False,
-                "cooldown_until": None,
-                "fresh": True,
-                "runtime": {
-                    "threshold_state": {},  # evaluator füllt das später
-                    "met": 0,
-                    "total": len(g.get("conditions") or []),
-                    "details": [],
-                },
-                "last_eval_ts": None,
-                "last_bar_ts": None,
-
-                # Declarative labels for UI
-                "conditions": _label_only_conditions(g),
-                "conditions_status": [],
-
-                # Sichtbar für UI (NEU): symbol sources bleiben getrennt
-                "symbol_group": g.get("symbol_group", None),
-                "symbols": g.get("symbols", None),
-
-                # Group settings
-                "exchange": g.get("exchange", ""),
-                "interval": g.get("interval", ""),
-                "telegram_id": g.get("telegram_id", None),
-                "single_mode": g.get("single_mode", None),
-                "deactivate_on": g.get("deactivate_on", None),
-            }
+            g_entry = _skeleton_group_from_def(g, gid)
 
             if debug_print:
                 try:
                     print(
                         f"[STATUS] skeleton: pid={pid} gid={gid} "
-                        f"active={group_active} interval={g_entry.get('interval')!r} "
+                        f"active={g_entry['group_active']} interval={g_entry.get('interval')!r} "
                         f"symbol_group={g_entry.get('symbol_group')!r} symbols={g_entry.get('symbols')!r} "
-                        f"conds={len(g.get('conditions') or [])}"
+                        f"conds={g_entry['runtime']['total']}"
                     )
                 except Exception:
                     pass
@@ -280,11 +292,13 @@ def build_status_skeleton_from_profiles(profiles: list[dict], debug_print: bool
         "profiles": profiles_map,
     }
 
+    groups_total = sum(len(v.get("groups", {})) for v in profiles_map.values())
+
     if debug_print:
         try:
             print(
                 f"[STATUS] skeleton built profiles={len(profiles_map)} "
-                f"groups={sum(len(v.get('groups', {})) for v in profiles_map.values())}"
+                f"groups={groups_total}"
             )
         except Exception:
             pass
@@ -292,12 +306,31 @@ def build_status_skeleton_from_profiles(profiles: list[dict], debug_print: bool
     log.debug(
         "skeleton built profiles=%d groups=%d",
         len(profiles_map),
-        sum(len(v.get("groups", {})) for v in profiles_map.values()),
+        groups_total,
     )
 
     return skeleton
 
 
+def _profile_group_ids(profiles: list[dict]):
+    """(pid, gid)-Paare genau wie build_status_skeleton_from_profiles sie anlegt, ohne Skeleton."""
+    for p in (profiles or []):
+        if not isinstance(p, dict):
+            continue
+        pid = _safe_strip(p.get("id"))
+        if not pid:
+            continue
+        groups_in = p.get("groups") or []
+        if not isinstance(groups_in, list):
+            continue
+        for g in groups_in:
+            if not isinstance(g, dict):
+                continue
+            gid = _safe_strip(g.get("gid"))
+            if gid:
+                yield pid, gid
+
+
 # ─────────────────────────────────────────────────────────────
 # Merge: Skeleton + alter Status (Runtime behalten)
 # ─────────────────────────────────────────────────────────────
@@ -308,8 +341,12 @@ def merge_status_keep_runtime(old: Dict[str, Any], skel: Dict[str, Any]) -> Dict
     - neue/gelöschte Profile/Groups werden berücksichtigt
     - Runtime-Daten (threshold_state, conditions_status, etc.) werden bestmöglich behalten
     """
-    old_profiles = old.get("profiles") if isinstance(old.get("profiles"), dict) else {}
-    skel_profiles = skel.get("profiles") if isinstance(skel.get("profiles"), dict) else {}
+    old_profiles = old.get("profiles")
+    if not isinstance(old_profiles, dict):
+        old_profiles = {}
+    skel_profiles = skel.get("profiles")
+    if not isinstance(skel_profiles, dict):
+        skel_profiles = {}
 
     try:
         version_int = int(old.get("version", 1))
@@ -321,6 +358,7 @@ def merge_status_keep_runtime(old: Dict[str, Any], skel: Dict[str, Any]) -> Dict
         "flavor": "notifier-api",
         "profiles": {},
     }
+    gone_by_pid: List[tuple] = []
 
     for pid, p_s in (skel_profiles or {}).items():
         old_p = old_profiles.get(pid) or {}
@@ -331,16 +369,33 @@ def merge_status_keep_runtime(old: Dict[str, Any], skel: Dict[str, Any]) -> Dict
             "groups": {},
         }
 
-        old_groups = old_p.get("groups") if isinstance(old_p.get("groups"), dict) else {}
-        skel_groups = p_s.get("groups") if isinstance(p_s.get("groups"), dict) else {}
+        old_groups = old_p.get("groups")
+        if not isinstance(old_groups, dict):
+            old_groups = {}
+        skel_groups = p_s.get("groups")
+        if not isinstance(skel_groups, dict):
+            skel_groups = {}
+        new_groups = new_p["groups"]
+
+        # gelöschte Gruppen dieses Profils: Key-View-Differenz direkt hier
+        # (statt zweitem Durchlauf über alle gemeinsamen pids mit set()-Aufbau)
+        if pid in old_profiles:
+            gone = old_groups.keys() - skel_groups.keys()
+            if gone:
+                gone_by_pid.append((pid, sorted(gone)))
 
         for gid, g_s in (skel_groups or {}).items():
             old_g = old_groups.get(gid) or {}
 
-            rt_old = old_g.get("runtime") if isinstance(old_g.get("runtime"), dict) else {}
+            rt_old = old_g.get("runtime")
+            if not isinstance(rt_old, dict):
+                rt_old = {}
             cond_status_old = old_g.get("conditions_status", [])
             if not isinstance(cond_status_old, list):
                 cond_status_old = []
+            blockers_old = old_g.get("blockers", [])
+            if not isinstance(blockers_old, list):
+                blockers_old = []
 
             new_g = dict(g_s)
             # runtime behalten
@@ -348,42 +403,28 @@ def merge_status_keep_runtime(old: Dict[str, Any], skel: Dict[str, Any]) -> Dict
             new_g["conditions_status"] = cond_status_old
 
             # timestamps behalten
-            new_g["last_eval_ts"] = old_g.get("last_eval_ts", None)
-            new_g["last_bar_ts"] = old_g.get("last_bar_ts", None)
+            new_g["last_eval_ts"] = old_g.get("last_eval_ts")
+            new_g["last_bar_ts"] = old_g.get("last_bar_ts")
 
             # blockers/cooldown/fresh behalten
-            new_g["blockers"] = old_g.get("blockers", []) if isinstance(old_g.get("blockers"), list) else []
+            new_g["blockers"] = blockers_old
             new_g["auto_disabled"] = bool(old_g.get("auto_disabled", False))
-            new_g["cooldown_until"] = old_g.get("cooldown_until", None)
+            new_g["cooldown_until"] = old_g.get("cooldown_until")
             new_g["fresh"] = bool(old_g.get("fresh", True))
 
-            new_p["groups"][gid] = new_g
+            new_groups[gid] = new_g
 
         new_out["profiles"][pid] = new_p
 
     # Diagnostics
-    old_pids = set(old_profiles.keys())
-    new_pids = set(new_out["profiles"].keys())
-    pruned_pids = sorted(list(old_pids - new_pids))
+    pruned_pids = sorted(old_profiles.keys() - new_out["profiles"].keys())
 
     pruned_groups_total = 0
     details_groups: List[str] = []
-    for pid in sorted(list(old_pids & new_pids)):
-        old_gids = (
-            set((old_profiles.get(pid, {}) or {}).get("groups", {}).keys())
-            if isinstance((old_profiles.get(pid, {}) or {}).get("groups"), dict)
-            else set()
-        )
-        new_gids = (
-            set((new_out["profiles"].get(pid, {}) or {}).get("groups", {}).keys())
-            if isinstance((new_out["profiles"].get(pid, {}) or {}).get("groups"), dict)
-            else set()
-        )
-        gone = sorted(list(old_gids - new_gids))
-        if gone:
-            pruned_groups_total += len(gone)
-            preview = ", ".join(gone[:5]) + ("..." if len(gone) > 5 else "")
-            details_groups.append(f"{pid}: {preview}")
+    for pid, gone in sorted(gone_by_pid):
+        pruned_groups_total += len(gone)
+        preview = ", ".join(gone[:5]) + ("..." if len(gone) > 5 else "")
+        details_groups.append(f"{pid}: {preview}")
 
     log.info(
         "Status merged (pruned). profiles=%d pruned_profiles=%d pruned_groups=%d",
@@ -437,12 +478,10 @@ def status_autofix_merge() -> None:
     merged = merge_status_keep_runtime(current, skeleton)
     merged["profiles_fp"] = profiles_fingerprint(profiles)
     save_status_any(merged)
-    log.info(
-        "Status auto-fix merge done. profiles_fp=%s",
-        (merged.get("profiles_fp", "") or "")[:8],
-    )
+    short_fp = (merged.get("profiles_fp", "") or "")[:8]
+    log.info("Status auto-fix merge done. profiles_fp=%s", short_fp)
     try:
-        print(f"[STATUS] autofix done fp={(merged.get('profiles_fp', '') or '')[:8]}")
+        print(f"[STATUS] autofix done fp={short_fp}")
     except Exception:
         pass
 
@@ -488,7 +527,6 @@ def get_status_snapshot(force_fix: bool = False) -> Dict[str, Any]:
         reason = "force_fix" if force_fix else ""
 
         profiles = profiles_list_profiles()
-        skeleton = build_status_skeleton_from_profiles(profiles)
         fp = profiles_fingerprint(profiles)
 
         if not need_fix:
@@ -500,19 +538,18 @@ def get_status_snapshot(force_fix: bool = False) -> Dict[str, Any]:
                     need_fix = True
                     reason = reason or "fp_mismatch"
                 else:
-                    # prüfen, ob Gruppen fehlen
-                    for pid, p_s in (skeleton.get("profiles") or {}).items():
-                        sp = (snap.get("profiles") or {}).get(pid, {})
-                        s_groups = sp.get("groups") or {}
-                        for gid in (p_s.get("groups") or {}).keys():
-                            if gid not in s_groups:
-                                need_fix = True
-                                reason = reason or "missing_group"
-                                break
-                        if need_fix:
+                    # prüfen, ob Gruppen fehlen (gleiche IDs wie im Skeleton)
+                    s_profiles = snap.get("profiles") or {}
+                    for pid, gid in _profile_group_ids(profiles):
+                        sp = s_profiles.get(pid) or {}
+                        if gid not in (sp.get("groups") or {}):
+                            need_fix = True
+                            reason = reason or "missing_group"
                             break
 
         if need_fix:
+            # Skeleton nur bauen, wenn wirklich gemerged wird (Normalfall: fp passt)
+            skeleton = build_status_skeleton_from_profiles(profiles)
             merged = merge_status_keep_runtime(snap, skeleton)
             merged["profiles_fp"] = fp
             save_status_any(merged)
@@ -482,21 +482,21 @@ def resolve_symbol(db: Session, asset_id: str, source: Optional[str], exchange:
     if src and mi:
         for l in candidates:
             if _norm(l.source) == src and _norm(l.mic) == mi:
-                log.debug(f"[RESOLVE] {asset_id} -> source+mic match: {l.symbol}")
+                log.debug("[RESOLVE] %s -> source+mic match: %s", asset_id, l.symbol)
                 return {"asset_id": asset_id, "source": l.source, "exchange": l.exchange, "mic": l.mic, "symbol": l.symbol}
     if src and ex:
         for l in candidates:
             if _norm(l.source) == src and _norm(l.exchange) == ex:
-                log.debug(f"[RESOLVE] {asset_id} -> source+exchange match: {l.symbol}")
+                log.debug("[RESOLVE] %s -> source+exchange match: %s", asset_id, l.symbol)
                 return {"asset_id": asset_id, "source": l.source, "exchange": l.exchange, "mic": l.mic, "symbol": l.symbol}
     if src:
         for l in candidates:
             if _norm(l.source) == src:
-                log.debug(f"[RESOLVE] {asset_id} -> source-only match: {l.symbol}")
+                log.debug("[RESOLVE] %s -> source-only match: %s", asset_id, l.symbol)
                 return {"asset_id": asset_id, "source": l.source, "exchange": l.exchange, "mic": l.mic, "symbol": l.symbol}
     if candidates:
         l = candidates[0]
-        log.debug(f"[RESOLVE] {asset_id} -> default first listing: {l.symbol}")
+        log.debug("[RESOLVE] %s -> default first listing: %s", asset_id, l.symbol)
         return {"asset_id": asset_id, "source": l.source, "exchange": l.exchange, "mic": l.mic, "symbol": l.symbol}
 
     raise HTTPException(status_code=404, detail=f"No listings for asset: {asset_id}")
@@ -554,7 +554,7 @@ def list_assets(
         order_col = order_col.desc()
 
     items = qry.order_by(order_col).offset(offset).limit(limit).all()
-    log.debug(f"[ASSETS][LIST] n={len(items)} q={q} type={type} cat={primary_category} tag={tag} sector={sector} sectors={sectors} sources={sources} order={order_by} {order_dir} off={offset} lim={limit}")
+    log.debug("[ASSETS][LIST] n=%s q=%s type=%s cat=%s tag=%s sector=%s sectors=%s sources=%s order=%s %s off=%s lim=%s", len(items), q, type, primary_category, tag, sector, sectors, sources, order_by, order_dir, offset, limit)
     return [_asset_to_out(a) for a in items]
 
 
@@ -1112,7 +1112,7 @@ def list_groups(
             members=members_payload,
             group_tags=_compute_group_tags(members_payload),
         ))
-    log.debug(f"[GROUPS][LIST] n={len(out)} off={offset} lim={limit}")
+    log.debug("[GROUPS][LIST] n=%s off=%s lim=%s", len(out), offset, limit)
     return out
 
 
@@ -1364,7 +1364,7 @@ def list_profiles(
         ProfileOut(id=p.id, name=p.name, payload=p.payload or {}, version=p.version, created_ts=p.created_ts, updated_ts=p.updated_ts)
         for p in rows
     ]
-    log.debug(f"[PROFILES][LIST] n={len(out)} off={offset} lim={limit} q={q} group={group}")
+    log.debug("[PROFILES][LIST] n=%s off=%s lim=%s q=%s group=%s", len(out), offset, limit, q, group)
     return out
 
 @app.get("/profiles/by-group/{group_id}", response_model=List[ProfileOut])
@@ -1434,7 +1434,7 @@ def resolve_endpoint(
     db: Session = Depends(get_db),
 ):
     res = resolve_symbol(db, asset_id, source, exchange, mic)
-    log.debug(f"[RESOLVE][OUT] {res}")
+    log.debug("[RESOLVE][OUT] %s", res)
     return res
 
 @app.get("/search")
@@ -1461,7 +1461,7 @@ def search(
         "offset": offset,
         "limit": limit,
     }
-    log.debug(f"[SEARCH] q={q} -> a={len(assets)} l={len(listings)} i={len(idents)} t={len(tags)} off={offset} lim={limit}")
+    log.debug("[SEARCH] q=%s -> a=%s l=%s i=%s t=%s off=%s lim=%s", q, len(assets), len(listings), len(idents), len(tags), offset, limit)
     return out
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -1486,7 +1486,7 @@ def health():
 def meta_types(db: Session = Depends(get_db)):
     rows = db.query(distinct(Asset.type)).order_by(Asset.type).all()
     types = [r[0] for r in rows if r[0]]
-    log.debug(f"[META][TYPES] n={len(types)} -> {types}")
+    log.debug("[META][TYPES] n=%s -> %s", len(types), types)
     return types
 
 @app.get("/meta/categories", response_model=List[str])
@@ -1499,7 +1499,7 @@ def meta_categories(
         qry = qry.filter(Asset.type == type.value)
     rows = qry.order_by(Asset.primary_category).all()
     cats = [r[0] for r in rows if r[0]]
-    log.debug(f"[META][CATS] type={type} n={len(cats)} -> {cats}")
+    log.debug("[META][CATS] type=%s n=%s -> %s", type, len(cats), cats)
     return cats
 
 @app.get("/meta/tags", response_model=List[str])
@@ -1515,7 +1515,7 @@ def meta_tags(
         qry = qry.filter(Asset.primary_category == primary_category)
     rows = qry.order_by(AssetTag.tag).all()
     tags = [r[0] for r in rows if r[0]]
-    log.debug(f"[META][TAGS] type={type} cat={primary_category} n={len(tags)} -> {tags}")
+    log.debug("[META][TAGS] type=%s cat=%s n=%s -> %s", type, primary_category, len(tags), tags)
     return tags
 
 @app.get("/meta/sectors", response_model=List[str])
@@ -1537,7 +1537,7 @@ def meta_sectors(
     legacy = [r[0] for r in q_legacy.all() if r[0]]
 
     merged = sorted({*nm, *legacy}, key=lambda s: s.lower())
-    log.debug(f"[META][SECTORS] type={type} cat={primary_category} n={len(merged)}")
+    log.debug("[META][SECTORS] type=%s cat=%s n=%s", type, primary_category, len(merged))
     return merged
 
 @app.get("/meta/sources", response_model=List[str])
@@ -1555,5 +1555,5 @@ def meta_sources(
 
     rows = qry.order_by(Listing.source).all()
     sources = [r[0] for r in rows if r and r[0]]
-    log.debug(f"[META][SOURCES] type={type} cat={primary_category} n={len(sources)} -> {sources}")
+    log.debug("[META][SOURCES] type=%s cat=%s n=%s -> %s", type, primary_category, len(sources), sources)
     return sources
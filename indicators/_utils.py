@@ -1,11 +1,45 @@
 # indicators/_utils.py
 # -*- coding: utf-8 -*-
 from __future__ import annotations
-from typing import Any, Dict, Tuple
+import socket
+import threading
+from typing import Any, Dict, Optional, Tuple
 import pandas as pd
 
 DEBUG = True
 
+_SESSION: Optional[Any] = None
+_SESSION_LOCK = threading.Lock()
+
+
+def http_session() -> Any:
+    """
+    Gemeinsame requests.Session für Base-Fetches der Customs (slope/change).
+    Vorher: requests.get() pro Aufruf -> neue TCP-Verbindung je Base-Indikator.
+    Jetzt: Keep-Alive-Pool (32 Hosts x 64 Verbindungen), TCP_NODELAY gegen Nagle.
+    requests wird weiterhin erst bei Bedarf importiert.
+    """
+    global _SESSION
+    if _SESSION is not None:
+        return _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            class _NoDelayAdapter(HTTPAdapter):
+                def init_poolmanager(self, *args, **kwargs):
+                    kwargs.setdefault("socket_options", [(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)])
+                    return super().init_poolmanager(*args, **kwargs)
+
+            s = requests.Session()
+            ad = _NoDelayAdapter(pool_connections=32, pool_maxsize=64, pool_block=False)
+            s.mount("http://", ad)
+            s.mount("https://", ad)
+            s.headers.update({"Accept-Encoding": "gzip", "Connection": "keep-alive"})
+            _SESSION = s
+    return _SESSION
+
 def normalize_chart_df(raw: Any) -> pd.DataFrame:
     """
     Nimmt beliebiges Chart-JSON (dict mit rows/data/klines/candles oder list)
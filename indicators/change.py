@@ -10,6 +10,8 @@ from typing import Dict, Any, Optional, List, Tuple
 import numpy as np
 import pandas as pd
 
+from indicators._utils import http_session
+
 # ---------------------------------------------------------------------
 # Konfig
 # ---------------------------------------------------------------------
@@ -191,7 +193,6 @@ def _http_fetch_base(
 
     http_params = _sanitize_params_for_http(base_params)
     try:
-        import requests
         qs = {
             "name": base_name,
             "symbol": symbol,
@@ -201,7 +202,7 @@ def _http_fetch_base(
         }
         if DEBUG:
             print(f"[change/http] GET {PRICE_API_BASE}/indicator name={base_name} sym={symbol} chart={c_int} ind={i_int} params={qs['params']}")
-            r = requests.get(f"{PRICE_API_BASE}/indicator", params=qs, timeout=20)
+        r = http_session().get(f"{PRICE_API_BASE}/indicator", params=qs, timeout=20)
 
         if not r.ok:
             raise RuntimeError(f"[change/http] upstream status={r.status_code} body={r.text[:220]}")
@@ -1,7 +1,8 @@
 # indicators/custom_registry.py
 # -*- coding: utf-8 -*-
 from __future__ import annotations
-from typing import Dict, Any, List, Tuple
+from functools import lru_cache
+from typing import Dict, Any, FrozenSet, List, Optional, Tuple
 
 DEBUG = True
 
@@ -93,6 +94,15 @@ def _merge_unspecified(dest: Dict[str, Any], extras: Dict[str, Any]) -> Dict[str
     dest["unspecified"] = u
     return dest
 
+@lru_cache(maxsize=256)
+def _keep_keys(lname: str) -> Optional[FrozenSet[str]]:
+    """required|optional pro Custom (CUSTOMS ist statisch) -> einmal statt pro Request bauen."""
+    spec = CUSTOMS.get(lname)
+    if not spec:
+        return None
+    return frozenset(spec.get("required", [])) | frozenset(spec.get("optional", []))
+
+
 def normalize_params_for_proxy(name: str, raw: Dict[str, Any]) -> Dict[str, Any]:
     """
     Reines Shaping:
@@ -108,14 +118,10 @@ def normalize_params_for_proxy(name: str, raw: Dict[str, Any]) -> Dict[str, Any]
     if "input" not in params and "output" in params and params["output"] not in (None, ""):
         params["input"] = params.pop("output")
 
-    spec = CUSTOMS.get(lname)
-    if not spec:
+    keep = _keep_keys(lname)
+    if keep is None:
         return params
 
-    required = set(spec.get("required", []))
-    optional = set(spec.get("optional", []))
-    keep = required | optional
-
     shaped = {k: params[k] for k in params.keys() if k in keep}
     extras = {k: v for k, v in params.items() if k not in keep}
 
@@ -168,7 +174,11 @@ def get_custom_exec(name: str) -> Tuple[str, str]:
     Für lokalen Dispatcher: liefert (module, fn) zu einem Custom.
     Raise KeyError wenn unbekannt / unvollständig.
     """
-    lname = (name or "").strip().lower()
+    return _custom_exec((name or "").strip().lower())
+
+
+@lru_cache(maxsize=256)
+def _custom_exec(lname: str) -> Tuple[str, str]:
     spec = CUSTOMS[lname]  # KeyError gewollt → sauberer 404 im Proxy
     module = spec.get("module")
     fn = spec.get("fn")
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import argparse
+import gc
 import json
 import os
 import sys
@@ -14,6 +15,11 @@ from typing import Any, Dict
 import config as cfg
 from pydantic import ValidationError
 
+try:  # optional fast path; stdlib json stays the fallback
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
+
 from notifier_evaluator.context.group_expander import StaticMappingSource, TTLGroupExpander
 from notifier_evaluator.eval.engine import EngineConfig, EvaluatorEngine
 from notifier_evaluator.eval.validate import validate_profiles
@@ -50,12 +56,30 @@ def _default_history_path() -> Path:
     return Path(os.getenv("EVALUATOR_HISTORY_FILE", "") or (Path(cfg.EVALUATOR_DATA_DIR) / "evaluator_history.json"))
 
 
+def _read_json_file(path: Path) -> Any:
+    raw = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode("utf-8"))
+
+
+# path -> ((st_mtime_ns, st_size), validated profiles); unchanged file -> no re-parse/re-validate
+_PROFILES_CACHE: Dict[str, tuple] = {}
+
+
 def _load_profiles(path: Path) -> list[Profile]:
     print(f"[evaluator][DBG] profiles_file={path}")
     if not path.exists():
         raise FileNotFoundError(f"profiles file missing: {path}")
 
-    payload = json.loads(path.read_text(encoding="utf-8"))
+    st = path.stat()
+    sig = (st.st_mtime_ns, st.st_size)
+    hit = _PROFILES_CACHE.get(str(path))
+    if hit is not None and hit[0] == sig:
+        print(f"[evaluator][DBG] profiles unchanged -> cached profiles={len(hit[1])}")
+        return list(hit[1])
+
+    payload = _read_json_file(path)
     if not isinstance(payload, list):
         raise ValueError("profiles payload must be a list (NEW schema)")
 
@@ -69,7 +93,8 @@ def _load_profiles(path: Path) -> list[Profile]:
             raise ValueError(f"profile index {i} failed schema validation: {exc}") from exc
 
     print(f"[evaluator][DBG] loaded profiles={len(profiles)}")
-    return profiles
+    _PROFILES_CACHE[str(path)] = (sig, profiles)
+    return list(profiles)
 
 
 def _load_group_mapping(path: Path | None) -> dict[str, list[str]]:
@@ -77,7 +102,7 @@ def _load_group_mapping(path: Path | None) -> dict[str, list[str]]:
         return {}
     if not path.exists():
         return {}
-    payload = json.loads(path.read_text(encoding="utf-8"))
+    payload = _read_json_file(path)
     if not isinstance(payload, dict):
         raise ValueError(f"group mapping must be object: {path}")
     mapping: dict[str, list[str]] = {}
@@ -136,18 +161,39 @@ def _engine_defaults_from_env() -> EngineDefaults:
     return EngineDefaults(**data)
 
 
+def _workers_from_env(name: str, default: str) -> int:
+    """Int aus ENV; 'auto' = Anzahl CPUs."""
+    raw = (os.getenv(name, default) or default).strip().lower()
+    if raw == "auto":
+        return max(1, os.cpu_count() or 1)
+    return int(raw)
+
+
 def _build_engine(*, indicator_base_url: str, status_path: Path, history_path: Path, mapping_path: Path | None) -> EvaluatorEngine:
     defaults = _engine_defaults_from_env()
 
     engine_cfg = EngineConfig(
         defaults=defaults,
         fetch_ttl_sec=int(os.getenv("EVALUATOR_FETCH_TTL_SEC", "5")),
+        fetch_cache_max=int(os.getenv("EVALUATOR_FETCH_CACHE_MAX", "5000")),
         group_expand_ttl_sec=int(os.getenv("EVALUATOR_GROUP_EXPAND_TTL_SEC", "10")),
         request_mode=os.getenv("EVALUATOR_REQUEST_MODE", "latest"),
         request_as_of=os.getenv("EVALUATOR_REQUEST_AS_OF", "") or None,
+        fetch_workers=_workers_from_env("EVALUATOR_FETCH_WORKERS", "8"),
+        fetch_batch_size=int(os.getenv("EVALUATOR_FETCH_BATCH_SIZE", "0")),
+        lazy_fetch=os.getenv("EVALUATOR_LAZY_FETCH", "0") in ("1", "true", "True"),
+        eval_workers=_workers_from_env("EVALUATOR_EVAL_WORKERS", "0"),
+        short_circuit=os.getenv("EVALUATOR_SHORT_CIRCUIT", "0") in ("1", "true", "True"),
+        reorder_by_cost=os.getenv("EVALUATOR_REORDER_BY_COST", "0") in ("1", "true", "True"),
+        row_debug=os.getenv("EVALUATOR_ROW_DEBUG", "0") in ("1", "true", "True"),
     )
 
-    store = JsonStore(status_path=str(status_path), history_path=str(history_path))
+    store = JsonStore(
+        status_path=str(status_path),
+        history_path=str(history_path),
+        snapshot_every=int(os.getenv("EVALUATOR_STATUS_SNAPSHOT_EVERY", "1")),
+        pretty=os.getenv("EVALUATOR_PRETTY_JSON", "0") in ("1", "true", "True"),
+    )
     group_source = StaticMappingSource(_load_group_mapping(mapping_path))
     group_expander = TTLGroupExpander(source=group_source, ttl_sec=engine_cfg.group_expand_ttl_sec)
 
@@ -160,7 +206,32 @@ def _build_engine(*, indicator_base_url: str, status_path: Path, history_path: P
             verify_ssl=os.getenv("EVALUATOR_HTTP_VERIFY_SSL", "1") not in ("0", "false", "False"),
         )
     )
-    return EvaluatorEngine(cfg=engine_cfg, store=store, group_expander=group_expander, client=client)
+
+    # optional: push/partial_change events go to the dispatcher after the run's
+    # store commit succeeded (background thread; nothing is sent if the commit fails)
+    on_events = None
+    dispatch_mode = os.getenv("EVALUATOR_DISPATCH_MODE", "").strip().lower()
+    if dispatch_mode:
+        from notifier_evaluator.alarms.dispatcher import DispatchConfig, Dispatcher
+
+        chat_id = getattr(cfg, "TELEGRAM_CHAT_ID", 0)
+        dispatcher = Dispatcher(
+            DispatchConfig(
+                mode=dispatch_mode,
+                telegram_bot_token=getattr(cfg, "TELEGRAM_BOT_TOKEN", None),
+                telegram_chat_id=str(chat_id) if chat_id else None,
+            )
+        )
+        on_events = dispatcher.dispatch
+        print(f"[evaluator][DBG] post-commit dispatch mode={dispatch_mode}")
+
+    return EvaluatorEngine(
+        cfg=engine_cfg,
+        store=store,
+        group_expander=group_expander,
+        client=client,
+        on_events=on_events,
+    )
 
 
 def _run_once(profiles_path: Path, engine: EvaluatorEngine) -> None:
@@ -170,6 +241,12 @@ def _run_once(profiles_path: Path, engine: EvaluatorEngine) -> None:
         raise ValueError(f"validation failed: {validation.errors_n} errors")
     summary = engine.run(profiles)
     print(f"[evaluator][DBG] run summary={summary}")
+    lookups = summary.cache_hits + summary.cache_misses
+    hit_ratio = (summary.cache_hits / lookups) if lookups else 0.0
+    print(
+        f"[evaluator] Laufzeit={summary.elapsed_sec:.3f}s unique_requests={summary.unique_requests} "
+        f"cache_hit_ratio={hit_ratio:.1%} ({summary.cache_hits}/{lookups}) fetch_skipped={summary.fetch_skipped}"
+    )
 
 
 def main() -> None:
@@ -204,9 +281,19 @@ def main() -> None:
     )
 
     if args.once:
-        _run_once(Path(args.profiles), engine)
+        try:
+            _run_once(Path(args.profiles), engine)
+        finally:
+            # waits for queued dispatches (sent off-thread after the commit)
+            engine.close()
         return
 
+    # long-lived startup objects (config, engine, caches) -> permanent generation;
+    # the periodic GC passes during the loop no longer rescan them
+    gc.collect()
+    gc.freeze()
+    print(f"[evaluator][DBG] gc.freeze frozen={gc.get_freeze_count()}")
+
     interval = max(1.0, float(args.interval))
     print(f"[evaluator] loop start interval={interval:.1f}s profiles={args.profiles}")
     while True:
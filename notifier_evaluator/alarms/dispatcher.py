@@ -5,7 +5,7 @@ from __future__ import annotations
 import json
 import time
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import requests
 
@@ -20,6 +20,9 @@ from notifier_evaluator.models.runtime import HistoryEvent
 # ──────────────────────────────────────────────────────────────────────────────
 
 
+_DISPATCH_EVENTS = frozenset(("push", "partial_change"))
+
+
 @dataclass
 class DispatchConfig:
     mode: str = "dry_run"  # "dry_run" | "telegram"
@@ -55,21 +58,25 @@ class Dispatcher:
         failed = 0
         details: List[Dict[str, Any]] = []
 
+        # per-dispatch constants (not per event)
+        mode = self.cfg.mode
+        tg_target = self._telegram_target() if mode == "telegram" else None
+
         for ev in events or []:
-            et = (ev.event or "").strip().lower()
-            if et not in ("push", "partial_change"):
+            et = ev.event if ev.event in _DISPATCH_EVENTS else (ev.event or "").strip().lower()
+            if et not in _DISPATCH_EVENTS:
                 continue
 
             msg = format_event(ev)
 
-            if self.cfg.mode == "dry_run":
+            if mode == "dry_run":
                 print("[dispatcher] DRY_RUN send:\n%s\n---" % msg.text)
                 sent += 1
                 details.append({"event": et, "ok": True, "mode": "dry_run"})
                 continue
 
-            if self.cfg.mode == "telegram":
-                ok, info = self._send_telegram(msg)
+            if mode == "telegram":
+                ok, info = self._send_telegram(msg, target=tg_target)
                 if ok:
                     sent += 1
                 else:
@@ -85,15 +92,19 @@ class Dispatcher:
         print("[dispatcher] DONE sent=%d failed=%d total=%d" % (sent, failed, len(details)))
         return DispatchResult(sent=sent, failed=failed, details=details)
 
-    def _send_telegram(self, msg: FormattedMessage) -> (bool, str):
+    def _telegram_target(self) -> Tuple[str, str, str]:
+        """(token, chat_id, url) from cfg; resolved once per dispatch()."""
         token = (self.cfg.telegram_bot_token or "").strip()
         chat_id = (self.cfg.telegram_chat_id or "").strip()
+        return token, chat_id, f"https://api.telegram.org/bot{token}/sendMessage"
+
+    def _send_telegram(self, msg: FormattedMessage, target: Optional[Tuple[str, str, str]] = None) -> (bool, str):
+        token, chat_id, url = target or self._telegram_target()
         if not token or not chat_id:
             err = "missing_telegram_config"
             print("[dispatcher] FAIL %s token=%s chat_id=%s" % (err, bool(token), bool(chat_id)))
             return False, err
 
-        url = f"https://api.telegram.org/bot{token}/sendMessage"
         payload = {
             "chat_id": chat_id,
             "text": msg.text,
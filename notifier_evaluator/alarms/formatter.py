@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from notifier_evaluator.models.runtime import HistoryEvent
 
@@ -26,6 +26,15 @@ class FormattedMessage:
     meta: Dict[str, Any]
 
 
+# event -> (level, title); module-level instead of an if-chain per event
+_EVENT_STYLE: Dict[str, Tuple[str, str]] = {
+    "push": ("alert", "🚨 Alert"),
+    "partial_change": ("warn", "⚠️ Pre-Notification"),
+    "deactivated": ("info", "🧯 Auto-Off"),
+}
+_DEFAULT_STYLE: Tuple[str, str] = ("info", "Notifier")
+
+
 def _fmt_num(x: Any) -> str:
     try:
         if x is None:
@@ -48,18 +57,8 @@ def format_event(event: HistoryEvent) -> FormattedMessage:
       - "deactivated"
       - "eval" (usually not pushed)
     """
-    et = (event.event or "").strip().lower()
-    level = "info"
-    title = "Notifier"
-    if et == "push":
-        level = "alert"
-        title = "🚨 Alert"
-    elif et == "partial_change":
-        level = "warn"
-        title = "⚠️ Pre-Notification"
-    elif et == "deactivated":
-        level = "info"
-        title = "🧯 Auto-Off"
+    et = event.event if event.event in _EVENT_STYLE else (event.event or "").strip().lower()
+    level, title = _EVENT_STYLE.get(et, _DEFAULT_STYLE)
 
     header = f"{title} | {event.profile_id} / {event.gid} | {event.symbol} ({event.exchange})"
     state_line = f"state={event.final_state} partial={event.partial_true}"
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Dict, List, Optional
 
 from notifier_evaluator.models.schema import AlarmConfig
@@ -30,7 +31,7 @@ from notifier_evaluator.models.runtime import HistoryEvent, StatusKey, StatusSta
 # ──────────────────────────────────────────────────────────────────────────────
 
 
-@dataclass
+@dataclass(slots=True)
 class PolicyResult:
     push: bool
     push_reason: str
@@ -83,28 +84,41 @@ def _parse_ts_to_unix(ts: object) -> Optional[float]:
         if not s:
             return None
 
-        # numeric string -> unix
-        try:
-            return float(s)
-        except Exception:
-            pass
+        return _parse_str_to_unix(s)
 
-        # ISO string
-        try:
-            # handle trailing Z
-            s2 = s.replace("Z", "+00:00") if s.endswith("Z") else s
-            dt = datetime.fromisoformat(s2)
+    # unknown type
+    return None
 
-            # if naive -> assume UTC (better than local guessing)
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=timezone.utc)
 
-            return dt.timestamp()
-        except Exception:
-            return None
+@lru_cache(maxsize=4096)
+def _parse_str_to_unix(s: str) -> Optional[float]:
+    """
+    String branch of _parse_ts_to_unix (stripped, non-empty).
+    Pure -> cached per unique string; last_push_ts repeats every tick.
+    """
+    # numeric string -> unix
+    try:
+        return float(s)
+    except Exception:
+        pass
+
+    # ISO string
+    try:
+        # handle trailing Z
+        s2 = s.replace("Z", "+00:00") if s.endswith("Z") else s
+        dt = datetime.fromisoformat(s2)
+
+        # if naive -> assume UTC (better than local guessing)
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+
+        return dt.timestamp()
+    except Exception:
+        return None
 
-    # unknown type
-    return None
+
+# AlarmConfig.mode is Literal-validated -> normally already canonical
+_MODES = frozenset(("always_on", "auto_off", "pre_notification"))
 
 
 def apply_alarm_policy(
@@ -122,7 +136,7 @@ def apply_alarm_policy(
     last_row_right: Optional[float] = None,
     last_row_op: Optional[str] = None,
 ) -> PolicyResult:
-    mode = (cfg.mode or "always_on").strip().lower()
+    mode = cfg.mode if cfg.mode in _MODES else (cfg.mode or "always_on").strip().lower()
     cooldown = int(cfg.cooldown_sec or 0)
     edge_only = bool(cfg.edge_only)
 
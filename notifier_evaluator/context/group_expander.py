@@ -4,7 +4,8 @@ from __future__ import annotations
 
 import time
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from itertools import chain
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
 
 
 def _dbg(msg: str) -> None:
@@ -15,14 +16,16 @@ def _safe_strip(x: Any) -> str:
     return (str(x).strip() if x is not None else "").strip()
 
 
-def _uniq_stable(items: List[str]) -> List[str]:
-    seen: Dict[str, None] = {}
+def _uniq_stable(items: Iterable[Any]) -> List[str]:
+    # one pass, set membership; accepts any iterable (no list() copy at call sites)
+    seen: Set[str] = set()
+    add = seen.add
     out: List[str] = []
-    for it in items or []:
+    for it in items or ():
         s = _safe_strip(it)
         if not s or s in seen:
             continue
-        seen[s] = None
+        add(s)
         out.append(s)
     return out
 
@@ -77,12 +80,13 @@ class TTLGroupExpander:
         return resolved
 
     def _build_cache_key(self, symbol_group: Optional[str], symbols: Optional[List[str]]) -> str:
-        return f"sg={_safe_strip(symbol_group)}|symbols={','.join(_uniq_stable(symbols or []))}"
+        # symbols must already be deduped/stripped (_uniq_stable) -> no second pass here
+        return f"sg={_safe_strip(symbol_group)}|symbols={','.join(symbols or [])}"
 
     def expand_group(self, group: Any) -> ExpandedGroup:
         symbol_group = _safe_strip(getattr(group, "symbol_group", None))
         explicit_symbols_raw = getattr(group, "symbols", None)
-        explicit_symbols = _uniq_stable(list(explicit_symbols_raw or [])) if explicit_symbols_raw is not None else []
+        explicit_symbols = _uniq_stable(explicit_symbols_raw) if explicit_symbols_raw is not None else []
 
         cache_key = self._build_cache_key(symbol_group, explicit_symbols)
         now = time.time()
@@ -92,7 +96,11 @@ class TTLGroupExpander:
             return hit[1]
 
         resolved_group_symbols = self._resolve_symbol_group(symbol_group) if symbol_group else []
-        symbols = _uniq_stable((explicit_symbols or []) + (resolved_group_symbols or []))
+        if resolved_group_symbols:
+            symbols = _uniq_stable(chain(explicit_symbols, resolved_group_symbols))
+        else:
+            # explicit list is already deduped -> reuse it
+            symbols = explicit_symbols
 
         if not symbols:
             raise ValueError(
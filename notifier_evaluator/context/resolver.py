@@ -24,22 +24,18 @@ def _first_non_empty(*vals: Any) -> Optional[str]:
     return None
 
 
-def resolve_contexts(
+def resolve_static(
     *,
-    profile: Profile,
     group: Group,
     cond: Condition,
     defaults: EngineDefaults,
-    base_symbol: str,
-) -> Tuple[ResolvedPair, Dict[str, Any]]:
-    pid = profile.id
-    gid = group.gid
-    rid = cond.rid
-    base_symbol = _safe_strip(base_symbol)
-
-    left_symbol = _first_non_empty(cond.left.symbol, base_symbol) or ""
-    right_symbol = _first_non_empty(cond.right.symbol, base_symbol) or ""
-
+) -> Tuple[str, str, str, str]:
+    """
+    Symbol-independent part of resolve_contexts:
+    (left_interval, right_interval, exchange, clock_interval).
+    Depends only on (group, cond, defaults) -> compute once per group row,
+    not once per expanded symbol.
+    """
     # interval resolution: row -> group -> engine defaults
     left_interval = _first_non_empty(cond.left.interval, group.interval, getattr(defaults, "interval", None)) or ""
     right_interval = _first_non_empty(cond.right.interval, group.interval, getattr(defaults, "interval", None)) or ""
@@ -53,6 +49,32 @@ def resolve_contexts(
         getattr(defaults, "clock_interval", None),
         getattr(defaults, "interval", None),
     ) or ""
+    return left_interval, right_interval, exchange, clock_interval
+
+
+def resolve_contexts(
+    *,
+    profile: Profile,
+    group: Group,
+    cond: Condition,
+    defaults: EngineDefaults,
+    base_symbol: str,
+    static: Optional[Tuple[str, str, str, str]] = None,
+) -> Tuple[ResolvedPair, Dict[str, Any]]:
+    """
+    static: precomputed resolve_static(...) for (group, cond, defaults); optional.
+    """
+    pid = profile.id
+    gid = group.gid
+    rid = cond.rid
+    base_symbol = _safe_strip(base_symbol)
+
+    left_symbol = _first_non_empty(cond.left.symbol, base_symbol) or ""
+    right_symbol = _first_non_empty(cond.right.symbol, base_symbol) or ""
+
+    if static is None:
+        static = resolve_static(group=group, cond=cond, defaults=defaults)
+    left_interval, right_interval, exchange, clock_interval = static
 
     _dbg(
         "resolver inputs pid=%s gid=%s rid=%s base_symbol=%s | "
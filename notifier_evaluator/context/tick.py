@@ -29,7 +29,7 @@ from notifier_evaluator.models.runtime import StatusKey, StatusState
 # ──────────────────────────────────────────────────────────────────────────────
 
 
-@dataclass
+@dataclass(slots=True)
 class TickResult:
     new_tick: bool
     tick_ts: Optional[str]
@@ -31,14 +31,16 @@ def dump_json(
     title: str = "",
     max_len: int = 10_000,
     indent: int = 2,
+    max_items: int = 50,
 ) -> str:
     """
     Serialisiert beliebige Objekte tolerant nach JSON.
-    Schneidet ab, wenn zu lang.
+    Listen werden VOR dem Serialisieren auf max_items gekürzt (0 = alle),
+    der Text danach zusätzlich auf max_len.
     """
     try:
-        payload = _to_jsonable(obj)
-        txt = json.dumps(payload, indent=indent, ensure_ascii=False)
+        payload = _to_jsonable(obj, max_items=max_items)
+        txt = json.dumps(payload, indent=indent, ensure_ascii=False, default=str)
     except Exception as e:
         txt = f"<dump_failed err={e}>"
 
@@ -184,19 +186,24 @@ def _safe_asdict(obj: Any) -> Any:
     return _to_jsonable(obj)
 
 
-def _to_jsonable(obj: Any) -> Any:
+def _to_jsonable(obj: Any, max_items: int = 0) -> Any:
     """
     Macht Objekte JSON-kompatibel (best-effort).
+    max_items > 0: Listen werden gekürzt, bevor ihre Elemente konvertiert werden.
     """
     if obj is None:
         return None
     if isinstance(obj, (str, int, float, bool)):
         return obj
     if isinstance(obj, dict):
-        return {str(k): _to_jsonable(v) for k, v in obj.items()}
+        return {str(k): _to_jsonable(v, max_items) for k, v in obj.items()}
     if isinstance(obj, (list, tuple, set)):
-        return [_to_jsonable(x) for x in obj]
+        items = list(obj)
+        if max_items and len(items) > max_items:
+            more = len(items) - max_items
+            return [_to_jsonable(x, max_items) for x in items[:max_items]] + [f"... <+{more} more>"]
+        return [_to_jsonable(x, max_items) for x in items]
     if is_dataclass(obj):
-        return {k: _to_jsonable(v) for k, v in asdict(obj).items()}
+        return {k: _to_jsonable(v, max_items) for k, v in asdict(obj).items()}
     # Fallback
     return str(obj)
@@ -35,3 +35,28 @@ class Trace:
 
     def since_start(self) -> float:
         return time.time() - self.t0
+
+
+class PerfTimer:
+    """
+    Monotonic span timer: reads perf_counter once on enter and once on exit.
+        with PerfTimer() as pt: ...
+        pt.sec / pt.ms
+    """
+
+    __slots__ = ("t", "sec")
+
+    def __init__(self) -> None:
+        self.t = 0.0
+        self.sec = 0.0
+
+    def __enter__(self) -> "PerfTimer":
+        self.t = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.sec = time.perf_counter() - self.t
+
+    @property
+    def ms(self) -> float:
+        return self.sec * 1000.0
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Dict, List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional, Tuple
 
 from notifier_evaluator.models.runtime import ChainResult, ConditionResult, TriState
 
@@ -11,6 +11,9 @@ logger = logging.getLogger(__name__)
 
 LogicOp = Literal["and", "or"]
 
+# already-normalized spellings -> returned as-is (no str/strip/lower per step)
+_LOGIC_CANON = frozenset(("and", "or"))
+
 
 class ChainEvalError(Exception):
     """Raised when chain evaluation fails due to invalid inputs."""
@@ -30,6 +33,8 @@ def _normalize_logic(op: Any, *, position: int) -> LogicOp:
     Normalize logic operator.
     Allowed: "and", "or", blank/None (treated as "and")
     """
+    if type(op) is str and op in _LOGIC_CANON:
+        return op  # type: ignore[return-value]
     if op is None:
         return "and"
     s = str(op).strip().lower()
@@ -56,6 +61,26 @@ def _combine_or(a: TriState, b: TriState) -> TriState:
     return TriState.FALSE
 
 
+# Truth tables (3x3) built once from the reference combinators above:
+# one dict lookup per fold step instead of up to four enum comparisons.
+_AND_TABLE: Dict[Tuple[TriState, TriState], TriState] = {
+    (a, b): _combine_and(a, b) for a in TriState for b in TriState
+}
+_OR_TABLE: Dict[Tuple[TriState, TriState], TriState] = {
+    (a, b): _combine_or(a, b) for a in TriState for b in TriState
+}
+
+
+def combine_logic(logic: str, a: TriState, b: TriState) -> TriState:
+    """
+    One left-fold step: a <logic> b.
+    logic is expected to be normalized ("and"/"or"); anything else folds as AND.
+    """
+    if logic == "or":
+        return _OR_TABLE[a, b]
+    return _AND_TABLE[a, b]
+
+
 def eval_chain(
     results: List[ConditionResult],
     *,
@@ -80,12 +105,12 @@ def eval_chain(
             debug={"reason": "no_rows"},
         )
 
-    # partial_true = at least one TRUE row
-    partial_true = any(r.state == TriState.TRUE for r in results)
-
     # Start with first row state
     final_state: TriState = results[0].state
 
+    # partial_true = at least one TRUE row (tracked in the fold, set once)
+    partial_true = final_state == TriState.TRUE
+
     debug_steps: List[Dict[str, str]] = []
     debug_steps.append(
         {"i": "0", "rid": results[0].rid, "state": results[0].state.value, "logic": "<start>"}
@@ -100,11 +125,10 @@ def eval_chain(
 
         before = final_state
         cur = results[i].state
+        if not partial_true and cur == TriState.TRUE:
+            partial_true = True
 
-        if logic == "or":
-            final_state = _combine_or(before, cur)
-        else:
-            final_state = _combine_and(before, cur)
+        final_state = (_OR_TABLE if logic == "or" else _AND_TABLE)[before, cur]
 
         debug_steps.append(
             {
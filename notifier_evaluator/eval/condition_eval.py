@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Dict, Optional, Tuple
 
-from notifier_evaluator.eval.operators import apply_op
+from notifier_evaluator.eval.operators import OpFn, apply_op
 from notifier_evaluator.fetch.types import RequestKey
 from notifier_evaluator.models.schema import Condition
 from notifier_evaluator.models.runtime import ConditionResult, FetchResult, ResolvedPair, RowSide, TriState
@@ -27,11 +27,16 @@ def eval_condition_row(
     pair: ResolvedPair,
     row_map: Dict[Tuple[str, str, str, str, str], RequestKey],
     fetch_results: Dict[RequestKey, FetchResult],
+    op_fn: Optional[OpFn] = None,
+    row_debug: bool = True,
 ) -> ConditionResult:
     """
     Evaluates one Condition row for one (profile_id, gid, base_symbol).
 
     fetch_results: dict[RequestKey] -> FetchResult
+    op_fn: operator pre-resolved per condition (operators.resolve_op); optional
+    row_debug: False -> decided rows carry no debug dict (only dump tools read it);
+               error rows always keep theirs
     """
     rid = cond.rid
     map_key_left = (profile_id, gid, rid, base_symbol, RowSide.LEFT.value)
@@ -109,7 +114,7 @@ def eval_condition_row(
         )
 
     # apply operator
-    state, op_reason = apply_op(cond.op, left_val, right_val)
+    state, op_reason = apply_op(cond.op, left_val, right_val, fn=op_fn)
 
     # Debug print (noisy)
     print(
@@ -123,6 +128,16 @@ def eval_condition_row(
         )
     )
 
+    if not row_debug:
+        return ConditionResult(
+            rid=rid,
+            state=state,
+            op=cond.op,
+            left_value=left_val,
+            right_value=right_val,
+            reason=op_reason,
+        )
+
     return ConditionResult(
         rid=rid,
         state=state,
@@ -130,24 +145,17 @@ def eval_condition_row(
         left_value=left_val,
         right_value=right_val,
         reason=op_reason,
+        # Debug hält Referenzen (frozen dataclasses) statt pro Row neue
+        # Kontext-Dicts/short()-Strings zu bauen; serialisiert wird erst im Dump.
         debug={
             "profile_id": profile_id,
             "gid": gid,
             "base_symbol": base_symbol,
             "rid": rid,
-            "left_ctx": {
-                "symbol": pair.left.symbol,
-                "interval": pair.left.interval,
-                "exchange": pair.left.exchange,
-            },
-            "right_ctx": {
-                "symbol": pair.right.symbol,
-                "interval": pair.right.interval,
-                "exchange": pair.right.exchange,
-            },
-            "clock_interval": pair.left.clock_interval,
-            "k_left": k_left.short(),
-            "k_right": k_right.short(),
+            "left_ctx": pair.left,
+            "right_ctx": pair.right,
+            "k_left": k_left,
+            "k_right": k_right,
             "left_ts": fr_left.latest_ts,
             "right_ts": fr_right.latest_ts,
         },
@@ -2,16 +2,21 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
 
+import threading
 import time
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple
 
-from notifier_evaluator.alarms.policy import apply_alarm_policy
+from notifier_evaluator.alarms.policy import PolicyResult, apply_alarm_policy
 from notifier_evaluator.context.group_expander import TTLGroupExpander
-from notifier_evaluator.context.resolver import resolve_contexts
+from notifier_evaluator.context.resolver import resolve_contexts, resolve_static
 from notifier_evaluator.context.tick import detect_new_tick
-from notifier_evaluator.eval.chain_eval import eval_chain
+from notifier_evaluator.debug.trace import PerfTimer
+from notifier_evaluator.eval.chain_eval import combine_logic, eval_chain
 from notifier_evaluator.eval.condition_eval import eval_condition_row
+from notifier_evaluator.eval.operators import OpFn, resolve_op
 from notifier_evaluator.eval.threshold import apply_threshold
 from notifier_evaluator.fetch.cache import FetchCache
 from notifier_evaluator.fetch.client import IndicatorClient
@@ -20,10 +25,12 @@ from notifier_evaluator.fetch.types import RequestKey
 from notifier_evaluator.models.schema import AlarmConfig, EngineDefaults, Group, Profile, ThresholdConfig
 from notifier_evaluator.models.runtime import (
     FetchResult,
+    ConditionResult,
     HistoryEvent,
     ResolvedPair,
     StatusKey,
     StatusState,
+    TriState,
 )
 from notifier_evaluator.state.store import StateStore, StoreCommit
 
@@ -36,9 +43,29 @@ from notifier_evaluator.state.store import StateStore, StoreCommit
 class EngineConfig:
     defaults: EngineDefaults
     fetch_ttl_sec: int = 5
+    # size cap for the cross-run TTL cache (CLOCK eviction); 0 -> unbounded
+    fetch_cache_max: int = 0
     group_expand_ttl_sec: int = 10
     request_mode: str = "latest"
     request_as_of: Optional[str] = None
+    # parallel /indicator fetches (network-bound); <=1 -> sequential
+    fetch_workers: int = 8
+    # >0 -> cache misses go to POST /indicator/batch in chunks of this size
+    fetch_batch_size: int = 0
+    # True -> only row 0 of every unit is prefetched; later rows are fetched
+    # on demand, so short-circuited rows cost no /indicator calls
+    lazy_fetch: bool = False
+    # parallel per-unit evaluation (mainly useful with lazy_fetch); 1 -> sequential,
+    # 0 -> fetch_workers with lazy_fetch (units wait on network I/O), else sequential
+    eval_workers: int = 1
+    # True -> rows after a decided chain become UNKNOWN stubs (opt-in; off ->
+    # every row is evaluated with full per-row debug, no skipped stubs)
+    short_circuit: bool = False
+    # True -> rows of uniformly chained groups (all "and" / all "or") are evaluated
+    # cheapest-first by the fetch-cost EMA, so the short-circuit fires earlier
+    reorder_by_cost: bool = False
+    # False -> decided condition rows skip their per-row debug dict (dump tools only)
+    row_debug: bool = True
 
 
 @dataclass
@@ -50,6 +77,10 @@ class RunSummary:
     unique_requests: int = 0
     fetch_ok: int = 0
     fetch_fail: int = 0
+    fetch_skipped: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    elapsed_sec: float = 0.0
     pushes: int = 0
     events: int = 0
     status_updates: int = 0
@@ -64,6 +95,15 @@ class UnitPlan:
     resolved_pairs: Dict[str, ResolvedPair]
     unique_keys: List[RequestKey]
     row_map: Dict[Tuple[str, str, str, str, str], RequestKey]
+    # per group, shared across symbols
+    logic_to_prev: List[str] = field(default_factory=list)
+    remaining_all_and: List[bool] = field(default_factory=list)
+    remaining_all_or: List[bool] = field(default_factory=list)
+    threshold_cfg: Optional[ThresholdConfig] = None
+    threshold_rid: Optional[str] = None
+    op_fns: List[Optional[OpFn]] = field(default_factory=list)
+    resolved_exchange: str = ""
+    alarm_cfg: Optional[AlarmConfig] = None
 
 
 # ──────────────────────────────────────────────────────────────
@@ -94,17 +134,42 @@ def _resolve_exchange(group: Group, defaults: EngineDefaults) -> str:
     return ex
 
 
+@lru_cache(maxsize=16)
+def _alarm_for_mode(mode: str) -> AlarmConfig:
+    # validated once per deactivate_on value (closed set) and shared read-only:
+    # apply_alarm_policy never mutates cfg
+    return AlarmConfig(mode=mode, cooldown_sec=0, edge_only=True)
+
+
 def _alarm_from_group(group: Group) -> AlarmConfig:
-    return AlarmConfig(mode=group.deactivate_on, cooldown_sec=0, edge_only=True)
+    return _alarm_for_mode(group.deactivate_on)
 
 
 def _logic_to_prev(conditions: List) -> List[str]:
+    """Normalized once per group; reused by the condition loop and eval_chain."""
     ops = ["<start>"]
     for cond in conditions[1:]:
-        ops.append(cond.logic)
+        ops.append((cond.logic or "and").strip().lower())
     return ops
 
 
+def _short_circuit_tables(logic_to_prev: List[str]) -> Tuple[List[bool], List[bool]]:
+    """
+    One reverse pass:
+      remaining_all_and[i] -> every condition after i is chained with "and"
+      remaining_all_or[i]  -> every condition after i is chained with "or"
+    Makes the early-exit check in the condition loop O(1).
+    """
+    n = len(logic_to_prev)
+    all_and = [True] * n
+    all_or = [True] * n
+    for i in range(n - 2, -1, -1):
+        nxt = logic_to_prev[i + 1]
+        all_and[i] = all_and[i + 1] and nxt == "and"
+        all_or[i] = all_or[i + 1] and nxt == "or"
+    return all_and, all_or
+
+
 def _pick_threshold_condition(
     conditions_in_eval_order: List,
 ) -> Tuple[Optional[ThresholdConfig], Optional[str]]:
@@ -130,20 +195,350 @@ class EvaluatorEngine:
         group_expander: TTLGroupExpander,
         client: IndicatorClient,
         fetch_cache: Optional[FetchCache] = None,
+        on_events: Optional[Callable[[List[HistoryEvent]], None]] = None,
     ):
         self.cfg = cfg
         self.store = store
         self.group_expander = group_expander
         self.client = client
-        self.cache = fetch_cache or FetchCache(ttl_sec=cfg.fetch_ttl_sec)
+        self.cache = fetch_cache or FetchCache(ttl_sec=cfg.fetch_ttl_sec, max_items=cfg.fetch_cache_max)
+        # indicator name -> EMA of on-demand fetch seconds (reorder_by_cost)
+        self._cost_ema: Dict[str, float] = {}
+        self._cost_lock = threading.Lock()
+        # optional hook (e.g. Dispatcher.dispatch): called with each unit's events,
+        # in plan order, on a background thread once the run's store commit succeeded
+        # (a failed commit sends nothing -> no duplicate alerts on the next run)
+        self.on_events = on_events
+        # lazy_fetch: pool for the second side of a row (set only while run() evaluates)
+        self._side_pool: Optional[ThreadPoolExecutor] = None
+        # thread_name_prefix -> worker pool, kept for the engine's lifetime
+        self._pools: Dict[str, ThreadPoolExecutor] = {}
+        self._pools_lock = threading.Lock()
+
+    def _pool(self, prefix: str, workers: int) -> ThreadPoolExecutor:
+        """
+        Worker pools live as long as the engine: threads are spawned once and
+        reused every tick instead of being created and joined per run.
+        """
+        pool = self._pools.get(prefix)
+        if pool is None:
+            with self._pools_lock:
+                pool = self._pools.get(prefix)
+                if pool is None:
+                    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=prefix)
+                    self._pools[prefix] = pool
+        return pool
+
+    def _eval_workers(self) -> int:
+        n = int(self.cfg.eval_workers or 0)
+        if n <= 0:
+            # auto: lazy units block on /indicator calls -> run as many as we fetch with
+            n = int(self.cfg.fetch_workers or 1) if self.cfg.lazy_fetch else 1
+        return max(1, n)
+
+    def close(self) -> None:
+        """Shuts down the persistent worker pools (idle threads exit)."""
+        with self._pools_lock:
+            pools, self._pools = list(self._pools.values()), {}
+        for pool in pools:
+            pool.shutdown(wait=True)
+
+    def _record_cost(self, name: str, dt: float) -> None:
+        with self._cost_lock:
+            prev = self._cost_ema.get(name)
+            self._cost_ema[name] = dt if prev is None else 0.9 * prev + 0.1 * dt
+
+    def _eval_order(self, up: UnitPlan) -> List[int]:
+        """
+        Row 0 stays first (prefetched, drives tick detection); the rest sorted by
+        the summed cost EMA of both sides. Unknown names sort last (assumed expensive);
+        stable sort keeps the declared order on ties.
+        Only valid for uniform chains: AND/OR are commutative there.
+        """
+        ema = self._cost_ema
+        conds = up.group.conditions
+
+        def _cost(i: int) -> float:
+            total = 0.0
+            for side in ("left", "right"):
+                k = up.row_map.get((up.profile_id, up.gid, conds[i].rid, up.base_symbol, side))
+                total += ema.get(k.indicator, float("inf")) if k is not None else float("inf")
+            return total
+
+        return [0] + sorted(range(1, len(conds)), key=_cost)
+
+    def _fetch_timed(self, k: RequestKey) -> FetchResult:
+        with PerfTimer() as pt:
+            fr = self.cache.get_or_fetch(k, self.client.fetch_indicator)
+        self._record_cost(k.indicator, pt.sec)
+        return fr
+
+    def _lazy_fetch_sides(self, keys: List[Optional[RequestKey]], fetch_results: Dict[RequestKey, FetchResult]) -> None:
+        """
+        On-demand fetch of one row's sides. Both missing -> the second side runs on
+        the side pool while this thread fetches the first (1 RTT instead of 2).
+        dict setitem is atomic; the cache itself is thread-safe.
+        """
+        missing = [k for k in dict.fromkeys(keys) if k is not None and k not in fetch_results]
+        pool = self._side_pool
+        if len(missing) == 2 and pool is not None:
+            fut = pool.submit(self._fetch_timed, missing[1])
+            fetch_results[missing[0]] = self._fetch_timed(missing[0])
+            fetch_results[missing[1]] = fut.result()
+            return
+        for k in missing:
+            fetch_results[k] = self._fetch_timed(k)
+
+    def _emit_events(self, events: List[HistoryEvent]) -> None:
+        try:
+            self.on_events(events)  # type: ignore[misc]
+        except Exception as e:
+            print(f"[evaluator][ERR] on_events hook failed: {type(e).__name__}: {e}")
+
+    def _fetch_batched(self, keys: List[RequestKey], *, batch_size: int) -> List[FetchResult]:
+        """
+        Cache hits first, then misses via POST /indicator/batch (chunked).
+        Keys the batch did not answer fall back to single fetches.
+        """
+        got: Dict[RequestKey, FetchResult] = {}
+        misses: List[RequestKey] = []
+        for k in keys:
+            fr = self.cache.lookup(k)
+            if fr is None:
+                misses.append(k)
+            else:
+                got[k] = fr
+        # keys sharing (exchange, interval, symbol) land in the same chunk ->
+        # the proxy/upstream can reuse the same chart data within one batch
+        misses.sort(key=lambda k: (k.exchange, k.interval, k.symbol))
+
+        chunks = [misses[i:i + batch_size] for i in range(0, len(misses), batch_size)]
+        print(f"[evaluator][DBG] fetch phase batch keys={len(keys)} misses={len(misses)} chunks={len(chunks)}")
+
+        def _single(k: RequestKey) -> FetchResult:
+            return self.client.fetch_indicator(k)
+
+        pool = self._pool("ne-fetch", max(1, int(self.cfg.fetch_workers or 1)))
+        for part in pool.map(self.client.fetch_indicators_batch, chunks):
+            got.update(part)
+
+        rest = [k for k in misses if k not in got]
+        if rest:
+            print(f"[evaluator][DBG] fetch batch fallback single keys={len(rest)}")
+            for k, fr in zip(rest, pool.map(_single, rest)):
+                got[k] = fr
+
+        for k in misses:
+            self.cache.store(k, got[k])
+        return [got[k] for k in keys]
+
+    def _eval_unit(
+        self,
+        unit_key: Tuple[str, str, str],
+        up: UnitPlan,
+        status_key: StatusKey,
+        st: StatusState,
+        fetch_results: Dict[RequestKey, FetchResult],
+        now_ts: str,
+        now_unix: float,
+    ) -> PolicyResult:
+        """
+        Evaluates one (profile, gid, symbol) unit and mutates only its own `st`.
+        Safe to run on a worker thread: shared inputs are read-only except
+        fetch_results (lazy_fetch adds keys; single dict setitems).
+        """
+        profile_id, gid, base_symbol = unit_key
+        group = up.group
+
+        # preallocated: one slot per condition (evaluated or stub),
+        # the eval order is group.conditions itself -> no parallel list
+        n_conds = len(group.conditions)
+        cond_results: List[ConditionResult] = [None] * n_conds  # type: ignore[list-item]
+        last_row_left = None
+        last_row_right = None
+        last_row_op = None
+
+        # Short-circuit: once the running state can no longer change
+        # (FALSE followed only by "and", TRUE followed only by "or"),
+        # the remaining rows are filled with UNKNOWN stubs (except the declared
+        # last row, which is still evaluated for the event values).
+        # Never before the threshold row is evaluated, and a FALSE exit
+        # only after a TRUE row was seen: a later TRUE row would still set
+        # partial_true (persisted + in events), so it must stay exact.
+        threshold_rid = up.threshold_rid
+        threshold_seen = threshold_rid is None
+        # threshold target is captured while streaming through the rows
+        threshold_row_state: Optional[TriState] = None
+        partial_seen = False
+        running: Optional[TriState] = None
+        short_circuit = self.cfg.short_circuit
+        order: Optional[List[int]] = None
+        if self.cfg.reorder_by_cost and n_conds > 2 and (up.remaining_all_and[0] or up.remaining_all_or[0]):
+            order = self._eval_order(up)
+
+        def _row(idx: int) -> ConditionResult:
+            cond = group.conditions[idx]
+            pair = up.resolved_pairs.get(cond.rid)
+            if pair is None:
+                raise ValueError(
+                    f"missing resolved pair for rid={cond.rid} "
+                    f"profile={profile_id} gid={gid}"
+                )
+
+            if self.cfg.lazy_fetch and idx > 0:
+                self._lazy_fetch_sides(
+                    [up.row_map.get((profile_id, gid, cond.rid, base_symbol, side)) for side in ("left", "right")],
+                    fetch_results,
+                )
+
+            return eval_condition_row(
+                profile_id=profile_id,
+                gid=gid,
+                base_symbol=base_symbol,
+                cond=cond,
+                pair=pair,
+                row_map=up.row_map,
+                fetch_results=fetch_results,
+                op_fn=up.op_fns[idx],
+                row_debug=self.cfg.row_debug,
+            )
+
+        # pos = position in eval order, idx = declared row index (results stay in declared order)
+        for pos, idx in enumerate(order or range(n_conds)):
+            cond = group.conditions[idx]
+            cr = _row(idx)
+            cond_results[idx] = cr
+
+            if cr.state == TriState.TRUE:
+                partial_seen = True
+            if cond.rid == threshold_rid:
+                threshold_seen = True
+                threshold_row_state = cr.state
+            running = cr.state if pos == 0 else combine_logic(
+                up.logic_to_prev[idx], running, cr.state
+            )
+
+            if not short_circuit or not threshold_seen or pos + 1 >= n_conds:
+                continue
+            stop = (
+                running == TriState.FALSE
+                and up.remaining_all_and[pos]
+                and partial_seen
+            ) or (running == TriState.TRUE and up.remaining_all_or[pos])
+            if stop:
+                rest_idx = order[pos + 1:] if order else range(idx + 1, n_conds)
+                skipped = 0
+                for j in rest_idx:
+                    if j == n_conds - 1:
+                        # the declared last row is always evaluated: it feeds
+                        # last_row_left/right/op of the events. Its state cannot
+                        # change the decided chain (nor partial_true, see above).
+                        cond_results[j] = _row(j)
+                        continue
+                    rest = group.conditions[j]
+                    cond_results[j] = ConditionResult(
+                        rid=rest.rid,
+                        state=TriState.UNKNOWN,
+                        op=rest.op,
+                        left_value=None,
+                        right_value=None,
+                        reason="skipped_short_circuit",
+                    )
+                    skipped += 1
+                print(
+                    f"[evaluator][DBG] short_circuit profile={profile_id} gid={gid} "
+                    f"symbol={base_symbol} at_idx={idx} state={running.value} "
+                    f"skipped={skipped}"
+                )
+                break
+
+        # event values always come from the declared last row (not the last evaluated one)
+        if cond_results:
+            last = cond_results[-1]
+            last_row_left = last.left_value
+            last_row_right = last.right_value
+            last_row_op = last.op
+
+        chain = eval_chain(
+            cond_results,
+            logic_to_prev=up.logic_to_prev,
+        )
+
+        # ──────────────────────────────
+        # Tick detection
+        # ──────────────────────────────
+
+        tick_ts = None
+        if cond_results:
+            first = group.conditions[0]
+            k_left = up.row_map.get(
+                (profile_id, gid, first.rid, base_symbol, "left")
+            )
+            if k_left and fetch_results.get(k_left):
+                tick_ts = fetch_results[k_left].latest_ts
+
+        tick_res = detect_new_tick(
+            skey=status_key,
+            state=st,
+            current_tick_ts=tick_ts,
+        )
+
+        # ──────────────────────────────
+        # Threshold
+        # ──────────────────────────────
+
+        threshold_cfg = up.threshold_cfg
+        threshold_target_state = (
+            threshold_row_state if threshold_row_state is not None else chain.final_state
+        )
+
+        thr = apply_threshold(
+            final_state=threshold_target_state,
+            new_tick=tick_res.new_tick,
+            cfg=threshold_cfg,
+            state=st,
+            now_ts=now_ts,
+        )
+
+        print(
+            f"[evaluator][DBG] threshold_strategy=last_condition_with_threshold "
+            f"rid={threshold_rid} "
+            f"target_state={threshold_target_state.value} "
+            f"passed={thr.passed}"
+        )
+
+        # ──────────────────────────────
+        # Alarm policy
+        # ──────────────────────────────
+
+        pol = apply_alarm_policy(
+            skey=status_key,
+            state=st,
+            cfg=up.alarm_cfg or _alarm_from_group(group),
+            now_ts=now_ts,
+            now_unix=now_unix,
+            partial_true=chain.partial_true,
+            final_state=chain.final_state,
+            threshold_passed=thr.passed,
+            last_row_left=last_row_left,
+            last_row_right=last_row_right,
+            last_row_op=last_row_op,
+        )
+
+        return pol
 
     def run(self, profiles: List[Profile]) -> RunSummary:
         print(f"[evaluator][DBG] engine start profiles={len(profiles or [])}")
+        t_run = time.perf_counter()
         self.cache.reset_run_cache()
+        hits0 = self.cache.stats.run_hit + self.cache.stats.ttl_hit
+        miss0 = self.cache.stats.miss
 
         summary = RunSummary(profiles=len(profiles or []))
         global_unique: Dict[RequestKey, None] = {}
         unit_plans: Dict[Tuple[str, str, str], UnitPlan] = {}
+        # id(params dict) -> params_json, valid for this run only
+        params_json_memo: Dict[int, str] = {}
 
         # ──────────────────────────────────────────────
         # Planning Phase
@@ -167,16 +562,29 @@ class EvaluatorEngine:
                 exp = self.group_expander.expand_group(group)
                 summary.symbols += len(exp.symbols)
 
+                logic_to_prev = _logic_to_prev(group.conditions)
+                remaining_all_and, remaining_all_or = _short_circuit_tables(logic_to_prev)
+                threshold_cfg, threshold_rid = _pick_threshold_condition(group.conditions)
+                op_fns = [resolve_op(c.op) for c in group.conditions]
+                # group-level, symbol-independent -> once per group, not per unit
+                resolved_exchange = _resolve_exchange(group, self.cfg.defaults)
+                alarm_cfg = _alarm_from_group(group)
+                # intervals/exchange/clock per row don't depend on the symbol
+                statics = [
+                    resolve_static(group=group, cond=c, defaults=self.cfg.defaults) for c in group.conditions
+                ]
+
                 for base_symbol in exp.symbols:
                     resolved_pairs: Dict[str, ResolvedPair] = {}
 
-                    for cond in group.conditions:
+                    for cond, static in zip(group.conditions, statics):
                         pair, _ = resolve_contexts(
                             profile=profile,
                             group=group,
                             cond=cond,
                             defaults=self.cfg.defaults,
                             base_symbol=base_symbol,
+                            static=static,
                         )
                         resolved_pairs[cond.rid] = pair
 
@@ -188,6 +596,7 @@ class EvaluatorEngine:
                         resolved_pairs=resolved_pairs,
                         mode=self.cfg.request_mode,
                         as_of=self.cfg.request_as_of,
+                        params_json_memo=params_json_memo,
                     )
 
                     summary.rows += plan.debug.get("rows", 0)
@@ -203,6 +612,14 @@ class EvaluatorEngine:
                         resolved_pairs=resolved_pairs,
                         unique_keys=plan.unique_keys,
                         row_map=plan.row_map,
+                        logic_to_prev=logic_to_prev,
+                        remaining_all_and=remaining_all_and,
+                        remaining_all_or=remaining_all_or,
+                        threshold_cfg=threshold_cfg,
+                        threshold_rid=threshold_rid,
+                        op_fns=op_fns,
+                        resolved_exchange=resolved_exchange,
+                        alarm_cfg=alarm_cfg,
                     )
 
         summary.unique_requests = len(global_unique)
@@ -213,13 +630,37 @@ class EvaluatorEngine:
 
         fetch_results: Dict[RequestKey, FetchResult] = {}
 
-        for k in global_unique:
-            fr = self.cache.get_or_fetch(k, self.client.fetch_indicator)
+        if self.cfg.lazy_fetch:
+            first_keys: Dict[RequestKey, None] = {}
+            for (profile_id, gid, base_symbol), up in unit_plans.items():
+                if not up.group.conditions:
+                    continue
+                rid0 = up.group.conditions[0].rid
+                for side in ("left", "right"):
+                    k0 = up.row_map.get((profile_id, gid, rid0, base_symbol, side))
+                    if k0 is not None:
+                        first_keys[k0] = None
+            keys = list(first_keys)
+            print(f"[evaluator][DBG] lazy fetch: prefetch row0 keys={len(keys)} of unique={len(global_unique)}")
+        else:
+            keys = list(global_unique)
+        workers = min(max(1, int(self.cfg.fetch_workers or 1)), len(keys) or 1)
+
+        def _fetch(k: RequestKey) -> FetchResult:
+            return self.cache.get_or_fetch(k, self.client.fetch_indicator)
+
+        batch_size = int(self.cfg.fetch_batch_size or 0)
+        if batch_size > 0 and hasattr(self.client, "fetch_indicators_batch"):
+            results = self._fetch_batched(keys, batch_size=batch_size)
+        elif workers > 1:
+            print(f"[evaluator][DBG] fetch phase parallel keys={len(keys)} workers={workers}")
+            pool = self._pool("ne-fetch", max(1, int(self.cfg.fetch_workers or 1)))
+            results = list(pool.map(_fetch, keys))
+        else:
+            results = [_fetch(k) for k in keys]
+
+        for k, fr in zip(keys, results):
             fetch_results[k] = fr
-            if fr.ok:
-                summary.fetch_ok += 1
-            else:
-                summary.fetch_fail += 1
 
         # ──────────────────────────────────────────────
         # Evaluation Phase
@@ -231,16 +672,15 @@ class EvaluatorEngine:
         now_unix = time.time()
         now_ts = time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(now_unix))
 
-        for (profile_id, gid, base_symbol), up in unit_plans.items():
-            group = up.group
-            resolved_exchange = _resolve_exchange(group, self.cfg.defaults)
-
+        units: List[Tuple[Tuple[str, str, str], UnitPlan, StatusKey, StatusState]] = []
+        for unit_key, up in unit_plans.items():
+            profile_id, gid, base_symbol = unit_key
             status_key = StatusKey(
                 profile_id=profile_id,
                 gid=gid,
                 symbol=base_symbol,
-                exchange=resolved_exchange,
-                clock_interval=group.interval,
+                exchange=up.resolved_exchange,
+                clock_interval=up.group.interval,
             )
 
             st = self.store.load_status(status_key)
@@ -251,120 +691,49 @@ class EvaluatorEngine:
                     f"profile={profile_id} gid={gid} symbol={base_symbol}"
                 )
                 continue
-
-            cond_results = []
-            eval_conditions = []
-            last_row_left = None
-            last_row_right = None
-            last_row_op = None
-
-            for cond in group.conditions:
-                pair = up.resolved_pairs.get(cond.rid)
-                if pair is None:
-                    raise ValueError(
-                        f"missing resolved pair for rid={cond.rid} "
-                        f"profile={profile_id} gid={gid}"
-                    )
-
-                cr = eval_condition_row(
-                    profile_id=profile_id,
-                    gid=gid,
-                    base_symbol=base_symbol,
-                    cond=cond,
-                    pair=pair,
-                    row_map=up.row_map,
-                    fetch_results=fetch_results,
-                )
-
-                cond_results.append(cr)
-                eval_conditions.append(cond)
-
-                last_row_left = cr.left_value
-                last_row_right = cr.right_value
-                last_row_op = cr.op
-
-            chain = eval_chain(
-                cond_results,
-                logic_to_prev=_logic_to_prev(eval_conditions),
-            )
-
-            # ──────────────────────────────
-            # Tick detection
-            # ──────────────────────────────
-
-            tick_ts = None
-            if cond_results:
-                first = eval_conditions[0]
-                k_left = up.row_map.get(
-                    (profile_id, gid, first.rid, base_symbol, "left")
-                )
-                if k_left and fetch_results.get(k_left):
-                    tick_ts = fetch_results[k_left].latest_ts
-
-            tick_res = detect_new_tick(
-                skey=status_key,
-                state=st,
-                current_tick_ts=tick_ts,
-            )
-
-            # ──────────────────────────────
-            # Threshold
-            # ──────────────────────────────
-
-            threshold_cfg, threshold_rid = _pick_threshold_condition(
-                eval_conditions
-            )
-
-            threshold_target_state = chain.final_state
-
-            if threshold_rid is not None:
-                for cr in cond_results:
-                    if cr.rid == threshold_rid:
-                        threshold_target_state = cr.state
-                        break
-
-            thr = apply_threshold(
-                final_state=threshold_target_state,
-                new_tick=tick_res.new_tick,
-                cfg=threshold_cfg,
-                state=st,
-                now_ts=now_ts,
-            )
-
-            print(
-                f"[evaluator][DBG] threshold_strategy=last_condition_with_threshold "
-                f"rid={threshold_rid} "
-                f"target_state={threshold_target_state.value} "
-                f"passed={thr.passed}"
-            )
-
-            # ──────────────────────────────
-            # Alarm policy
-            # ──────────────────────────────
-
-            pol = apply_alarm_policy(
-                skey=status_key,
-                state=st,
-                cfg=_alarm_from_group(group),
-                now_ts=now_ts,
-                now_unix=now_unix,
-                partial_true=chain.partial_true,
-                final_state=chain.final_state,
-                threshold_passed=thr.passed,
-                last_row_left=last_row_left,
-                last_row_right=last_row_right,
-                last_row_op=last_row_op,
-            )
-
-            history_events.extend(pol.events)
-
-            if pol.push:
-                summary.pushes += 1
-
-            status_updates[status_key] = st
+            units.append((unit_key, up, status_key, st))
+
+        def _run_unit(u: Tuple[Tuple[str, str, str], UnitPlan, StatusKey, StatusState]) -> PolicyResult:
+            return self._eval_unit(u[0], u[1], u[2], u[3], fetch_results, now_ts, now_unix)
+
+        # per-unit event batches for on_events, handed over only after the commit
+        dispatch_batches: List[List[HistoryEvent]] = []
+
+        def _apply(outcomes) -> None:
+            # apply in plan order (deterministic history/status regardless of workers)
+            for (_, _, status_key, st), pol in zip(units, outcomes):
+                history_events.extend(pol.events)
+                if pol.push:
+                    summary.pushes += 1
+                status_updates[status_key] = st
+                if pol.events and self.on_events is not None:
+                    dispatch_batches.append(pol.events)
+
+        eval_cap = self._eval_workers()
+        eval_workers = min(eval_cap, len(units) or 1)
+        side_workers = int(self.cfg.fetch_workers or 1)
+        if self.cfg.lazy_fetch and side_workers > 1:
+            self._side_pool = self._pool("ne-side", side_workers)
+        try:
+            if eval_workers > 1:
+                print(f"[evaluator][DBG] eval phase parallel units={len(units)} workers={eval_workers}")
+                pool = self._pool("ne-eval", eval_cap)
+                _apply(pool.map(_run_unit, units))
+            else:
+                _apply(_run_unit(u) for u in units)
+        finally:
+            self._side_pool = None
 
         summary.events = len(history_events)
         summary.status_updates = len(status_updates)
+        # counted once at the end: covers prefetch and lazy (on-demand) fetches
+        summary.fetch_ok = sum(1 for fr in fetch_results.values() if fr.ok)
+        summary.fetch_fail = len(fetch_results) - summary.fetch_ok
+        summary.fetch_skipped = len(global_unique) - len(fetch_results)
+        summary.cache_hits = self.cache.stats.run_hit + self.cache.stats.ttl_hit - hits0
+        summary.cache_misses = self.cache.stats.miss - miss0
+        if summary.fetch_skipped:
+            print(f"[evaluator][DBG] lazy fetch: skipped_keys={summary.fetch_skipped}")
 
         self.store.commit(
             StoreCommit(
@@ -373,4 +742,12 @@ class EvaluatorEngine:
             )
         )
 
+        if dispatch_batches:
+            # single worker: batches go out in plan order, the next run is not blocked
+            pool = self._pool("ne-dispatch", 1)
+            for batch in dispatch_batches:
+                pool.submit(self._emit_events, batch)
+            print(f"[evaluator][DBG] dispatch queued batches={len(dispatch_batches)} after commit")
+
+        summary.elapsed_sec = time.perf_counter() - t_run
         return summary
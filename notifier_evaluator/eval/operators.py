@@ -23,12 +23,23 @@ def _is_nan(x: Any) -> bool:
         return False
 
 
+_isfinite = math.isfinite
+
+
 def _both_numeric(a: Any, b: Any) -> Tuple[Optional[float], Optional[float]]:
+    # fast path: FetchResult.latest_value ist fast immer schon ein endlicher float
+    if type(a) is float and type(b) is float and _isfinite(a) and _isfinite(b):
+        return a, b
     fa = safe_float(a)
     fb = safe_float(b)
     return fa, fb
 
 
+# shared immutable results: no tuple build per comparison
+_TRUE_OK: Tuple[TriState, str] = (TriState.TRUE, "ok")
+_FALSE_OK: Tuple[TriState, str] = (TriState.FALSE, "ok")
+
+
 def _unknown(reason: str) -> Tuple[TriState, str]:
     return TriState.UNKNOWN, reason
 
@@ -38,56 +49,73 @@ def _ok(state: TriState) -> bool:
 
 
 def op_gt(a: Any, b: Any) -> Tuple[TriState, str]:
+    if type(a) is float and type(b) is float and _isfinite(a) and _isfinite(b):
+        return _TRUE_OK if a > b else _FALSE_OK
     fa, fb = _both_numeric(a, b)
     if fa is None or fb is None:
         return _unknown("missing_numeric")
-    return (TriState.TRUE, "ok") if fa > fb else (TriState.FALSE, "ok")
+    return _TRUE_OK if fa > fb else _FALSE_OK
 
 
 def op_gte(a: Any, b: Any) -> Tuple[TriState, str]:
+    if type(a) is float and type(b) is float and _isfinite(a) and _isfinite(b):
+        return _TRUE_OK if a >= b else _FALSE_OK
     fa, fb = _both_numeric(a, b)
     if fa is None or fb is None:
         return _unknown("missing_numeric")
-    return (TriState.TRUE, "ok") if fa >= fb else (TriState.FALSE, "ok")
+    return _TRUE_OK if fa >= fb else _FALSE_OK
 
 
 def op_lt(a: Any, b: Any) -> Tuple[TriState, str]:
+    if type(a) is float and type(b) is float and _isfinite(a) and _isfinite(b):
+        return _TRUE_OK if a < b else _FALSE_OK
     fa, fb = _both_numeric(a, b)
     if fa is None or fb is None:
         return _unknown("missing_numeric")
-    return (TriState.TRUE, "ok") if fa < fb else (TriState.FALSE, "ok")
+    return _TRUE_OK if fa < fb else _FALSE_OK
 
 
 def op_lte(a: Any, b: Any) -> Tuple[TriState, str]:
+    if type(a) is float and type(b) is float and _isfinite(a) and _isfinite(b):
+        return _TRUE_OK if a <= b else _FALSE_OK
     fa, fb = _both_numeric(a, b)
     if fa is None or fb is None:
         return _unknown("missing_numeric")
-    return (TriState.TRUE, "ok") if fa <= fb else (TriState.FALSE, "ok")
+    return _TRUE_OK if fa <= fb else _FALSE_OK
 
 
 def op_eq(a: Any, b: Any) -> Tuple[TriState, str]:
     # eq: numeric if possible, else string compare
+    if type(a) is float and type(b) is float and _isfinite(a) and _isfinite(b):
+        return _TRUE_OK if a == b else _FALSE_OK
     fa, fb = _both_numeric(a, b)
     if fa is not None and fb is not None:
-        return (TriState.TRUE, "ok") if fa == fb else (TriState.FALSE, "ok")
+        return _TRUE_OK if fa == fb else _FALSE_OK
 
     # fallback: raw compare for simple types
     if a is None or b is None:
         return _unknown("missing_value")
     try:
-        return (TriState.TRUE, "ok") if a == b else (TriState.FALSE, "ok")
+        return _TRUE_OK if a == b else _FALSE_OK
     except Exception:
         return _unknown("compare_exc")
 
 
 def op_ne(a: Any, b: Any) -> Tuple[TriState, str]:
-    st, reason = op_eq(a, b)
-    if st == TriState.UNKNOWN:
-        return st, reason
-    return (TriState.FALSE, "ok") if st == TriState.TRUE else (TriState.TRUE, "ok")
+    if type(a) is float and type(b) is float and _isfinite(a) and _isfinite(b):
+        return _TRUE_OK if a != b else _FALSE_OK
+    res = op_eq(a, b)
+    # op_eq returns the shared tuples for decided results -> identity, no enum ==
+    if res is _TRUE_OK:
+        return _FALSE_OK
+    if res is _FALSE_OK:
+        return _TRUE_OK
+    return res
+
 
+OpFn = Callable[[Any, Any], Tuple[TriState, str]]
 
-OPS: dict[str, Callable[[Any, Any], Tuple[TriState, str]]] = {
+OPS: dict[str, OpFn] = {
     "gt": op_gt,
     "gte": op_gte,
     "lt": op_lt,
@@ -97,8 +125,28 @@ OPS: dict[str, Callable[[Any, Any], Tuple[TriState, str]]] = {
 }
 
 
-def apply_op(op: str, left: Any, right: Any) -> Tuple[TriState, str]:
-    fn = OPS.get((op or "").strip().lower())
+# every common spelling -> fn, built once at import: canonical (schema Literal) and
+# upper-case hit with one dict.get; anything else is stripped/lowered once more
+_OP_TABLE: dict[str, OpFn] = {**OPS, **{k.upper(): fn for k, fn in OPS.items()}}
+
+
+def resolve_op(op: str) -> Optional[OpFn]:
+    """
+    Resolve an op name to its function once (per condition definition),
+    so the per-row hot path skips the normalize + dict lookup.
+    """
+    fn = _OP_TABLE.get(op)
+    if fn is None and op:
+        fn = _OP_TABLE.get(op.strip().lower())
+    return fn
+
+
+def apply_op(op: str, left: Any, right: Any, *, fn: Optional[OpFn] = None) -> Tuple[TriState, str]:
+    """
+    fn: optional pre-resolved operator (see resolve_op); resolved from op otherwise.
+    """
+    if fn is None:
+        fn = resolve_op(op)
     if fn is None:
         return TriState.UNKNOWN, f"unknown_op:{op}"
     try:
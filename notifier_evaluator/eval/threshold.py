@@ -9,7 +9,7 @@ from notifier_evaluator.models.schema import ThresholdConfig
 from notifier_evaluator.models.runtime import StatusState, TriState
 
 
-@dataclass
+@dataclass(slots=True)
 class ThresholdResult:
     passed: bool
     reason: str
@@ -2,7 +2,9 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
 
+import threading
 import time
+from collections import deque
 from dataclasses import dataclass
 from typing import Callable, Dict, Optional, Tuple
 
@@ -17,9 +19,16 @@ from notifier_evaluator.models.runtime import FetchResult
 #
 # API:
 #   cache.get_or_fetch(key, fetch_fn) -> FetchResult
+#   cache.lookup(key) / cache.store(key, fr)   (batch fetch path)
 #
 # fetch_fn:
 #   Callable[[RequestKey], FetchResult]
+#
+# Thread-safety:
+#   get_or_fetch darf parallel (Engine fetch pool) aufgerufen werden.
+#   Cache-Buchhaltung läuft unter Lock, fetch_fn selbst OHNE Lock.
+#   Single-flight: parallele Misses auf denselben Key fetchen nur einmal,
+#   die übrigen warten auf das Ergebnis des ersten (inflight_hit).
 # ──────────────────────────────────────────────────────────────────────────────
 
 
@@ -31,21 +40,29 @@ class CacheStats:
     set: int = 0
     ttl_expired: int = 0
     purged: int = 0
+    evicted: int = 0
+    inflight_hit: int = 0
 
 
 class TTLCache:
     """
     Simple TTL cache: key -> (expires_ts, FetchResult)
 
-    NOTE:
-    - intentionally minimal (keine LRU eviction)
-    - ok für Start; wenn du später memory growth willst -> LRU/size cap.
+    Size cap via CLOCK (pseudo-LRU):
+    - hit setzt nur ein "referenced" bit (kein move_to_end / reorder)
+    - eviction: clock hand läuft über die deque, referenced -> bit löschen
+      und hinten anstellen, sonst evicten
+    - max_items <= 0 -> unbegrenzt (altes Verhalten)
     """
 
-    def __init__(self, ttl_sec_ok: int = 5, ttl_sec_fail: int = 1):
+    def __init__(self, ttl_sec_ok: int = 5, ttl_sec_fail: int = 1, max_items: int = 0):
         self.ttl_sec_ok = max(0, int(ttl_sec_ok))
         self.ttl_sec_fail = max(0, int(ttl_sec_fail))
+        self.max_items = max(0, int(max_items))
         self._data: Dict[RequestKey, Tuple[float, FetchResult]] = {}
+        self._ref: Dict[RequestKey, bool] = {}
+        self._hand: deque = deque()
+        self.evicted = 0
 
     def _ttl_for(self, val: FetchResult) -> int:
         # Failure TTL shorter to avoid "sticky" outages while still preventing storms.
@@ -71,15 +88,35 @@ class TTLCache:
         exp_ts, val = item
         now = time.time()
         if now <= exp_ts:
+            self._ref[key] = True
             return val, False
 
-        # expired
-        try:
-            del self._data[key]
-        except Exception:
-            pass
+        # expired (stale clock entry is skipped lazily)
+        self._drop(key)
         return None, True
 
+    def _drop(self, key: RequestKey) -> None:
+        self._data.pop(key, None)
+        self._ref.pop(key, None)
+
+    def _evict_one(self) -> None:
+        hand = self._hand
+        while hand:
+            k = hand.popleft()
+            if k not in self._data:
+                continue  # stale (expired/purged)
+            if self._ref.get(k):
+                self._ref[k] = False
+                hand.append(k)
+                continue
+            self._drop(k)
+            self.evicted += 1
+            return
+
+    def _compact_hand(self) -> None:
+        # drop stale/duplicate clock entries (keeps deque bounded)
+        self._hand = deque(self._data.keys())
+
     def set(self, key: RequestKey, val: FetchResult) -> None:
         if not self.enabled():
             return
@@ -87,6 +124,13 @@ class TTLCache:
         if ttl <= 0:
             return
         exp_ts = time.time() + ttl
+        if key not in self._data:
+            if self.max_items > 0 and len(self._data) >= self.max_items:
+                self._evict_one()
+            self._hand.append(key)
+            self._ref[key] = False
+            if len(self._hand) > 2 * max(len(self._data), 64):
+                self._compact_hand()
         self._data[key] = (exp_ts, val)
 
     def purge(self) -> int:
@@ -98,10 +142,9 @@ class TTLCache:
         now = time.time()
         dead = [k for k, (exp, _) in self._data.items() if now > exp]
         for k in dead:
-            try:
-                del self._data[k]
-            except Exception:
-                pass
+            self._drop(k)
+        if dead:
+            self._compact_hand()
         return len(dead)
 
     def size(self) -> int:
@@ -113,18 +156,78 @@ class FetchCache:
     Combines run_cache and ttl_cache.
     """
 
-    def __init__(self, ttl_sec: int = 5, ttl_sec_fail: int = 1, purge_every_sets: int = 200):
+    def __init__(
+        self,
+        ttl_sec: int = 5,
+        ttl_sec_fail: int = 1,
+        purge_every_sets: int = 200,
+        max_items: int = 0,
+    ):
         self.run_cache: Dict[RequestKey, FetchResult] = {}
-        self.ttl_cache = TTLCache(ttl_sec_ok=ttl_sec, ttl_sec_fail=ttl_sec_fail)
+        self.ttl_cache = TTLCache(ttl_sec_ok=ttl_sec, ttl_sec_fail=ttl_sec_fail, max_items=max_items)
         self.stats = CacheStats()
         self._purge_every_sets = max(0, int(purge_every_sets))
+        self._lock = threading.Lock()
+        self._inflight: Dict[RequestKey, threading.Event] = {}
 
     def reset_run_cache(self) -> None:
         """
         Call at start of each engine run.
         """
         print("[fetch.cache] reset_run_cache() prev_size=%d" % len(self.run_cache))
-        self.run_cache.clear()
+        with self._lock:
+            self.run_cache.clear()
+
+    def lookup(self, key: RequestKey, *, count_miss: bool = True) -> Optional[FetchResult]:
+        """
+        Cache-only lookup (run_cache, then ttl_cache). Counts a miss if neither hits
+        (count_miss=False: the caller counts it, e.g. only the single-flight owner).
+        """
+        with self._lock:
+            # 1) run_cache
+            fr = self.run_cache.get(key)
+            if fr is not None:
+                self.stats.run_hit += 1
+                print("[fetch.cache] RUN_HIT key=%s ok=%s" % (key.short(), fr.ok))
+                return fr
+
+            # 2) ttl_cache
+            fr2, expired = self.ttl_cache.get(key)
+            if expired:
+                self.stats.ttl_expired += 1
+                print("[fetch.cache] TTL_EXPIRED key=%s ttl_size=%d" % (key.short(), self.ttl_cache.size()))
+
+            if fr2 is not None:
+                self.stats.ttl_hit += 1
+                self.run_cache[key] = fr2
+                print("[fetch.cache] TTL_HIT key=%s ok=%s ttl_size=%d" % (key.short(), fr2.ok, self.ttl_cache.size()))
+                return fr2
+
+            if count_miss:
+                self.stats.miss += 1
+            return None
+
+    def store(self, key: RequestKey, fr: FetchResult) -> None:
+        """
+        Stores a fetched result in both caches.
+        """
+        with self._lock:
+            # set caches regardless of ok? -> yes, short fail TTL prevents storms on failing endpoints
+            self.run_cache[key] = fr
+            self.ttl_cache.set(key, fr)
+            self.stats.set += 1
+            self.stats.evicted = self.ttl_cache.evicted
+
+            # opportunistic purge (keeps cache from growing forever)
+            if self._purge_every_sets > 0 and (self.stats.set % self._purge_every_sets == 0):
+                removed = self.ttl_cache.purge()
+                self.stats.purged += removed
+                print("[fetch.cache] PURGE removed=%d ttl_size=%d" % (removed, self.ttl_cache.size()))
+
+            print(
+                "[fetch.cache] SET key=%s ok=%s err=%s ttl_size=%d run_size=%d"
+                % (key.short(), fr.ok, fr.error, self.ttl_cache.size(), len(self.run_cache))
+            )
 
     def get_or_fetch(self, key: RequestKey, fetch_fn: Callable[[RequestKey], FetchResult]) -> FetchResult:
         """
@@ -133,51 +236,49 @@ class FetchCache:
           2) ttl_cache (weak)
           3) fetch
         """
-        # 1) run_cache
-        fr = self.run_cache.get(key)
+        # a miss is counted once, by the worker that actually fetches (not by waiters)
+        fr = self.lookup(key, count_miss=False)
         if fr is not None:
-            self.stats.run_hit += 1
-            print("[fetch.cache] RUN_HIT key=%s ok=%s" % (key.short(), fr.ok))
             return fr
 
-        # 2) ttl_cache
-        fr2, expired = self.ttl_cache.get(key)
-        if expired:
-            self.stats.ttl_expired += 1
-            print("[fetch.cache] TTL_EXPIRED key=%s ttl_size=%d" % (key.short(), self.ttl_cache.size()))
-
-        if fr2 is not None:
-            self.stats.ttl_hit += 1
-            self.run_cache[key] = fr2
-            print("[fetch.cache] TTL_HIT key=%s ok=%s ttl_size=%d" % (key.short(), fr2.ok, self.ttl_cache.size()))
-            return fr2
-
-        # 3) fetch
-        self.stats.miss += 1
+        with self._lock:
+            fr = self.run_cache.get(key)  # stored between lookup() and here
+            if fr is not None:
+                self.stats.run_hit += 1
+                return fr
+            ev = self._inflight.get(key)
+            owner = ev is None
+            if owner:
+                ev = self._inflight[key] = threading.Event()
+                self.stats.miss += 1
+
+        if not owner:
+            # same key is being fetched by another worker -> wait for its result
+            ev.wait()
+            with self._lock:
+                fr = self.run_cache.get(key)
+                if fr is not None:
+                    self.stats.inflight_hit += 1
+                    print("[fetch.cache] INFLIGHT_HIT key=%s ok=%s" % (key.short(), fr.ok))
+                    return fr
+            # owner failed (exception) or run cache was reset -> fetch ourselves
+            return self.get_or_fetch(key, fetch_fn)
+
+        # 3) fetch (outside the lock -> parallel fetches don't serialize here)
         print("[fetch.cache] MISS key=%s (fetching...)" % key.short())
-
-        fr3 = fetch_fn(key)
-
-        # set caches regardless of ok? -> yes, short fail TTL prevents storms on failing endpoints
-        self.run_cache[key] = fr3
-        self.ttl_cache.set(key, fr3)
-        self.stats.set += 1
-
-        # opportunistic purge (keeps cache from growing forever)
-        if self._purge_every_sets > 0 and (self.stats.set % self._purge_every_sets == 0):
-            removed = self.ttl_cache.purge()
-            self.stats.purged += removed
-            print("[fetch.cache] PURGE removed=%d ttl_size=%d" % (removed, self.ttl_cache.size()))
-
-        print(
-            "[fetch.cache] SET key=%s ok=%s err=%s ttl_size=%d run_size=%d"
-            % (key.short(), fr3.ok, fr3.error, self.ttl_cache.size(), len(self.run_cache))
-        )
+        try:
+            fr3 = fetch_fn(key)
+            self.store(key, fr3)
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            ev.set()
         return fr3
 
     def summary(self) -> str:
         return (
             f"run_hit={self.stats.run_hit} ttl_hit={self.stats.ttl_hit} "
             f"miss={self.stats.miss} set={self.stats.set} ttl_expired={self.stats.ttl_expired} "
-            f"purged={self.stats.purged} ttl_size={self.ttl_cache.size()} run_size={len(self.run_cache)}"
+            f"purged={self.stats.purged} evicted={self.stats.evicted} inflight_hit={self.stats.inflight_hit} "
+            f"ttl_size={self.ttl_cache.size()} run_size={len(self.run_cache)}"
         )
@@ -3,17 +3,45 @@
 from __future__ import annotations
 
 import json
+import socket
 import time
-import urllib.error
 import urllib.parse
-import urllib.request
 import uuid
 from dataclasses import dataclass
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Tuple
 
 from notifier_evaluator.fetch.types import RequestKey, normalize_indicator_response
 from notifier_evaluator.models.runtime import FetchResult
 
+try:  # optional fast path; stdlib json stays the fallback
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
+
+try:  # optional: binary /indicator payloads (proxy answers msgpack only if asked)
+    import msgpack  # type: ignore
+except Exception:  # pragma: no cover
+    msgpack = None  # type: ignore
+
+_ACCEPT_INDICATOR = "application/msgpack, application/json;q=0.5" if msgpack is not None else "application/json"
+
+
+def _loads_body(raw: bytes) -> Any:
+    """Parse a JSON response body (orjson straight from bytes if available)."""
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # e.g. invalid UTF-8 -> lenient stdlib path below
+    return json.loads(raw.decode("utf-8", errors="replace"))
+
+
+def _loads_response(raw: bytes, content_type: str) -> Any:
+    """Parse a response body according to its Content-Type (msgpack or JSON)."""
+    if msgpack is not None and "msgpack" in (content_type or ""):
+        return msgpack.unpackb(raw, raw=False)
+    return _loads_body(raw)
+
 
 @dataclass
 class ClientConfig:
@@ -23,6 +51,9 @@ class ClientConfig:
     backoff: float = 0.3
     verify_ssl: bool = True
     endpoint_indicator: str = "/indicator"
+    endpoint_indicator_batch: str = "/indicator/batch"
+    # keep-alive pool size of the shared session (>= fetch workers)
+    max_connections: int = 32
 
 
 class IndicatorClient:
@@ -31,12 +62,74 @@ class IndicatorClient:
         self.base_url = (cfg.base_url or "").rstrip("/")
         if not self.base_url:
             raise ValueError("[fetch.client] base_url is empty")
-        print(f"[evaluator][DBG] fetch.client init base_url={self.base_url}")
+        self._http = self._make_session()
+        print(
+            f"[evaluator][DBG] fetch.client init base_url={self.base_url} "
+            f"pool={cfg.max_connections} retries={cfg.retries} backoff={cfg.backoff}"
+        )
+
+    def _make_session(self) -> Any:
+        """
+        One keep-alive requests.Session for all calls (same pattern as the proxy's
+        and the registry's sessions): connections are reused across fetches and runs
+        instead of one new TCP connection per /indicator call.
+        requests is imported on first use (like indicators/_utils.http_session).
+        """
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        class _NoDelayAdapter(HTTPAdapter):
+            def init_poolmanager(self, *args, **kwargs):
+                kwargs.setdefault("socket_options", [(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)])
+                return super().init_poolmanager(*args, **kwargs)
+
+        n = max(1, int(self.cfg.max_connections or 1))
+        tries = max(0, int(self.cfg.retries or 0))
+        # ClientConfig.retries/backoff: connect/read errors + transient statuses, GET only
+        # (a failed batch POST already falls back to single fetches)
+        retry = Retry(
+            total=tries, connect=tries, read=tries,
+            backoff_factor=max(0.0, float(self.cfg.backoff or 0.0)),
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["GET"]),
+            raise_on_status=False,
+        )
+        s = requests.Session()
+        ad = _NoDelayAdapter(max_retries=retry, pool_connections=4, pool_maxsize=n, pool_block=False)
+        s.mount("http://", ad)
+        s.mount("https://", ad)
+        s.verify = self.cfg.verify_ssl
+        s.headers.update({"Connection": "keep-alive"})
+        return s
+
+    def close(self) -> None:
+        self._http.close()
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Dict[str, str],
+        body: Optional[bytes] = None,
+    ) -> Tuple[int, str, bytes]:
+        """
+        One HTTP call -> (status_code, content_type, raw_body).
+        HTTP error statuses are returned, transport errors raise.
+        """
+        r = self._http.request(method, url, headers=headers, data=body, timeout=self.cfg.timeout_sec)
+        return r.status_code, r.headers.get("Content-Type", ""), r.content
 
     def _build_url(self) -> str:
         ep = self.cfg.endpoint_indicator if self.cfg.endpoint_indicator.startswith("/") else f"/{self.cfg.endpoint_indicator}"
         return f"{self.base_url}{ep}"
 
+    def _build_batch_url(self) -> str:
+        ep = self.cfg.endpoint_indicator_batch
+        ep = ep if ep.startswith("/") else f"/{ep}"
+        return f"{self.base_url}{ep}"
+
     def _build_params(self, key: RequestKey) -> Dict[str, Any]:
         out: Dict[str, Any] = {
             "name": key.indicator,
@@ -60,31 +153,79 @@ class IndicatorClient:
         params = self._build_params(key)
         query = urllib.parse.urlencode(params)
         url = f"{self._build_url()}?{query}"
-        t0 = time.time()
+        t0 = time.perf_counter()
         print(f"[evaluator][DBG] fetch req_id={req_id} url={url}")
 
         payload: Any
         status_code = 0
         try:
-            with urllib.request.urlopen(url, timeout=self.cfg.timeout_sec) as resp:
-                status_code = int(getattr(resp, "status", 200))
-                body = resp.read().decode("utf-8", errors="replace")
-                payload = json.loads(body)
-        except urllib.error.HTTPError as e:
-            status_code = e.code
-            body = e.read().decode("utf-8", errors="replace") if hasattr(e, "read") else str(e)
-            try:
-                payload = json.loads(body)
-            except Exception:
-                payload = {"ok": False, "error": f"http_{status_code}", "text": body}
+            status_code, ctype, raw = self._request("GET", url, headers={"Accept": _ACCEPT_INDICATOR})
+            if status_code < 400:
+                payload = _loads_response(raw, ctype)
+            else:
+                try:
+                    payload = _loads_body(raw)
+                except Exception:
+                    payload = {"ok": False, "error": f"http_{status_code}", "text": raw.decode("utf-8", errors="replace")}
         except Exception as e:
             payload = {"ok": False, "error": f"request_exc:{e}", "rows": []}
 
-        dt = time.time() - t0
+        dt = time.perf_counter() - t0
         if isinstance(payload, dict):
             payload.setdefault("_http", {})
             payload["_http"].update({"req_id": req_id, "status_code": status_code, "elapsed_sec": dt, "url": url})
             if status_code and status_code != 200:
                 payload.setdefault("ok", False)
                 payload.setdefault("error", f"http_{status_code}")
-        return normalize_indicator_response(payload, key=key)
\ No newline at end of file
+        return normalize_indicator_response(payload, key=key)
+
+    def fetch_indicators_batch(self, keys: List[RequestKey]) -> Dict[RequestKey, FetchResult]:
+        """
+        One POST for many keys (proxy endpoint /indicator/batch).
+
+        Returns only the keys the proxy answered; on transport errors / missing
+        endpoint the dict is empty and the caller falls back to fetch_indicator().
+        """
+        if not keys:
+            return {}
+        req_id = uuid.uuid4().hex[:8]
+        items = [dict(self._build_params(k), id=str(i)) for i, k in enumerate(keys)]
+        if orjson is not None:
+            body = orjson.dumps({"items": items})
+        else:
+            body = json.dumps({"items": items}, separators=(",", ":")).encode("utf-8")
+        url = self._build_batch_url()
+        t0 = time.perf_counter()
+        print(f"[evaluator][DBG] fetch batch req_id={req_id} url={url} items={len(items)}")
+
+        try:
+            status_code, _, raw = self._request(
+                "POST",
+                url,
+                headers={"Content-Type": "application/json", "X-Request-ID": req_id},
+                body=body,
+            )
+            if status_code >= 400:
+                raise RuntimeError(f"http_{status_code}")
+            payload = _loads_body(raw)
+        except Exception as e:
+            print(f"[evaluator][DBG] fetch batch req_id={req_id} failed -> fallback: {type(e).__name__}: {e}")
+            return {}
+
+        dt = time.perf_counter() - t0
+        results = payload.get("results") if isinstance(payload, dict) else None
+        if not isinstance(results, dict):
+            print(f"[evaluator][DBG] fetch batch req_id={req_id} bad payload -> fallback")
+            return {}
+
+        out: Dict[RequestKey, FetchResult] = {}
+        for i, k in enumerate(keys):
+            item = results.get(str(i))
+            if item is None:
+                continue
+            if isinstance(item, dict):
+                item.setdefault("_http", {})
+                item["_http"].update({"req_id": req_id, "status_code": 200, "elapsed_sec": dt, "url": url, "batch": True})
+            out[k] = normalize_indicator_response(item, key=k)
+        print(f"[evaluator][DBG] fetch batch req_id={req_id} answered={len(out)}/{len(keys)} dt={dt:.3f}s")
+        return out
@@ -5,7 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Set, Tuple
 
-from notifier_evaluator.fetch.types import RequestKey
+from notifier_evaluator.fetch.types import RequestKey, stable_json_cached
 from notifier_evaluator.models.schema import Condition
 from notifier_evaluator.models.runtime import ResolvedPair, RowSide
 
@@ -43,6 +43,25 @@ def _safe_count(x: Optional[int]) -> int:
         return 1
 
 
+def _params_json_memo(params: Optional[Dict], memo: Optional[Dict[int, str]]) -> str:
+    """
+    stable_json(params) memoized by id(params).
+    The params dicts belong to the (live) profile models for the whole run,
+    so the same dict is serialized once instead of once per symbol.
+    Misses go through the content cache (stable_json_cached), which also
+    hits across runs after the profiles were reloaded.
+    """
+    if not params:
+        return "{}"
+    if memo is None:
+        return stable_json_cached(params)
+    pj = memo.get(id(params))
+    if pj is None:
+        pj = stable_json_cached(params)
+        memo[id(params)] = pj
+    return pj
+
+
 def plan_requests_for_symbol(
     *,
     profile_id: str,
@@ -52,11 +71,14 @@ def plan_requests_for_symbol(
     resolved_pairs: Dict[str, ResolvedPair],
     mode: str = "latest",
     as_of: Optional[str] = None,
+    params_json_memo: Optional[Dict[int, str]] = None,
 ) -> PlanResult:
     """
     Plan requests for ONE (profile_id, gid, base_symbol) evaluation unit.
 
     resolved_pairs: dict[rid] -> ResolvedPair
+    params_json_memo: optional per-run memo id(params) -> params_json
+      (only valid while the profile objects are alive, i.e. one engine run)
     """
     mode2 = (mode or "latest").strip() or "latest"
     as_of2 = (as_of.strip() if isinstance(as_of, str) else as_of)
@@ -100,6 +122,7 @@ def plan_requests_for_symbol(
             count=left_count,
             mode=mode2,
             as_of=as_of2,
+            params_json=_params_json_memo(cond.left.params, params_json_memo),
         )
 
         map_key_left = (profile_id, gid, rid, base_symbol, RowSide.LEFT.value)
@@ -121,6 +144,7 @@ def plan_requests_for_symbol(
             count=right_count,
             mode=mode2,
             as_of=as_of2,
+            params_json=_params_json_memo(cond.right.params, params_json_memo),
         )
 
         map_key_right = (profile_id, gid, rid, base_symbol, RowSide.RIGHT.value)
@@ -5,10 +5,17 @@ from __future__ import annotations
 import json
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
+from math import isfinite
 from typing import Any, Dict, List, Optional, Tuple
 
 from notifier_evaluator.models.runtime import FetchResult, ResolvedContext, safe_float
 
+try:  # optional fast path; stdlib json stays the fallback
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
+
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Fetch Types
@@ -38,14 +45,38 @@ class RequestKey:
     mode: str = "latest"
     as_of: Optional[str] = None
 
+    # Keys are looked up many times per run (run_cache, ttl_cache, fetch_results,
+    # debug prints) -> hash and short() are computed once per instance and memoized
+    # in the instance __dict__ (not dataclass fields: no effect on eq/repr).
+    def __hash__(self) -> int:
+        try:
+            return self.__dict__["_hash"]
+        except KeyError:
+            h = hash(
+                (self.indicator, self.symbol, self.interval, self.exchange,
+                 self.params_json, self.output, self.count, self.mode, self.as_of)
+            )
+            object.__setattr__(self, "_hash", h)
+            return h
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # str hashes are salted per process -> never pickle the memo
+        return {k: v for k, v in self.__dict__.items() if k not in ("_hash", "_short")}
+
     def short(self) -> str:
+        try:
+            return self.__dict__["_short"]
+        except KeyError:
+            pass
         # Keep it readable, but include enough to disambiguate.
         # params_json can be huge -> show length only.
         pj_len = len(self.params_json or "")
-        return (
+        out = (
             f"{self.indicator} {self.symbol} {self.interval} {self.exchange} "
             f"out={self.output} c={self.count} m={self.mode} asof={self.as_of or '-'} pjson={pj_len}"
         )
+        object.__setattr__(self, "_short", out)
+        return out
 
     @staticmethod
     def from_parts(
@@ -57,7 +88,12 @@ class RequestKey:
         count: int,
         mode: str = "latest",
         as_of: Optional[str] = None,
+        params_json: Optional[str] = None,
     ) -> "RequestKey":
+        """
+        params_json: optional pre-serialized stable_json(params) (planner memo);
+        computed here if not given.
+        """
         ind = (str(indicator).strip() if indicator is not None else "").strip()
         sym = (str(ctx.symbol).strip() if ctx.symbol is not None else "").strip()
         itv = (str(ctx.interval).strip() if ctx.interval is not None else "").strip()
@@ -79,7 +115,8 @@ class RequestKey:
             print(f"[fetch.types] WARN mode=as_of but as_of missing -> keeping as_of=None (server decides)")
             ao = None
 
-        params_json = stable_json(params or {})
+        if params_json is None:
+            params_json = stable_json(params or {})
 
         # Loud sanity debug (you WANT this while developing)
         print(
@@ -101,26 +138,69 @@ class RequestKey:
 
     def params(self) -> Dict[str, Any]:
         try:
+            if orjson is not None:
+                return orjson.loads(self.params_json or "{}")
             return json.loads(self.params_json or "{}")
         except Exception as e:
             print(f"[fetch.types] WARN params_json decode failed err={e} json_len={len(self.params_json or '')}")
             return {}
 
 
+_ENC_STABLE = json.JSONEncoder(sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode
+
+
 def stable_json(obj: Dict[str, Any]) -> str:
     """
     Stable JSON for hashing/deduping.
     - sort keys
     - compact separators
     """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj or {}, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:
+            pass  # unsupported type -> stdlib path below (incl. __raw__ fallback)
     try:
-        return json.dumps(obj or {}, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+        return _ENC_STABLE(obj or {})
     except Exception as e:
         # if unserializable: fallback to string-ified dict (still stable-ish)
         print(f"[fetch.types] WARN stable_json unserializable err={e} -> fallback __raw__")
         return json.dumps({"__raw__": str(obj)}, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
 
 
+def params_key(params: Optional[Dict[str, Any]]) -> Optional[Tuple[Any, ...]]:
+    """
+    Hashable content key for a flat params dict: ((key, type(value), value), ...).
+    type() is part of the key so 1 / 1.0 / True stay distinct.
+    None if the dict is nested / has unhashable values or unsortable keys.
+    """
+    try:
+        key = tuple((k, type(v), v) for k, v in sorted(params.items()))
+        hash(key)
+        return key
+    except (TypeError, AttributeError):
+        return None
+
+
+@lru_cache(maxsize=2048)
+def _stable_json_for_key(key: Tuple[Any, ...]) -> str:
+    return stable_json({k: v for k, _, v in key})
+
+
+def stable_json_cached(params: Optional[Dict[str, Any]]) -> str:
+    """
+    stable_json(params), memoized by content for flat dicts (typical indicator
+    params like {"length": 14}) -> survives profile reloads between runs.
+    Nested/unhashable params go straight to stable_json.
+    """
+    if not params:
+        return "{}"
+    key = params_key(params)
+    if key is None:
+        return stable_json(params)
+    return _stable_json_for_key(key)
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # Response normalization helpers
 # ──────────────────────────────────────────────────────────────────────────────
@@ -175,27 +255,27 @@ def normalize_indicator_response(
             rows = payload.get("rows") or []
             cols = payload.get("columns")
             series = _normalize_rows(rows, cols)
-            series = _maybe_sort_series(series)
-            return _from_series(series, key=key, meta={"shape": "dict_rows"})
+            series, by_ts = _maybe_sort_series(series)
+            return _from_series(series, key=key, meta={"shape": "dict_rows"}, by_ts=by_ts)
 
         # shape B: list[dict] rows
         if isinstance(payload, list):
             series = _normalize_rows(payload, None)
-            series = _maybe_sort_series(series)
-            return _from_series(series, key=key, meta={"shape": "list_rows"})
+            series, by_ts = _maybe_sort_series(series)
+            return _from_series(series, key=key, meta={"shape": "list_rows"}, by_ts=by_ts)
 
         # shape C: dict but no "rows" - maybe {"data": [...]} or {"series": [...]}
         if isinstance(payload, dict):
             for cand in ("data", "series", "values"):
                 if cand in payload and isinstance(payload.get(cand), list):
                     series = _normalize_rows(payload.get(cand), payload.get("columns"))
-                    series = _maybe_sort_series(series)
-                    return _from_series(series, key=key, meta={"shape": f"dict_{cand}"})
+                    series, by_ts = _maybe_sort_series(series)
+                    return _from_series(series, key=key, meta={"shape": f"dict_{cand}"}, by_ts=by_ts)
 
             # maybe it’s a single point dict -> treat as one-row series
             series = _normalize_rows([payload], None)
-            series = _maybe_sort_series(series)
-            return _from_series(series, key=key, meta={"shape": "dict_single"})
+            series, by_ts = _maybe_sort_series(series)
+            return _from_series(series, key=key, meta={"shape": "dict_single"}, by_ts=by_ts)
 
         # unknown
         return FetchResult(
@@ -241,19 +321,25 @@ def _normalize_rows(rows: List[Any], columns: Optional[List[str]]) -> List[Dict[
     return out
 
 
+_TS_KEYS: Tuple[str, ...] = ("timestamp", "ts", "time", "date", "datetime")
+
+
 def _extract_ts_from_row(row: Dict[str, Any]) -> Optional[str]:
-    for k in ("timestamp", "ts", "time", "date", "datetime"):
-        if k in row and row.get(k) is not None:
+    for k in _TS_KEYS:
+        v = row.get(k)
+        if v is not None:
             try:
-                return str(row.get(k))
+                return str(v)
             except Exception:
                 return None
     return None
 
 
+@lru_cache(maxsize=4096)
 def _parse_ts_best_effort(ts: str) -> Optional[float]:
     """
     Best-effort parse to epoch for sorting.
+    Pure -> cached per unique string (sort + latest-row pick re-parse the same ts).
     Supports:
       - epoch seconds (int/str)
       - epoch ms (heuristic)
@@ -291,52 +377,92 @@ def _parse_ts_best_effort(ts: str) -> Optional[float]:
         return None
 
 
-def _maybe_sort_series(series: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+def _row_epoch(row: Dict[str, Any]) -> Optional[float]:
+    """
+    Epoch of a row's timestamp; same result as
+    _parse_ts_best_effort(_extract_ts_from_row(row)).
+    Numeric epochs (the usual API shape) are compared as numbers directly:
+    no str() per row and no lru entry per unique bar.
+    """
+    for k in _TS_KEYS:
+        v = row.get(k)
+        if v is None:
+            continue
+        t = type(v)
+        # str(v) of these is plain digits (no exponent) -> identical to the string path
+        if t is int or (t is float and (v == 0.0 or 1e-4 <= abs(v) < 1e16)):
+            n = float(v)
+            return n / 1000.0 if n > 10_000_000_000 else n
+        try:
+            ts = str(v)
+        except Exception:
+            return None
+        return _parse_ts_best_effort(ts) if ts else None
+    return None
+
+
+def _maybe_sort_series(series: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], bool]:
     """
     If we can parse timestamps in the series, sort by ts ascending.
     Otherwise keep original order (API order).
+    Returns (series, by_ts); by_ts=True means ascending by ts, unknowns at the end.
     """
     if not series:
-        return series
+        return series, False
 
     # find ts for a few rows; if none parseable, skip sorting
-    parsed: List[Tuple[float, int]] = []
-    for i, row in enumerate(series[:50]):  # don't scan huge lists
-        ts = _extract_ts_from_row(row)
-        if not ts:
-            continue
-        ep = _parse_ts_best_effort(ts)
-        if ep is None:
-            continue
-        parsed.append((ep, i))
+    # (streaming probe: stop at the first parseable ts, no candidate list)
+    any_parsed = False
+    for i in range(min(len(series), 50)):  # don't scan huge lists
+        if _row_epoch(series[i]) is not None:
+            any_parsed = True
+            break
 
-    if not parsed:
-        return series
+    if not any_parsed:
+        return series, False
 
     def _k(idx_row: Tuple[int, Dict[str, Any]]) -> Tuple[int, float, int]:
         idx, row = idx_row
-        ts = _extract_ts_from_row(row)
-        ep = _parse_ts_best_effort(ts) if ts else None
+        ep = _row_epoch(row)
         if ep is None:
             return (1, 0.0, idx)  # unknowns at end, stable
         return (0, float(ep), idx)
 
-    sorted_series = [row for _, row in sorted(list(enumerate(series)), key=_k)]
-    return sorted_series
+    keys = [_k(ir) for ir in enumerate(series)]
+    # APIs liefern fast immer schon aufsteigend -> kein sort + keine neue Liste
+    if all(keys[i] <= keys[i + 1] for i in range(len(keys) - 1)):
+        return series, True
+    order = sorted(range(len(series)), key=keys.__getitem__)
+    return [series[i] for i in order], True
 
 
-def _pick_latest_row(series: List[Dict[str, Any]]) -> Dict[str, Any]:
+def _pick_latest_row(series: List[Dict[str, Any]], *, by_ts: bool = False) -> Dict[str, Any]:
     """
     Pick the best "latest" row.
     - If timestamps parseable: pick max epoch ts
     - else: fallback to last row (API order)
+    by_ts=True (series from _maybe_sort_series): scan from the end only.
     """
     best_row: Optional[Dict[str, Any]] = None
     best_ep: Optional[float] = None
 
+    if by_ts:
+        # ascending, unknowns at the end -> last parseable row is the max;
+        # keep walking over equal ts so ties resolve to the first one (as below)
+        for row in reversed(series):
+            ep = _row_epoch(row)
+            if ep is None:
+                if best_ep is None:
+                    continue
+                break
+            if best_ep is not None and ep != best_ep:
+                break
+            best_ep = ep
+            best_row = row
+        series = []
+
     for row in series or []:
-        ts = _extract_ts_from_row(row)
-        ep = _parse_ts_best_effort(ts) if ts else None
+        ep = _row_epoch(row)
         if ep is None:
             continue
         if best_ep is None or ep > best_ep:
@@ -350,32 +476,44 @@ def _pick_latest_row(series: List[Dict[str, Any]]) -> Dict[str, Any]:
     return (series[-1] if series else {}) or {}
 
 
-def _from_series(series: List[Dict[str, Any]], *, key: RequestKey, meta: Dict[str, Any]) -> FetchResult:
+_VALUE_FALLBACK_COLS: Tuple[str, ...] = ("value", "close", "Close", "price", "Price")
+
+
+@lru_cache(maxsize=512)
+def _value_priority(output: Optional[str]) -> Tuple[str, ...]:
+    """Column lookup order for one output (deduped once, reused for every row)."""
+    if not output:
+        return _VALUE_FALLBACK_COLS
+    return tuple(dict.fromkeys((output,) + _VALUE_FALLBACK_COLS))
+
+
+def _pick_value_from_row(row: Dict[str, Any], cols: Tuple[str, ...]) -> Optional[float]:
+    for c in cols:
+        v = row.get(c)
+        if v is None:
+            continue
+        if type(v) is float:  # common case, inlined (no call frame)
+            if isfinite(v):
+                return v
+            continue
+        val = safe_float(v)
+        if val is not None:
+            return val
+    return None
+
+
+def _from_series(series: List[Dict[str, Any]], *, key: RequestKey, meta: Dict[str, Any], by_ts: bool = False) -> FetchResult:
     if not series:
         return FetchResult(ok=False, latest_value=None, latest_ts=None, error="empty_series", meta={"key": key.short(), **meta})
 
     # pick best latest row (not blindly last)
-    last = _pick_latest_row(series) or {}
+    last = _pick_latest_row(series, by_ts=by_ts) or {}
 
     # timestamp candidates
     ts = _extract_ts_from_row(last)
 
-    # value candidates:
-    # if output provided, prefer that
-    val = None
-    if key.output:
-        try:
-            val = safe_float(last.get(key.output))
-        except Exception:
-            val = None
-
-    if val is None:
-        # try common fields
-        for k in ("value", "close", "Close", "price", "Price"):
-            if k in last:
-                val = safe_float(last.get(k))
-                if val is not None:
-                    break
+    # value candidates: output first (if provided), then common fields
+    val = _pick_value_from_row(last, _value_priority(key.output or None))
 
     ok = val is not None
     fr = FetchResult(
@@ -79,7 +79,7 @@ def validate_timestamp(ts: Optional[str], context: str = "") -> None:
         _fail_or_warn(f"{context}Invalid timestamp: {ts!r}")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ResolvedContext:
     """Runtime-only resolved context."""
     symbol: str
@@ -96,13 +96,13 @@ class ResolvedContext:
         validate_interval(self.clock_interval, "ResolvedContext.clock_interval: ")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ResolvedPair:
     left: ResolvedContext
     right: ResolvedContext
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StatusKey:
     """Key für Status/Cooldown/Tick State."""
     profile_id: str
@@ -122,7 +122,7 @@ class StatusKey:
         validate_interval(self.clock_interval, "StatusKey.clock_interval: ")
 
 
-@dataclass
+@dataclass(slots=True)
 class FetchResult:
     """Normalisierte Antwort aus price_api / indicator client."""
     ok: bool
@@ -145,7 +145,7 @@ class FetchResult:
                         _fail_or_warn(f"FetchResult.series[{i}] items must be dictionaries")
 
 
-@dataclass
+@dataclass(slots=True)
 class ConditionResult:
     rid: str
     state: TriState
@@ -166,7 +166,7 @@ class ConditionResult:
             _fail_or_warn("ConditionResult.right_value must be a finite number")
 
 
-@dataclass
+@dataclass(slots=True)
 class ChainResult:
     partial_true: bool
     final_state: TriState
@@ -281,7 +281,7 @@ class StatusState:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HistoryEvent:
     ts: str
     profile_id: str
@@ -329,9 +329,17 @@ def is_nan(x: Any) -> bool:
         return False
 
 
+_NUMERIC_TYPES = (int, float)
+
+
 def safe_float(x: Any) -> Optional[float]:
     """Convert to float safely."""
     try:
+        # fast path: JSON decoders yield exact int/float (no subclasses) -> no MRO walk;
+        # inside the try: float() of a huge int raises OverflowError
+        if type(x) in _NUMERIC_TYPES:
+            fx = float(x)
+            return fx if math.isfinite(fx) else None
         if x is None:
             return None
         fx = float(x)
@@ -2,11 +2,18 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
 
+import hashlib
 import json
 import os
+import sys
 import threading
-from dataclasses import asdict
-from typing import Any, Dict, List, Optional
+from dataclasses import fields
+from typing import Any, Dict, List, Optional, Tuple
+
+try:  # optional fast path; stdlib json stays the fallback
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
 
 from notifier_evaluator.models.runtime import HistoryEvent, StatusKey, StatusState, TriState
 from notifier_evaluator.state.store import StateStore, StoreCommit
@@ -24,17 +31,88 @@ from notifier_evaluator.state.store import StateStore, StoreCommit
 #   history.json:
 #     [ {HistoryEvent dict}, ... ]
 #
+#   status.json.ndjson (delta log):
+#     {"key": "<StatusKey str>", "state": {StatusState dict}}  (one line per change)
+#     Readers apply it on top of status.json. The full snapshot is rewritten
+#     every `snapshot_every` commits; the delta log is truncated afterwards.
+#
 # NOTE:
 # - For multi-process you need OS file locks. This is in-process only.
 # - Good enough for first version; upgrade later if evaluator runs in multiple processes.
 # ──────────────────────────────────────────────────────────────────────────────
 
+# HistoryEvent hat nur flache Felder + zwei flache Dicts -> kein rekursives asdict() nötig
+_EVENT_FIELDS: Tuple[str, ...] = tuple(f.name for f in fields(HistoryEvent))
+_EVENT_DICT_FIELDS = ("threshold_snapshot", "debug")
+
+
+_ENC_COMPACT = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+
+# wiederkehrende Identifier in history.json (5000 Events, wenige distinct Werte)
+_HIST_INTERN_FIELDS = ("profile_id", "gid", "symbol", "exchange", "event", "final_state", "rid", "op")
+
+
+def _intern_history(items: Any) -> Any:
+    """
+    Interniert die Identifier-Felder frisch geparster History-Events in-place:
+    ein str-Objekt pro distinct Wert statt eines pro Event (RSS, Hash-Caching).
+    """
+    if not isinstance(items, list):
+        return items
+    intern = sys.intern
+    for d in items:
+        if not isinstance(d, dict):
+            continue
+        for name in _HIST_INTERN_FIELDS:
+            v = d.get(name)
+            if type(v) is str:
+                d[name] = intern(v)
+    return items
+
+
+def _event_to_dict(e: HistoryEvent) -> Dict[str, Any]:
+    d = {name: getattr(e, name) for name in _EVENT_FIELDS}
+    for name in _EVENT_DICT_FIELDS:
+        d[name] = dict(d[name] or {})
+    return d
+
+
+# StatusState ebenfalls flach: Skalare + count_window (Liste) + last_debug (Dict).
+# asdict() kopiert beides rekursiv pro Unit und Commit; last_debug wird nur als
+# Ganzes ersetzt (update_state) bzw. geleert -> eine Ebene Kopie reicht.
+_STATUS_FIELDS: Tuple[str, ...] = tuple(f.name for f in fields(StatusState))
+
+
+def _status_to_dict(st: StatusState) -> Dict[str, Any]:
+    d = {name: getattr(st, name) for name in _STATUS_FIELDS}
+    d["count_window"] = list(d["count_window"] or [])
+    d["last_debug"] = dict(d["last_debug"] or {})
+    return d
+
 
 class JsonStore(StateStore):
-    def __init__(self, *, status_path: str, history_path: str):
+    def __init__(self, *, status_path: str, history_path: str, snapshot_every: int = 1, pretty: bool = False):
         self.status_path = status_path
+        # status/history are machine-read -> compact by default (indent=2 doubles bytes + encode time)
+        self.pretty = bool(pretty)
+        self.status_delta_path = status_path + ".ndjson"
         self.history_path = history_path
+        self.snapshot_every = max(1, int(snapshot_every or 1))
+        self._commits_since_snapshot = 0
         self._lock = threading.Lock()
+        # path -> blake2b digest of the last payload this store wrote
+        # (change detection: identical content is not rewritten)
+        self._last_digest: Dict[str, bytes] = {}
+        # path -> ((st_mtime_ns, st_size), parsed top-level container)
+        # unchanged file -> no re-parse; callers get a shallow copy
+        self._read_cache: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+        # ((snapshot sig, delta-log sig), replayed status dict): load_status runs once
+        # per unit -> the delta log is replayed once per change, not once per unit
+        self._status_cache: Optional[Tuple[Tuple[Any, Any], Dict[str, Any]]] = None
+        # keys first seen in load_status: materialized with the next commit
+        # (one delta append per run instead of one fsync per new key)
+        self._pending_init: Dict[str, Dict[str, Any]] = {}
 
         os.makedirs(os.path.dirname(status_path) or ".", exist_ok=True)
         os.makedirs(os.path.dirname(history_path) or ".", exist_ok=True)
@@ -51,14 +129,13 @@ class JsonStore(StateStore):
 
     def load_status(self, key: StatusKey) -> StatusState:
         with self._lock:
-            data = self._read_json(self.status_path, default={})
+            data = self._read_status()
             sk = self._key_to_str(key)
             raw = data.get(sk)
             if not isinstance(raw, dict):
                 st = StatusState()
-                data[sk] = asdict(st)
-                # write back (so status is materialized)
-                self._atomic_write_json(self.status_path, data)
+                # materialized by the next commit (batched with the run's other changes)
+                self._pending_init.setdefault(sk, _status_to_dict(st))
                 print("[json_store] load_status init key=%s" % sk)
                 return st
 
@@ -81,32 +158,45 @@ class JsonStore(StateStore):
         he = commit.history_events or []
 
         with self._lock:
-            status_data = self._read_json(self.status_path, default={})
+            status_data = self._read_status()
             history_data = self._read_json(self.history_path, default=[])
 
-            if not isinstance(status_data, dict):
-                print("[json_store] WARN status_data not dict -> reset")
-                status_data = {}
             if not isinstance(history_data, list):
                 print("[json_store] WARN history_data not list -> reset")
                 history_data = []
 
-            # apply status updates
+            # apply status updates (only changed keys go to the delta log)
+            changed: Dict[str, Dict[str, Any]] = {}
             for k, st in su.items():
                 ks = self._key_to_str(k)
-                status_data[ks] = asdict(st)
+                new = _status_to_dict(st)
+                if status_data.get(ks) != new:
+                    changed[ks] = new
+                status_data[ks] = new
+
+            # new keys the engine did not update (e.g. skipped units) still get persisted
+            pending, self._pending_init = self._pending_init, {}
+            for ks, new in pending.items():
+                if ks not in status_data:
+                    changed[ks] = new
+                    status_data[ks] = new
 
             # append history
-            for e in he:
-                history_data.append(asdict(e))
+            history_data.extend(_event_to_dict(e) for e in he)
 
             # optional: cap history (keep last N)
             MAX_HIST = 5000
             if len(history_data) > MAX_HIST:
                 history_data = history_data[-MAX_HIST:]
 
-            self._atomic_write_json(self.status_path, status_data)
-            self._atomic_write_json(self.history_path, history_data)
+            if changed:
+                self._commits_since_snapshot += 1
+                if self._commits_since_snapshot >= self.snapshot_every:
+                    self._write_status_snapshot(status_data)
+                else:
+                    self._append_status_deltas(changed, status_data)
+            if he:
+                self._atomic_write_json(self.history_path, history_data)
 
         print("[json_store] COMMIT status_updates=%d history_events=%d" % (len(su), len(he)))
 
@@ -133,7 +223,7 @@ class JsonStore(StateStore):
 
     def stats(self) -> Dict[str, int]:
         with self._lock:
-            sd = self._read_json(self.status_path, default={})
+            sd = self._read_status()
             hd = self._read_json(self.history_path, default=[])
         return {"status": len(sd) if isinstance(sd, dict) else 0, "history": len(hd) if isinstance(hd, list) else 0}
 
@@ -143,24 +233,145 @@ class JsonStore(StateStore):
         # stable serialization
         return f"{k.profile_id}::{k.gid}::{k.symbol}::{k.exchange}::{k.clock_interval}"
 
+    def _read_status(self) -> Dict[str, Any]:
+        """
+        status.json snapshot + replay of the ndjson delta log (last line wins).
+        Cached on both file signatures; callers get a shallow copy.
+        """
+        sig = (self._stat_sig_or_none(self.status_path), self._stat_sig_or_none(self.status_delta_path))
+        hit = self._status_cache
+        if hit is not None and hit[0] == sig:
+            return dict(hit[1])
+
+        data = self._read_json(self.status_path, default={})
+        if not isinstance(data, dict):
+            print("[json_store] WARN status_data not dict -> reset")
+            data = {}
+        try:
+            with open(self.status_delta_path, "r", encoding="utf-8") as f:
+                n = 0
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        rec = orjson.loads(line) if orjson is not None else json.loads(line)
+                    except Exception:
+                        # torn last line after a crash -> ignore
+                        print("[json_store] WARN bad delta line skipped path=%s" % self.status_delta_path)
+                        continue
+                    if isinstance(rec, dict) and isinstance(rec.get("state"), dict):
+                        data[str(rec.get("key"))] = rec["state"]
+                        n += 1
+            if n:
+                print("[json_store] status deltas replayed n=%d" % n)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print("[json_store] READ_FAIL path=%s err=%s -> snapshot only" % (self.status_delta_path, e))
+        self._status_cache = (sig, data)
+        return dict(data)
+
+    def _append_status_deltas(self, changed: Dict[str, Dict[str, Any]], status_data: Dict[str, Any]) -> None:
+        """
+        Appends the changed keys; status_data (snapshot + all deltas incl. these)
+        becomes the replay cache for the new delta-log signature.
+        """
+        if orjson is not None:
+            payload = b"".join(orjson.dumps({"key": ks, "state": st}) + b"\n" for ks, st in changed.items())
+        else:
+            payload = "".join(
+                json.dumps({"key": ks, "state": st}, ensure_ascii=False, separators=(",", ":")) + "\n"
+                for ks, st in changed.items()
+            ).encode("utf-8")
+        with open(self.status_delta_path, "ab") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        self._status_cache = (
+            (self._stat_sig_or_none(self.status_path), self._stat_sig_or_none(self.status_delta_path)),
+            status_data,
+        )
+        print("[json_store] status deltas appended n=%d" % len(changed))
+
+    def _write_status_snapshot(self, status_data: Dict[str, Any]) -> None:
+        # snapshot first, then drop the (now folded-in) delta log
+        self._atomic_write_json(self.status_path, status_data)
+        try:
+            os.remove(self.status_delta_path)
+        except FileNotFoundError:
+            pass
+        self._commits_since_snapshot = 0
+
+    @staticmethod
+    def _stat_sig(path: str) -> Tuple[int, int]:
+        st = os.stat(path)
+        return (st.st_mtime_ns, st.st_size)
+
+    @classmethod
+    def _stat_sig_or_none(cls, path: str) -> Optional[Tuple[int, int]]:
+        try:
+            return cls._stat_sig(path)
+        except FileNotFoundError:
+            return None
+
+    @staticmethod
+    def _shallow_copy(obj: Any) -> Any:
+        # callers only replace/append top-level entries, never mutate nested dicts
+        if isinstance(obj, dict):
+            return dict(obj)
+        if isinstance(obj, list):
+            return list(obj)
+        return obj
+
     def _read_json(self, path: str, default):
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            sig = self._stat_sig(path)
+            hit = self._read_cache.get(path)
+            if hit is not None and hit[0] == sig:
+                return self._shallow_copy(hit[1])
+            with open(path, "rb") as f:
+                raw = f.read()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw.decode("utf-8"))
+            if path == self.history_path:
+                data = _intern_history(data)
+            self._read_cache[path] = (sig, data)
+            return self._shallow_copy(data)
         except FileNotFoundError:
+            self._read_cache.pop(path, None)
             return default
         except Exception as e:
             print("[json_store] READ_FAIL path=%s err=%s -> default" % (path, e))
             return default
 
+    def _dumps(self, obj: Any) -> bytes:
+        if orjson is not None:
+            try:
+                opt = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if self.pretty else 0)
+                return orjson.dumps(obj, option=opt)
+            except TypeError:
+                pass  # exotic types -> stdlib
+        if self.pretty:
+            return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+        return _ENC_COMPACT(obj).encode("utf-8")
+
     def _atomic_write_json(self, path: str, obj) -> None:
+        payload = self._dumps(obj)
+        digest = hashlib.blake2b(payload, digest_size=16).digest()
+        if self._last_digest.get(path) == digest and os.path.exists(path):
+            print("[json_store] write skipped (unchanged) path=%s" % path)
+            return
+
         tmp = path + ".tmp"
         try:
-            with open(tmp, "w", encoding="utf-8") as f:
-                json.dump(obj, f, ensure_ascii=False, indent=2)
+            with open(tmp, "wb") as f:
+                f.write(payload)
                 f.flush()
                 os.fsync(f.fileno())
             os.replace(tmp, path)
+            self._last_digest[path] = digest
+            # prime the read cache with what we just wrote (no re-parse next read)
+            self._read_cache[path] = (self._stat_sig(path), self._shallow_copy(obj))
         except Exception as e:
             print("[json_store] WRITE_FAIL path=%s err=%s" % (path, e))
             try:
@@ -238,9 +449,9 @@ class JsonStore(StateStore):
         st.last_final_state = self._parse_tristate(d.get("last_final_state", TriState.UNKNOWN))
 
         # timestamps: keep tolerant (string/float/None). Don't force parse here.
-        st.last_true_ts = d.get("last_true_ts", None)
-        st.last_push_ts = d.get("last_push_ts", None)
-        st.last_tick_ts = d.get("last_tick_ts", None)
+        st.last_true_ts = d.get("last_true_ts")
+        st.last_push_ts = d.get("last_push_ts")
+        st.last_tick_ts = d.get("last_tick_ts")
 
         st.last_reason = d.get("last_reason", "") or ""
         st.last_debug = d.get("last_debug", {}) or {}
@@ -274,13 +485,13 @@ class JsonStore(StateStore):
             symbol=str(d.get("symbol", "")),
             exchange=str(d.get("exchange", "")),
             event=str(d.get("event", "")),
-            partial_true=d.get("partial_true", None),
-            final_state=d.get("final_state", None),
-            threshold_passed=d.get("threshold_passed", None),
-            rid=d.get("rid", None),
-            left_value=d.get("left_value", None),
-            right_value=d.get("right_value", None),
-            op=d.get("op", None),
+            partial_true=d.get("partial_true"),
+            final_state=d.get("final_state"),
+            threshold_passed=d.get("threshold_passed"),
+            rid=d.get("rid"),
+            left_value=d.get("left_value"),
+            right_value=d.get("right_value"),
+            op=d.get("op"),
             threshold_snapshot=d.get("threshold_snapshot", {}) or {},
             debug=d.get("debug", {}) or {},
         )
@@ -0,0 +1,411 @@
+# notifier_evaluator/tests/test_engine.py
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+from typing import Dict, List
+
+from notifier_evaluator.context.group_expander import TTLGroupExpander
+from notifier_evaluator.eval.engine import EngineConfig, EvaluatorEngine, _logic_to_prev, _short_circuit_tables
+from notifier_evaluator.fetch.types import RequestKey
+from notifier_evaluator.models.runtime import FetchResult, TriState
+from notifier_evaluator.models.schema import EngineDefaults, Profile
+from notifier_evaluator.state.memory_store import MemoryStore
+
+
+class FakeClient:
+    """Returns a fixed value per indicator name and records every fetch."""
+
+    def __init__(self, values: Dict[str, float]):
+        self.values = values
+        self.calls: List[RequestKey] = []
+
+    def fetch_indicator(self, key: RequestKey) -> FetchResult:
+        self.calls.append(key)
+        return FetchResult(
+            ok=True,
+            latest_value=self.values[key.indicator],
+            latest_ts="2024-01-01T00:00:00Z",
+        )
+
+
+def make_profile(logics: List[str], deactivate_on: str = "always_on") -> Profile:
+    """Helper to build a one-group profile with conditions `left_i gt right_i`."""
+    conditions = []
+    for i, logic in enumerate(logics):
+        conditions.append(
+            {
+                "rid": f"r{i}",
+                "logic": logic,
+                "left": {"name": f"left{i}", "output": "value"},
+                "op": "gt",
+                "right": {"name": f"right{i}", "output": "value"},
+            }
+        )
+    return Profile.model_validate(
+        {
+            "id": "p1",
+            "groups": [
+                {
+                    "gid": "g1",
+                    "symbols": ["BTCUSDT"],
+                    "exchange": "binance",
+                    "interval": "1h",
+                    "deactivate_on": deactivate_on,
+                    "conditions": conditions,
+                }
+            ],
+        }
+    )
+
+
+def run_engine(profile: Profile, values: Dict[str, float], **cfg) -> MemoryStore:
+    store = MemoryStore()
+    engine = EvaluatorEngine(
+        cfg=EngineConfig(defaults=EngineDefaults(), **cfg),
+        store=store,
+        group_expander=TTLGroupExpander(),
+        client=FakeClient(values),
+    )
+    engine.run([profile])
+    return store
+
+
+def test_short_circuit_tables():
+    """Test the reverse-pass remaining-logic tables."""
+    profile = make_profile(["and", "and", "or", "or"])
+    all_and, all_or = _short_circuit_tables(_logic_to_prev(profile.groups[0].conditions))
+    assert all_and == [False, False, False, True]
+    assert all_or == [False, True, True, True]
+
+
+def test_short_circuit_keeps_chain_result(capsys):
+    """FALSE then TRUE followed only by AND rows decides the chain; later rows are stubs."""
+    profile = make_profile(["and", "and", "and"])
+    values = {"left0": 1.0, "right0": 2.0, "left1": 3.0, "right1": 1.0, "left2": 3.0, "right2": 1.0}
+    store = run_engine(profile, values, short_circuit=True)
+
+    (state,) = store._status.values()
+    assert state.last_final_state == TriState.FALSE
+    assert state.last_partial_true is True
+    assert "short_circuit" in capsys.readouterr().out
+
+
+def test_short_circuit_keeps_partial_true_exact(capsys):
+    """A FALSE row before any TRUE row never exits early: later TRUE rows still set partial_true."""
+    profile = make_profile(["and", "and", "and"])
+    values = {"left0": 1.0, "right0": 2.0, "left1": 3.0, "right1": 1.0, "left2": 3.0, "right2": 1.0}
+    states = []
+    for short_circuit in (True, False):
+        (state,) = run_engine(profile, values, short_circuit=short_circuit)._status.values()
+        states.append((state.last_final_state, state.last_partial_true))
+
+    assert states[0] == states[1] == (TriState.FALSE, True)
+
+
+def test_short_circuit_respects_pre_notification(capsys):
+    """Under pre_notification a later TRUE row must still set partial_true."""
+    profile = make_profile(["and", "and"], deactivate_on="pre_notification")
+    values = {"left0": 1.0, "right0": 2.0, "left1": 3.0, "right1": 1.0}
+    store = run_engine(profile, values, short_circuit=True)
+
+    (state,) = store._status.values()
+    assert state.last_partial_true is True
+    assert "short_circuit" not in capsys.readouterr().out
+
+
+def test_parallel_fetch_fetches_each_key_once():
+    """The parallel fetch phase must fetch every unique key exactly once."""
+    profile = make_profile(["and", "or", "and"])
+    values = {"left0": 3.0, "right0": 1.0, "left1": 1.0, "right1": 2.0, "left2": 3.0, "right2": 1.0}
+    client = FakeClient(values)
+    engine = EvaluatorEngine(
+        cfg=EngineConfig(defaults=EngineDefaults(), fetch_workers=4),
+        store=MemoryStore(),
+        group_expander=TTLGroupExpander(),
+        client=client,
+    )
+    engine.run([profile])
+
+    assert len(client.calls) == len(set(client.calls)) == 6
+
+
+class FakeBatchClient(FakeClient):
+    """FakeClient with a batch endpoint that answers all but the listed indicators."""
+
+    def __init__(self, values: Dict[str, float], unanswered: tuple = ()):
+        super().__init__(values)
+        self.unanswered = set(unanswered)
+        self.batches: List[List[RequestKey]] = []
+
+    def fetch_indicators_batch(self, keys: List[RequestKey]) -> Dict[RequestKey, FetchResult]:
+        self.batches.append(list(keys))
+        return {
+            k: FetchResult(ok=True, latest_value=self.values[k.indicator], latest_ts="2024-01-01T00:00:00Z")
+            for k in keys
+            if k.indicator not in self.unanswered
+        }
+
+
+def test_batch_fetch_chunks_misses_and_falls_back():
+    """Misses are batched in chunks; keys the batch skipped are fetched singly."""
+    profile = make_profile(["and", "and"])
+    values = {"left0": 3.0, "right0": 1.0, "left1": 3.0, "right1": 1.0}
+    client = FakeBatchClient(values, unanswered=("right1",))
+    store = MemoryStore()
+    engine = EvaluatorEngine(
+        cfg=EngineConfig(defaults=EngineDefaults(), fetch_batch_size=3),
+        store=store,
+        group_expander=TTLGroupExpander(),
+        client=client,
+    )
+    summary = engine.run([profile])
+
+    assert sorted(len(b) for b in client.batches) == [1, 3]
+    assert [k.indicator for k in client.calls] == ["right1"]
+    assert summary.fetch_ok == 4
+    (state,) = store._status.values()
+    assert state.last_final_state == TriState.TRUE
+
+
+def test_lazy_fetch_skips_short_circuited_rows():
+    """With lazy_fetch, rows after a deciding FALSE (with a TRUE row seen) are never fetched."""
+    profile = make_profile(["and", "and", "and", "and"])
+    values = {
+        "left0": 1.0, "right0": 2.0, "left1": 3.0, "right1": 1.0,
+        "left2": 3.0, "right2": 1.0, "left3": 3.0, "right3": 1.0,
+    }
+    client = FakeClient(values)
+    engine = EvaluatorEngine(
+        cfg=EngineConfig(defaults=EngineDefaults(), lazy_fetch=True, short_circuit=True),
+        store=MemoryStore(),
+        group_expander=TTLGroupExpander(),
+        client=client,
+    )
+    summary = engine.run([profile])
+
+    assert sorted(k.indicator for k in client.calls) == ["left0", "left1", "left3", "right0", "right1", "right3"]
+    assert summary.fetch_skipped == 2
+
+
+def test_short_circuit_event_values_come_from_last_declared_row():
+    """Events carry left/right/op of the declared last row, with or without short-circuit/reorder."""
+    profile = make_profile(["and", "and", "and", "and"], deactivate_on="pre_notification")
+    values = {
+        "left0": 1.0, "right0": 2.0, "left1": 3.0, "right1": 1.0,
+        "left2": 4.0, "right2": 1.0, "left3": 5.0, "right3": 1.5,
+    }
+    seen = []
+    for cfg in ({"short_circuit": False}, {"short_circuit": True}, {"short_circuit": True, "reorder_by_cost": True}):
+        store = run_engine(profile, values, **cfg)
+        seen.append([(e.event, e.partial_true, e.left_value, e.right_value, e.op) for e in store._history])
+
+    assert seen[0] == seen[1] == seen[2]
+    assert seen[0] and seen[0][0][2:] == (5.0, 1.5, "gt")
+
+
+def test_parallel_eval_matches_sequential():
+    """eval_workers > 1 yields the same status as the sequential eval."""
+    profile = make_profile(["and", "or", "and"])
+    values = {"left0": 3.0, "right0": 1.0, "left1": 1.0, "right1": 2.0, "left2": 3.0, "right2": 1.0}
+    states = []
+    for workers in (1, 4):
+        store = MemoryStore()
+        EvaluatorEngine(
+            cfg=EngineConfig(defaults=EngineDefaults(), eval_workers=workers, lazy_fetch=True),
+            store=store,
+            group_expander=TTLGroupExpander(),
+            client=FakeClient(values),
+        ).run([profile])
+        (state,) = store._status.values()
+        states.append((state.last_final_state, state.last_partial_true))
+
+    assert states[0] == states[1]
+
+
+def test_on_events_dispatched_after_commit():
+    """After the commit, the on_events hook sees every event the store received, per unit, off the run thread."""
+    import threading
+
+    profile = make_profile(["and"], deactivate_on="pre_notification")
+    store = MemoryStore()
+    dispatched: List[list] = []
+    threads = set()
+
+    def hook(evs):
+        threads.add(threading.current_thread().name.split("_")[0])
+        dispatched.append(list(evs))
+
+    engine = EvaluatorEngine(
+        cfg=EngineConfig(defaults=EngineDefaults()),
+        store=store,
+        group_expander=TTLGroupExpander(),
+        client=FakeClient({"left0": 3.0, "right0": 1.0}),
+        on_events=hook,
+    )
+    engine.run([profile])
+    engine.close()
+
+    assert dispatched
+    assert [e for batch in dispatched for e in batch] == store._history
+    assert threads == {"ne-dispatch"}
+
+
+def test_on_events_not_called_when_commit_fails():
+    """Events are dispatched only after the store commit succeeded."""
+    import pytest
+
+    class FailingStore(MemoryStore):
+        def commit(self, commit):
+            raise OSError("disk full")
+
+    profile = make_profile(["and"], deactivate_on="pre_notification")
+    dispatched: List[list] = []
+    engine = EvaluatorEngine(
+        cfg=EngineConfig(defaults=EngineDefaults()),
+        store=FailingStore(),
+        group_expander=TTLGroupExpander(),
+        client=FakeClient({"left0": 3.0, "right0": 1.0}),
+        on_events=dispatched.append,
+    )
+    with pytest.raises(OSError):
+        engine.run([profile])
+    engine.close()
+
+    assert dispatched == []
+
+
+def test_short_circuit_can_be_disabled(capsys):
+    """short_circuit=False evaluates every row and yields the same chain result."""
+    profile = make_profile(["and", "and", "and"])
+    values = {"left0": 1.0, "right0": 2.0, "left1": 3.0, "right1": 1.0, "left2": 3.0, "right2": 1.0}
+    client = FakeClient(values)
+    store = MemoryStore()
+    EvaluatorEngine(
+        cfg=EngineConfig(defaults=EngineDefaults(), short_circuit=False, lazy_fetch=True),
+        store=store,
+        group_expander=TTLGroupExpander(),
+        client=client,
+    ).run([profile])
+
+    (state,) = store._status.values()
+    assert state.last_final_state == TriState.FALSE
+    assert len(client.calls) == 6
+    assert "short_circuit" not in capsys.readouterr().out
+    # opt-in: the default config evaluates every row
+    assert EngineConfig(defaults=EngineDefaults()).short_circuit is False
+
+
+def test_reorder_by_cost_evaluates_cheap_rows_first():
+    """Uniform AND chain: the cheap FALSE row runs before the expensive one and short-circuits it."""
+    profile = make_profile(["and", "and", "and"])
+    values = {"left0": 3.0, "right0": 1.0, "left1": 3.0, "right1": 1.0, "left2": 1.0, "right2": 2.0}
+    client = FakeClient(values)
+    store = MemoryStore()
+    engine = EvaluatorEngine(
+        cfg=EngineConfig(defaults=EngineDefaults(), lazy_fetch=True, reorder_by_cost=True, short_circuit=True),
+        store=store,
+        group_expander=TTLGroupExpander(),
+        client=client,
+    )
+    engine._cost_ema.update({"left1": 5.0, "right1": 5.0, "left2": 0.01, "right2": 0.01})
+    engine.run([profile])
+
+    assert sorted(k.indicator for k in client.calls) == ["left0", "left2", "right0", "right2"]
+    (state,) = store._status.values()
+    assert state.last_final_state == TriState.FALSE
+
+
+def test_lazy_fetch_fetches_both_sides_of_a_row_concurrently():
+    """Lazy rows with both sides missing use the side pool; results match the sequential run."""
+    import threading
+
+    profile = make_profile(["and", "and"])
+    values = {"left0": 3.0, "right0": 1.0, "left1": 3.0, "right1": 1.0}
+    seen_threads = set()
+
+    class ThreadClient(FakeClient):
+        def fetch_indicator(self, key: RequestKey) -> FetchResult:
+            seen_threads.add((key.indicator, threading.current_thread().name.startswith("ne-side")))
+            return super().fetch_indicator(key)
+
+    store = MemoryStore()
+    client = ThreadClient(values)
+    EvaluatorEngine(
+        cfg=EngineConfig(defaults=EngineDefaults(), lazy_fetch=True, fetch_workers=2),
+        store=store,
+        group_expander=TTLGroupExpander(),
+        client=client,
+    ).run([profile])
+
+    assert ("right1", True) in seen_threads
+    assert len(client.calls) == 4
+    (state,) = store._status.values()
+    assert state.last_final_state == TriState.TRUE
+
+
+def test_worker_pools_are_reused_across_runs():
+    """Fetch/eval pools are created once per engine, not per run."""
+    profile = make_profile(["and", "or"])
+    values = {"left0": 3.0, "right0": 1.0, "left1": 1.0, "right1": 2.0}
+    engine = EvaluatorEngine(
+        cfg=EngineConfig(defaults=EngineDefaults(), fetch_workers=4, eval_workers=2, fetch_ttl_sec=0),
+        store=MemoryStore(),
+        group_expander=TTLGroupExpander(),
+        client=FakeClient(values),
+    )
+    engine.run([profile])
+    pools = dict(engine._pools)
+    engine.run([profile])
+
+    assert pools and engine._pools == pools
+    engine.close()
+    assert engine._pools == {}
+
+
+def test_eval_workers_auto_follows_fetch_workers_with_lazy_fetch():
+    """eval_workers=0 runs lazy units in parallel (fetch_workers) and stays sequential otherwise."""
+    profile = make_profile(["and"])
+    profile.groups[0].symbols = ["BTCUSDT", "ETHUSDT", "SOLUSDT"]
+    values = {"left0": 3.0, "right0": 1.0}
+    pools = []
+    for lazy in (True, False):
+        engine = EvaluatorEngine(
+            cfg=EngineConfig(defaults=EngineDefaults(), eval_workers=0, fetch_workers=3, lazy_fetch=lazy),
+            store=MemoryStore(),
+            group_expander=TTLGroupExpander(),
+            client=FakeClient(values),
+        )
+        engine.run([profile])
+        pools.append("ne-eval" in engine._pools)
+        engine.close()
+
+    assert pools == [True, False]
+
+
+
+def test_row_debug_off_keeps_result_and_drops_debug():
+    """row_debug=False yields the same row state without building the debug dict."""
+    from notifier_evaluator.context.resolver import resolve_contexts
+    from notifier_evaluator.eval.condition_eval import eval_condition_row
+
+    profile = make_profile(["and"])
+    group = profile.groups[0]
+    cond = group.conditions[0]
+    pair, _ = resolve_contexts(profile=profile, group=group, cond=cond, defaults=EngineDefaults(), base_symbol="BTCUSDT")
+    row_map = {}
+    fetch_results = {}
+    for side, ctx, value in (("left", pair.left, 3.0), ("right", pair.right, 1.0)):
+        key = RequestKey.from_parts(indicator=f"{side}0", ctx=ctx, params={}, output="value", count=1)
+        row_map[("p1", "g1", cond.rid, "BTCUSDT", side)] = key
+        fetch_results[key] = FetchResult(ok=True, latest_value=value, latest_ts="2024-01-01T00:00:00Z")
+
+    rows = [
+        eval_condition_row(
+            profile_id="p1", gid="g1", base_symbol="BTCUSDT", cond=cond, pair=pair,
+            row_map=row_map, fetch_results=fetch_results, row_debug=row_debug,
+        )
+        for row_debug in (True, False)
+    ]
+
+    assert rows[0].state == rows[1].state == TriState.TRUE
+    assert rows[0].debug and rows[1].debug == {}
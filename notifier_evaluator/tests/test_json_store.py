@@ -0,0 +1,133 @@
+# notifier_evaluator/tests/test_json_store.py
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import os
+
+from notifier_evaluator.models.runtime import StatusKey, TriState
+from notifier_evaluator.state.json_store import JsonStore
+from notifier_evaluator.state.store import StoreCommit
+
+
+def make_key(symbol: str = "BTCUSDT") -> StatusKey:
+    """Helper to create a StatusKey."""
+    return StatusKey(
+        profile_id="p1",
+        gid="g1",
+        symbol=symbol,
+        exchange="binance",
+        clock_interval="1h",
+    )
+
+
+def test_status_deltas_replay_until_snapshot(tmp_path):
+    """Changed status goes to the ndjson delta log and is folded into the snapshot later."""
+    status_path = str(tmp_path / "status.json")
+    store = JsonStore(status_path=status_path, history_path=str(tmp_path / "history.json"), snapshot_every=2)
+    key = make_key()
+
+    st = store.load_status(key)
+    st.last_final_state = TriState.TRUE
+    store.commit(StoreCommit(status_updates={key: st}, history_events=[]))
+
+    assert os.path.exists(store.status_delta_path)
+    # a fresh store instance (restart) sees the delta on top of the snapshot
+    reopened = JsonStore(status_path=status_path, history_path=str(tmp_path / "history.json"))
+    assert reopened.load_status(key).last_final_state == TriState.TRUE
+
+    st.last_final_state = TriState.FALSE
+    store.commit(StoreCommit(status_updates={key: st}, history_events=[]))
+
+    assert not os.path.exists(store.status_delta_path)
+    assert store.load_status(key).last_final_state == TriState.FALSE
+
+
+def test_unchanged_status_is_not_rewritten(tmp_path):
+    """A commit without status changes leaves status.json untouched."""
+    status_path = str(tmp_path / "status.json")
+    store = JsonStore(status_path=status_path, history_path=str(tmp_path / "history.json"))
+    key = make_key()
+
+    st = store.load_status(key)
+    st.streak_current = 3
+    store.commit(StoreCommit(status_updates={key: st}, history_events=[]))
+    mtime = os.stat(status_path).st_mtime_ns
+
+    store.commit(StoreCommit(status_updates={key: st}, history_events=[]))
+    assert os.stat(status_path).st_mtime_ns == mtime
+
+
+def test_read_cache_sees_external_rewrite(tmp_path):
+    """The mtime/size read cache must not hide a file replaced by another writer."""
+    status_path = str(tmp_path / "status.json")
+    store = JsonStore(status_path=status_path, history_path=str(tmp_path / "history.json"))
+    key = make_key()
+
+    st = store.load_status(key)
+    st.streak_current = 1
+    store.commit(StoreCommit(status_updates={key: st}, history_events=[]))
+
+    other = JsonStore(status_path=status_path, history_path=str(tmp_path / "history.json"))
+    st2 = other.load_status(key)
+    st2.streak_current = 42
+    other.commit(StoreCommit(status_updates={key: st2}, history_events=[]))
+
+    assert store.load_status(key).streak_current == 42
+
+
+def test_new_status_keys_are_written_on_commit(tmp_path):
+    """load_status of unknown keys does not touch disk; the next commit persists them in one go."""
+    status_path = str(tmp_path / "status.json")
+    store = JsonStore(status_path=status_path, history_path=str(tmp_path / "history.json"), snapshot_every=5)
+    keys = [make_key(sym) for sym in ("BTCUSDT", "ETHUSDT", "SOLUSDT")]
+
+    for k in keys:
+        store.load_status(k)
+    assert not os.path.exists(store.status_delta_path)
+
+    store.commit(StoreCommit(status_updates={}, history_events=[]))
+    with open(store.status_delta_path, "r", encoding="utf-8") as f:
+        assert len(f.readlines()) == 3
+
+
+def test_history_identifiers_are_interned_on_read(tmp_path):
+    """Re-parsed history events share one str object per distinct identifier."""
+    history_path = tmp_path / "history.json"
+    history_path.write_text(
+        '[{"ts": "t1", "profile_id": "p1", "gid": "g1", "symbol": "BTCUSDT", "exchange": "binance", "event": "eval"},'
+        ' {"ts": "t2", "profile_id": "p1", "gid": "g1", "symbol": "BTCUSDT", "exchange": "binance", "event": "eval"}]',
+        encoding="utf-8",
+    )
+    store = JsonStore(status_path=str(tmp_path / "status.json"), history_path=str(history_path))
+
+    a, b = store.load_history(limit=10)
+    assert (a.profile_id, a.symbol, a.event) == ("p1", "BTCUSDT", "eval")
+    assert a.symbol is b.symbol and a.gid is b.gid
+
+
+def test_status_delta_replay_is_cached(tmp_path, capsys):
+    """The delta log is replayed once per change, not once per load_status call."""
+    status_path = str(tmp_path / "status.json")
+    history_path = str(tmp_path / "history.json")
+    store = JsonStore(status_path=status_path, history_path=history_path, snapshot_every=5)
+    keys = [make_key(sym) for sym in ("BTCUSDT", "ETHUSDT", "SOLUSDT")]
+
+    states = {k: store.load_status(k) for k in keys}
+    for st in states.values():
+        st.streak_current = 2
+    store.commit(StoreCommit(status_updates=states, history_events=[]))
+    capsys.readouterr()
+
+    # own append -> cache already up to date
+    assert [store.load_status(k).streak_current for k in keys] == [2, 2, 2]
+    assert "deltas replayed" not in capsys.readouterr().out
+
+    # another writer appends -> replayed exactly once, then cached again
+    other = JsonStore(status_path=status_path, history_path=history_path, snapshot_every=5)
+    st = other.load_status(keys[0])
+    st.streak_current = 7
+    other.commit(StoreCommit(status_updates={keys[0]: st}, history_events=[]))
+    capsys.readouterr()
+
+    assert [store.load_status(k).streak_current for k in keys] == [7, 2, 2]
+    assert capsys.readouterr().out.count("deltas replayed") == 1
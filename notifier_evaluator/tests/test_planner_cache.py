@@ -0,0 +1,118 @@
+# notifier_evaluator/tests/test_planner_cache.py
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+from notifier_evaluator.fetch.cache import TTLCache
+from notifier_evaluator.fetch.planner import plan_requests_for_symbol
+from notifier_evaluator.fetch.types import RequestKey, stable_json, stable_json_cached
+from notifier_evaluator.models.runtime import FetchResult, ResolvedContext, ResolvedPair
+from notifier_evaluator.models.schema import Condition
+
+
+def make_condition() -> Condition:
+    """Helper to create a condition with params on the left side only."""
+    return Condition.model_validate(
+        {
+            "rid": "r1",
+            "left": {"name": "ema", "output": "value", "params": {"length": 20, "source": "close"}},
+            "op": "gt",
+            "right": {"name": "value", "output": "value"},
+        }
+    )
+
+
+def make_pair(symbol: str) -> ResolvedPair:
+    """Helper to create a resolved pair for one symbol."""
+    ctx = ResolvedContext(symbol=symbol, interval="1h", exchange="binance", clock_interval="1h")
+    return ResolvedPair(left=ctx, right=ctx)
+
+
+def test_params_json_memo_serializes_once_per_params_dict():
+    """The same params dict is serialized once across symbols and yields identical params_json."""
+    cond = make_condition()
+    memo = {}
+    keys = []
+    for symbol in ("BTCUSDT", "ETHUSDT"):
+        plan = plan_requests_for_symbol(
+            profile_id="p1",
+            gid="g1",
+            base_symbol=symbol,
+            rows=[cond],
+            resolved_pairs={"r1": make_pair(symbol)},
+            params_json_memo=memo,
+        )
+        keys.extend(plan.unique_keys)
+
+    assert list(memo.values()) == [stable_json(cond.left.params)]
+    left_keys = [k for k in keys if k.indicator == "ema"]
+    assert len(left_keys) == 2
+    assert all(k.params_json == stable_json(cond.left.params) for k in left_keys)
+    assert all(k.params_json == "{}" for k in keys if k.indicator == "value")
+
+
+def test_ttl_cache_clock_eviction_keeps_referenced_keys():
+    """With a size cap, a recently hit key survives while an unreferenced one is evicted."""
+    cache = TTLCache(ttl_sec_ok=60, max_items=2)
+    k1, k2, k3 = (
+        RequestKey.from_parts(indicator="ema", ctx=make_pair(s).left, params={}, output="value", count=1)
+        for s in ("A", "B", "C")
+    )
+    fr = FetchResult(ok=True, latest_value=1.0, latest_ts="2024-01-01T00:00:00Z")
+    cache.set(k1, fr)
+    cache.set(k2, fr)
+    assert cache.get(k1) == (fr, False)
+
+    cache.set(k3, fr)
+
+    assert cache.size() == 2
+    assert cache.get(k1)[0] is fr
+    assert cache.get(k2) == (None, False)
+    assert cache.evicted == 1
+
+
+def test_stable_json_cached_matches_stable_json():
+    """The content cache returns the same JSON and keeps 1 / 1.0 / True apart."""
+    for params in ({"length": 14, "source": "close"}, {"length": 1}, {"length": 1.0}, {"length": True}, {"a": {"b": [1]}}):
+        assert stable_json_cached(params) == stable_json(params)
+    assert stable_json_cached({}) == "{}"
+
+
+def test_fetch_cache_single_flight_fetches_concurrent_misses_once():
+    """Parallel misses on one key share a single fetch; waiters count as inflight hits."""
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    from notifier_evaluator.fetch.cache import FetchCache
+
+    cache = FetchCache(ttl_sec=0, ttl_sec_fail=0)
+    key = RequestKey.from_parts(indicator="ema", ctx=make_pair("A").left, params={}, output="value", count=1)
+    release = threading.Event()
+    calls = []
+
+    def slow_fetch(k: RequestKey) -> FetchResult:
+        calls.append(k)
+        release.wait(2.0)
+        return FetchResult(ok=True, latest_value=1.0, latest_ts="2024-01-01T00:00:00Z")
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futs = [pool.submit(cache.get_or_fetch, key, slow_fetch) for _ in range(4)]
+        while not calls:
+            pass
+        release.set()
+        results = [f.result() for f in futs]
+
+    assert len(calls) == 1
+    assert all(r is results[0] for r in results)
+    assert cache.stats.inflight_hit + cache.stats.run_hit == 3
+    # only the fetching owner counts a miss
+    assert cache.stats.miss == 1
+
+
+def test_row_epoch_matches_string_parse():
+    """The numeric fast path yields the same epoch as parsing str(ts)."""
+    from notifier_evaluator.fetch.types import _extract_ts_from_row, _parse_ts_best_effort, _row_epoch
+
+    for v in (0, -5, 1700000000, 1700000000000, 1700000000.5, 1e-5, 1e16, float("nan"), True, "2024-01-01T00:00:00Z", ""):
+        row = {"ts": v}
+        ts = _extract_ts_from_row(row)
+        assert _row_epoch(row) == (_parse_ts_best_effort(ts) if ts else None)
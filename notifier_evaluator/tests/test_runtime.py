@@ -204,4 +204,18 @@ def test_history_event_validation():
             event="eval",
             right_value=float('inf')
         )
-    assert "right_value must be a finite number" in str(exc.value)
\ No newline at end of file
+    assert "right_value must be a finite number" in str(exc.value)
+
+def test_safe_float_never_raises():
+    """safe_float returns None for non-finite/unconvertible input, including ints beyond float range."""
+    from notifier_evaluator.models.runtime import safe_float
+
+    assert safe_float(3) == 3.0
+    assert safe_float(2.5) == 2.5
+    assert safe_float("1.5") == 1.5
+    assert safe_float(10**400) is None
+    assert safe_float(-(10**400)) is None
+    assert safe_float(float("nan")) is None
+    assert safe_float(float("inf")) is None
+    assert safe_float(None) is None
+    assert safe_float("abc") is None
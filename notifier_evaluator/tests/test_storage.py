@@ -0,0 +1,36 @@
+# notifier_evaluator/tests/test_storage.py
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import threading
+import time
+
+import storage
+
+
+def test_flush_and_atomic_update_do_not_lose_updates(tmp_path, monkeypatch):
+    """A flush in progress must finish before atomic_update_json_list reads the file."""
+    monkeypatch.setattr(storage, "FLUSH_INTERVAL_MS", 60000)  # background flusher stays asleep
+    path = tmp_path / "alarms.json"
+
+    in_write = threading.Event()
+    real_write = storage._write_locked
+
+    def slow_write(p, payload, digest=None):
+        in_write.set()
+        time.sleep(0.2)
+        return real_write(p, payload, digest)
+
+    monkeypatch.setattr(storage, "_write_locked", slow_write)
+
+    storage.save_json_atomic(path, [{"id": 1}])
+    flusher = threading.Thread(target=storage.flush_pending)
+    flusher.start()
+    assert in_write.wait(2.0)
+
+    # pending entry is already popped; the update must still see (and keep) it
+    assert storage.load_json(path, []) == [{"id": 1}]
+    storage.atomic_update_json_list(path, lambda cur: (cur + [{"id": 2}], None))
+    flusher.join()
+
+    assert storage.load_json(path, []) == [{"id": 1}, {"id": 2}]
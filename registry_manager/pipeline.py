@@ -60,9 +60,9 @@ def build_mic_map(adapter: SourceAdapter) -> Dict[str, str]:
             opmic = (ex.get("OperatingMIC") or ex.get("MIC") or "").upper()
             if code:
                 mm[code] = opmic or ""
-        log.info(f"[MIC] map entries={len(mm)}")
+        log.info("[MIC] map entries=%d", len(mm))
     except Exception as e:
-        log.warning(f"[MIC] could not fetch exchanges: {e}")
+        log.warning("[MIC] could not fetch exchanges: %s", e)
     return mm
 
 def run_import(
@@ -81,7 +81,7 @@ def run_import(
 
     reg = RegistryClient(base=registry_endpoint)
     health = reg.health()
-    log.info(f"[PIPE] registry ok={health.get('ok')} engine={health.get('engine')}")
+    log.info("[PIPE] registry ok=%s engine=%s", health.get("ok"), health.get("engine"))
 
     mic_map = build_mic_map(adapter)
 
@@ -91,7 +91,7 @@ def run_import(
         try:
             raws = list(adapter.symbols(exch))
             if limit: raws = raws[:int(limit)]
-            log.info(f"[{source.upper()}][{exch}] processing n={len(raws)} limit={limit}")
+            log.info("[%s][%s] processing n=%d limit=%s", source.upper(), exch, len(raws), limit)
             for i, raw in enumerate(raws, 1):
                 try:
                     draft, key = adapter.normalize(exch, raw, mic_map)
@@ -116,11 +116,11 @@ def run_import(
                                     reg.upsert_identifier(matched_id, "isin", isin)
                                 stats["linked_listings"] += 1
                                 if i % 200 == 0:
-                                    log.info(f"[LINK][ISIN] {exch} {i}: {matched_id} <- {draft.listings[0].symbol}")
+                                    log.info("[LINK][ISIN] %s %s: %s <- %s", exch, i, matched_id, draft.listings[0].symbol)
                                 if sleep_sec: time.sleep(sleep_sec)
                                 continue
                         except Exception as e:
-                            log.warning(f"[WARN][ISIN] search failed ({isin}): {e}")
+                            log.warning("[WARN][ISIN] search failed (%s): %s", isin, e)
 
                     # 2) Symbol+Source(+MIC/Exchange) search
                     try:
@@ -134,11 +134,11 @@ def run_import(
                                     reg.upsert_identifier(matched_id, "isin", isin)
                             stats["linked_listings"] += 1
                             if i % 200 == 0:
-                                log.info(f"[LINK][SYM] {exch} {i}: {matched_id} <- {sym}")
+                                log.info("[LINK][SYM] %s %s: %s <- %s", exch, i, matched_id, sym)
                             if sleep_sec: time.sleep(sleep_sec)
                             continue
                     except Exception as e:
-                        log.warning(f"[WARN][SYM] search failed ({draft.listings[0].symbol}): {e}")
+                        log.warning("[WARN][SYM] search failed (%s): %s", draft.listings[0].symbol, e)
 
                     # 3) Neues Asset
                     payload = _asset_payload(draft)
@@ -147,20 +147,20 @@ def run_import(
                             reg.create_asset(payload)
                             stats["new_assets"] += 1
                             if i % 100 == 0:
-                                log.info(f"[NEW] {exch} {i}: {draft.id} ({draft.listings[0].symbol})")
+                                log.info("[NEW] %s %s: %s (%s)", exch, i, draft.id, draft.listings[0].symbol)
                         except Exception as e:
                             # ID-Kollision → Alt-ID
                             if "409" in str(e):
                                 payload["id"] = payload["id"] + f"-{exch.lower()}-{draft.listings[0].symbol.lower()}"
                                 reg.create_asset(payload)
                                 stats["new_assets"] += 1
-                                log.info(f"[NEW][ALT-ID] {exch} {i}: {payload['id']}")
+                                log.info("[NEW][ALT-ID] %s %s: %s", exch, i, payload["id"])
                             else:
                                 raise
                     else:
                         stats["new_assets"] += 1
                         if i % 100 == 0:
-                            log.info(f"[DRY][NEW] {exch} {i}: {draft.id} ({draft.listings[0].symbol})")
+                            log.info("[DRY][NEW] %s %s: %s (%s)", exch, i, draft.id, draft.listings[0].symbol)
 
                     if sleep_sec: time.sleep(sleep_sec)
 
@@ -173,7 +173,13 @@ def run_import(
 
         for k,v in stats.items():
             totals[k] = totals.get(k,0) + v
-        log.info(f"[DONE][{exch}] new={stats['new_assets']} linked={stats['linked_listings']} skip={stats['skipped']} err={stats['errors']}")
-
-    log.info(f"[SUMMARY] source={source} new={totals['new_assets']} linked={totals['linked_listings']} skip={totals['skipped']} err={totals['errors']}")
+        log.info(
+            "[DONE][%s] new=%s linked=%s skip=%s err=%s",
+            exch, stats["new_assets"], stats["linked_listings"], stats["skipped"], stats["errors"],
+        )
+
+    log.info(
+        "[SUMMARY] source=%s new=%s linked=%s skip=%s err=%s",
+        source, totals["new_assets"], totals["linked_listings"], totals["skipped"], totals["errors"],
+    )
     return totals
\ No newline at end of file
@@ -59,7 +59,7 @@ class RegistryClient:
     def add_listing(self, asset_id: str, listing: Dict[str,Any]) -> Dict[str,Any]:
         r = self.http.post(self._url(f"/assets/{asset_id}/listings"), json=listing, timeout=self.timeout)
         if r.status_code == 409:
-            log.debug(f"[REG][LISTING] duplicate ignored: {asset_id} {listing}")
+            log.debug("[REG][LISTING] duplicate ignored: %s %s", asset_id, listing)
             return {"ok": True, "duplicate": True}
         r.raise_for_status()
         return r.json()
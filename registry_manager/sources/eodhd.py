@@ -66,7 +66,7 @@ class EODHDAdapter(SourceAdapter):
     def _get(self, path: str, **params) -> Any:
         params = {**params, "api_token": self.token, "fmt": "json"}
         url = f"{self.base}{path}"
-        log.debug(f"[EODHD][GET] {url} params={params}")
+        log.debug("[EODHD][GET] %s params=%s", url, params)
         r = self.http.get(url, params=params, timeout=self.timeout)
         r.raise_for_status()
         return r.json()
@@ -120,8 +120,9 @@ class EODHDAdapter(SourceAdapter):
             f"[EODHD] exchange index built: codes={len(code_to_code)} "
             f"mics={len(mic_to_code)} names={len(name_to_code)}"
         )
-        log.debug(f"[EODHD][IDX] sample codes: {list(code_to_code.keys())[:10]}")
-        log.debug(f"[EODHD][IDX] sample mics : {list(mic_to_code.keys())[:10]}")
+        if log.isEnabledFor(logging.DEBUG):  # sample lists nur bauen, wenn DEBUG aktiv
+            log.debug("[EODHD][IDX] sample codes: %s", list(code_to_code.keys())[:10])
+            log.debug("[EODHD][IDX] sample mics : %s", list(mic_to_code.keys())[:10])
 
     def _resolve_exchange_code(self, exchange_code: str) -> str:
         """Nimmt MIC/Code/Name und liefert EODHD-Code zurück (z. B. 'NASDAQ')."""
@@ -132,19 +133,19 @@ class EODHDAdapter(SourceAdapter):
 
         # direkte Matches
         if q in idx["code_to_code"]:
-            log.debug(f"[EODHD][RESOLVE] {q} matched code")
+            log.debug("[EODHD][RESOLVE] %s matched code", q)
             return idx["code_to_code"][q]
         if q in idx["mic_to_code"]:
-            log.debug(f"[EODHD][RESOLVE] {q} matched mic")
+            log.debug("[EODHD][RESOLVE] %s matched mic", q)
             return idx["mic_to_code"][q]
         if q in idx["name_to_code"]:
-            log.debug(f"[EODHD][RESOLVE] {q} matched name")
+            log.debug("[EODHD][RESOLVE] %s matched name", q)
             return idx["name_to_code"][q]
 
         # Heuristik: sehr häufige Schreibweisen (Fallback)
         aliases = {"XNAS": "NASDAQ", "XNYS": "NYSE", "XASE": "AMEX", "XETR": "XETRA"}
         if q in aliases:
-            log.debug(f"[EODHD][RESOLVE] {q} via alias → {aliases[q]}")
+            log.debug("[EODHD][RESOLVE] %s via alias → %s", q, aliases[q])
             return aliases[q]
 
         raise RuntimeError(f"Unbekannte Exchange/MIC/Name für EODHD: '{exchange_code}'")
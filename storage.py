@@ -2,17 +2,36 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
 
+import atexit
+import copy
+import errno
 import json
 import os
+import threading
 import time
 import tempfile
 import hashlib
 import logging
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Callable, Tuple, List
+from typing import Any, Callable, Dict, Optional, Tuple, List
+
+try:  # POSIX: kernel-Lock (flock) statt O_EXCL-Lockfile-Polling
+    import fcntl  # type: ignore
+except Exception:  # pragma: no cover - Windows → O_EXCL-Fallback
+    fcntl = None  # type: ignore
+
+try:  # optional: orjson ist deutlich schneller für große Status-/Queue-Dateien
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - fallback auf stdlib json
+    orjson = None  # type: ignore
 
 log = logging.getLogger("notifier.storage")
 
+# Dir-fsync nach os.replace: opt-in (kostet einen Syscall + fsync pro Save,
+# scheitert auf SMB/NFS). Ohne bleibt der Replace atomar, nur nicht crash-dauerhaft.
+_DIR_FSYNC = os.environ.get("EVAL_DIR_FSYNC", "0").strip().lower() in ("1", "true", "yes", "on")
+
 
 # ─────────────────────────────────────────────────────────────
 # Pfad-Helfer
@@ -63,13 +82,18 @@ def _lock_path(path: Path) -> Path:
     - Deshalb: basename + hash(full_resolved_path)
     """
     p = to_path(path)
-    base = p.name or "unknown"
-    h = sha256_bytes(str(p).encode("utf-8"))[:16]
-    lp = LOCK_DIR / f"{base}.{h}.lock"
+    lp = LOCK_DIR / _lock_name(str(p), p.name or "unknown")
     log.debug("lock_path: target=%s lockfile=%s", p, lp)
     return lp
 
 
+@lru_cache(maxsize=1024)
+def _lock_name(full_path: str, base: str) -> str:
+    # dieselben paar Dateien werden ständig gelockt -> SHA256 nur einmal pro Pfad
+    h = sha256_bytes(full_path.encode("utf-8"))[:16]
+    return f"{base}.{h}.lock"
+
+
 def sha256_bytes(b: bytes) -> str:
     """
     Gibt SHA256-Hash eines Byte-Strings zurück.
@@ -79,12 +103,26 @@ def sha256_bytes(b: bytes) -> str:
     return h.hexdigest()
 
 
+def fast_digest(b: bytes) -> str:
+    """
+    Schneller, nicht-kryptografischer Fingerprint (blake2b/128) für Logs/Change-Detection.
+    Lock-Namen bleiben bei sha256_bytes (müssen prozessübergreifend stabil sein).
+    """
+    return hashlib.blake2b(b, digest_size=16).hexdigest()
+
+
+# Encoder einmal bauen: json.dumps(..., kwargs) erzeugt sonst pro Aufruf einen neuen JSONEncoder
+_ENC_STABLE = json.JSONEncoder(sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode
+_ENC_COMPACT = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+_ENC_PRETTY = json.JSONEncoder(indent=2, ensure_ascii=False).encode
+
+
 def _canon_json_bytes(obj: Any) -> bytes:
     """
     Canonical JSON bytes for comparisons (stable across indent/whitespace).
     """
     try:
-        s = json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+        s = _ENC_STABLE(obj)
         return s.encode("utf-8")
     except Exception as e:
         log.warning("canon_json failed err=%s -> fallback str()", e)
@@ -97,8 +135,11 @@ def _canon_json_bytes(obj: Any) -> bytes:
 
 class FileLock:
     """
-    Einfacher File-basierten Lock mit Stale-Erkennung.
-    Verwendet O_CREAT|O_EXCL um atomar eine Lock-Datei zu erzeugen.
+    Prozessübergreifender File-Lock.
+
+    POSIX: fcntl.flock(LOCK_EX) auf eine persistente Lock-Datei. Der Kernel gibt
+    den Lock beim Prozessende selbst frei -> keine Stale-Erkennung nötig.
+    Sonst (Windows): O_CREAT|O_EXCL-Lockdatei mit Stale-Erkennung + Polling.
 
     Beispiel:
         with FileLock(path):
@@ -119,6 +160,7 @@ class FileLock:
         self.poll = poll
         self.stale_after = stale_after
         self._acquired = False
+        self._fd: Optional[int] = None
 
     def _is_stale(self) -> bool:
         try:
@@ -153,6 +195,41 @@ class FileLock:
             log.debug("FileLock meta write failed: %s err=%s", self.lockfile, e)
 
     def acquire(self) -> None:
+        if fcntl is not None:
+            self._acquire_flock()
+        else:
+            self._acquire_excl()
+
+    def _acquire_flock(self) -> None:
+        fd = os.open(str(self.lockfile), os.O_CREAT | os.O_RDWR, 0o644)
+        try:
+            # unkontendiert (Normalfall): ein Syscall, kein Sleep
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            log.debug("FileLock contended target=%s lock=%s timeout=%.2fs", self._target, self.lockfile, self.timeout)
+            # kurzer Backoff (1ms, 2ms, ... bis poll) statt fixem poll-Intervall
+            deadline = time.monotonic() + self.timeout
+            delay = 0.001
+            while True:
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    break
+                except BlockingIOError:
+                    if time.monotonic() >= deadline:
+                        os.close(fd)
+                        log.error("FileLock timeout acquiring: %s (target=%s)", self.lockfile, self._target)
+                        raise TimeoutError(f"Timeout acquiring lock: {self.lockfile}")
+                    time.sleep(delay)
+                    delay = min(delay * 2, self.poll)
+        except Exception as e:
+            os.close(fd)
+            log.error("FileLock acquire unexpected err lock=%s err=%s", self.lockfile, e)
+            raise
+        self._fd = fd
+        self._acquired = True
+        log.debug("FileLock acquired (flock): %s", self.lockfile)
+
+    def _acquire_excl(self) -> None:
         start = time.time()
         log.debug("FileLock acquire start target=%s lock=%s timeout=%.2fs", self._target, self.lockfile, self.timeout)
 
@@ -198,6 +275,16 @@ class FileLock:
                 raise
 
     def release(self) -> None:
+        if self._fd is not None:
+            # Lock-Datei bleibt liegen (unlink würde mit wartenden flock()-Haltern racen)
+            fd, self._fd = self._fd, None
+            self._acquired = False
+            try:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            finally:
+                os.close(fd)
+            log.debug("FileLock released (flock): %s", self.lockfile)
+            return
         if self._acquired:
             try:
                 os.unlink(self.lockfile)
@@ -236,6 +323,19 @@ def read_text(path: Any, default: str = "") -> str:
         return default
 
 
+def _same_content(p: Path, payload: bytes) -> bool:
+    """
+    Datei-Inhalt == payload? Größe per stat() zuerst: andere Länge -> geändert,
+    ohne die Datei zu lesen. Sonst direkter Byte-Vergleich (memcmp), kein Hash.
+    """
+    try:
+        if p.stat().st_size != len(payload):
+            return False
+    except FileNotFoundError:
+        return False
+    return p.read_bytes() == payload
+
+
 def write_text_atomic(path: Any, text: str) -> None:
     """
     Schreibt Text atomar auf die Platte (Temp-Datei + replace).
@@ -244,17 +344,12 @@ def write_text_atomic(path: Any, text: str) -> None:
     _ensure_parent_dir(p)
     tmp = p.with_suffix(p.suffix + ".tmp")
     payload = text.encode("utf-8")
-    payload_hash = sha256_bytes(payload)
 
     with FileLock(p):
         try:
-            if p.exists():
-                cur = p.read_bytes()
-                if len(cur) == len(payload):
-                    cur_hash = sha256_bytes(cur)
-                    if cur_hash == payload_hash:
-                        log.debug("write_text_atomic skipped (no change): %s", p)
-                        return
+            if _same_content(p, payload):
+                log.debug("write_text_atomic skipped (no change): %s", p)
+                return
         except Exception as e:
             log.debug("write_text_atomic compare failed (%s): %s (will write anyway)", p, e)
 
@@ -264,23 +359,80 @@ def write_text_atomic(path: Any, text: str) -> None:
             os.fsync(f.fileno())
         os.replace(tmp, p)
 
-        try:
-            if hasattr(os, "O_DIRECTORY"):
-                dfd = os.open(str(p.parent), os.O_DIRECTORY)
-                try:
-                    os.fsync(dfd)
-                finally:
-                    os.close(dfd)
-        except Exception:
-            pass
+        _fsync_dir(p.parent)
 
-    log.info("write_text_atomic: %s bytes=%d sha256=%s", p, len(payload), payload_hash)
+    if log.isEnabledFor(logging.INFO):
+        log.info("write_text_atomic: %s bytes=%d digest=%s", p, len(payload), fast_digest(payload))
 
 
 # ─────────────────────────────────────────────────────────────
 # JSON-IO (generisch)
 # ─────────────────────────────────────────────────────────────
 
+_INF = float("inf")
+
+
+def _has_non_finite(obj: Any) -> bool:
+    """True, wenn irgendwo im Objekt ein NaN/±Inf-Float steckt."""
+    if type(obj) is float:
+        return obj != obj or obj in (_INF, -_INF)
+    if isinstance(obj, dict):
+        return any(_has_non_finite(v) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_finite(v) for v in obj)
+    return False
+
+
+def _json_dumps_bytes(data: Any, pretty: bool = True) -> bytes:
+    """
+    Serialisiert JSON als UTF-8 Bytes (Unicode nicht escaped).
+    pretty=True -> indent=2 (für Menschen), False -> kompakt (reine Maschinen-Dateien).
+    Nutzt orjson wenn vorhanden; bei nicht unterstützten Typen → stdlib json.
+    orjson schreibt NaN/Inf als null -> enthält die Ausgabe null und die Daten
+    nicht-endliche Floats, wird mit stdlib json geschrieben (NaN/Infinity wie bisher).
+    Floats können anders formatiert sein (1e-7 statt 1e-07), Werte sind identisch.
+    """
+    if orjson is not None:
+        try:
+            opt = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+            out = orjson.dumps(data, option=opt)
+            if b"null" not in out or not _has_non_finite(data):
+                return out
+            log.debug("non-finite floats in payload → stdlib json")
+        except TypeError as e:
+            log.debug("orjson dumps failed (%s) → stdlib json", e)
+    return (_ENC_PRETTY if pretty else _ENC_COMPACT)(data).encode("utf-8")
+
+
+def _json_loads_bytes(raw: bytes) -> Any:
+    """
+    Parst JSON aus Bytes (orjson wenn vorhanden, sonst stdlib json).
+    NaN/Infinity-Tokens (stdlib-Ausgabe) kann orjson nicht lesen → stdlib json.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw.decode("utf-8"))
+
+
+def _clone_fallback(fallback: Any) -> Any:
+    """
+    Klont das Default-Objekt (kein json roundtrip: kein serialize+parse nötig).
+    load_json klont selbst -> Aufrufer müssen ihr Template NICHT vorher kopieren.
+    """
+    # häufigster Fall: leere/triviale Defaults -> kein deepcopy-Memo-Overhead
+    if fallback is None or isinstance(fallback, (str, int, float, bool)):
+        return fallback
+    if type(fallback) in (dict, list) and not fallback:
+        return type(fallback)()
+    try:
+        return copy.deepcopy(fallback)
+    except Exception:
+        return fallback
+
+
 def load_json(path: Any, fallback: Any) -> Any:
     """
     Lädt JSON (list/dict/etc.). Gibt fallback zurück bei Fehlern.
@@ -289,17 +441,22 @@ def load_json(path: Any, fallback: Any) -> Any:
     ein veränderbares Default-Objekt shared.
     """
     p = to_path(path)
+    if FLUSH_INTERVAL_MS > 0:
+        # Pfad-Lock: ein laufender Flush dieser Datei ist erst fertig, dann wird gelesen
+        with _path_lock(p):
+            pending = _pending_payload(p)
+            if pending is not None:
+                return _json_loads_bytes(pending)
+            return _load_json_disk(p, fallback)
+    return _load_json_disk(p, fallback)
+
+
+def _load_json_disk(p: Path, fallback: Any) -> Any:
     if not p.exists():
         log.info("load_json: missing → fallback (%s)", p)
-        # kein deepcopy, um Import-Loop mit copy zu vermeiden; für einfache
-        # Strukturen reicht json roundtrip als Clone:
-        try:
-            return json.loads(json.dumps(fallback))
-        except Exception:
-            return fallback
+        return _clone_fallback(fallback)
     try:
-        txt = p.read_text(encoding="utf-8")
-        data = json.loads(txt)
+        data = _json_loads_bytes(p.read_bytes())
         log.info(
             "load_json: %s type=%s",
             p,
@@ -308,32 +465,94 @@ def load_json(path: Any, fallback: Any) -> Any:
         return data
     except Exception as e:
         log.error("load_json failed (%s): %s", p, e)
-        try:
-            return json.loads(json.dumps(fallback))
-        except Exception:
-            return fallback
+        return _clone_fallback(fallback)
 
 
-def save_json_atomic(path: Any, data: Any) -> None:
+def save_json_atomic(path: Any, data: Any, pretty: bool = True) -> None:
     """
     Schreibt JSON atomar, vermeidet unnötige Writes via Hashvergleich.
+    pretty=False für Dateien, die nur Programme lesen (halb so viele Bytes).
     """
     p = to_path(path)
     _ensure_parent_dir(p)
-    tmp = p.with_suffix(p.suffix + ".tmp")
 
-    payload = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
-    payload_hash = sha256_bytes(payload)
+    payload = _json_dumps_bytes(data, pretty)
+
+    if FLUSH_INTERVAL_MS > 0:
+        _enqueue_write(p, payload)
+        return
+
+    digest = fast_digest(payload)
+    if _unchanged_since_last_write(p, digest):
+        log.debug("save_json_atomic skipped (same as last write): %s", p)
+        return
+
+    if _write_locked(p, payload, digest):
+        _fsync_dir(p.parent)
+        log.info("save_json_atomic: %s bytes=%d digest=%s", p, len(payload), digest)
+
+
+# path -> (digest, mtime_ns, size) des zuletzt von DIESEM Prozess geschriebenen/geprüften Stands.
+# stat() erkennt fremde Writes (andere Prozesse) -> dann wieder Lock + Byte-Vergleich.
+_LAST_WRITTEN: Dict[Path, Tuple[str, int, int]] = {}
+
+
+def _remember_written(p: Path, digest: str) -> None:
+    try:
+        st = p.stat()
+        _LAST_WRITTEN[p] = (digest, st.st_mtime_ns, st.st_size)
+    except OSError:
+        _LAST_WRITTEN.pop(p, None)
+
+
+def _unchanged_since_last_write(p: Path, digest: str) -> bool:
+    last = _LAST_WRITTEN.get(p)
+    if last is None or last[0] != digest:
+        return False
+    try:
+        st = p.stat()
+    except OSError:
+        return False
+    return (st.st_mtime_ns, st.st_size) == last[1:]
+
+
+def _fsync_dir(d: Path) -> None:
+    """
+    fsync auf das Verzeichnis (macht os.replace auch nach Stromausfall dauerhaft).
+    Nur mit EVAL_DIR_FSYNC=1 – die Atomarität (tmp + replace) gilt so oder so.
+    """
+    if not _DIR_FSYNC or not hasattr(os, "O_DIRECTORY"):
+        return
+    try:
+        dfd = os.open(str(d), os.O_DIRECTORY)
+    except OSError as e:
+        log.debug("dir fsync open failed (%s): %s", d, e)
+        return
+    try:
+        os.fsync(dfd)
+    except OSError as e:
+        # SMB/NFS & Co. können Verzeichnis-fsync nicht -> ignorieren
+        if e.errno not in (errno.EINVAL, errno.ENOTSUP, errno.EBADF):
+            raise
+        log.debug("dir fsync unsupported (%s): %s", d, e)
+    finally:
+        os.close(dfd)
+
 
+def _write_locked(p: Path, payload: bytes, digest: Optional[str] = None) -> bool:
+    """
+    tmp schreiben -> fsync -> replace unter FileLock (ohne Dir-fsync).
+    Gibt False zurück wenn der Inhalt bereits identisch ist.
+    """
+    if digest is None:
+        digest = fast_digest(payload)
+    tmp = p.with_suffix(p.suffix + ".tmp")
     with FileLock(p):
         try:
-            if p.exists():
-                cur = p.read_bytes()
-                if len(cur) == len(payload):
-                    cur_hash = sha256_bytes(cur)
-                    if cur_hash == payload_hash:
-                        log.debug("save_json_atomic skipped (no change): %s", p)
-                        return
+            if _same_content(p, payload):
+                log.debug("save_json_atomic skipped (no change): %s", p)
+                _remember_written(p, digest)
+                return False
         except Exception as e:
             log.debug("save_json_atomic compare failed (%s): %s (will write anyway)", p, e)
 
@@ -342,18 +561,98 @@ def save_json_atomic(path: Any, data: Any) -> None:
             f.flush()
             os.fsync(f.fileno())
         os.replace(tmp, p)
+        _remember_written(p, digest)
+    return True
+
 
+# ─────────────────────────────────────────────────────────────
+# Write-Coalescing (optional, EVAL_FLUSH_INTERVAL_MS > 0)
+# ─────────────────────────────────────────────────────────────
+# Viele Saves derselben Datei pro Tick -> nur der letzte Stand wird geschrieben,
+# ein fsync pro Datei + ein Dir-fsync pro Verzeichnis pro Intervall.
+# Default 0 = aus (jeder Save schreibt sofort, wie bisher).
+
+try:
+    FLUSH_INTERVAL_MS = max(0, int(os.environ.get("EVAL_FLUSH_INTERVAL_MS", "0").strip() or 0))
+except ValueError:
+    FLUSH_INTERVAL_MS = 0
+
+_pending_lock = threading.Lock()
+_PENDING: Dict[Path, Tuple[bytes, float]] = {}  # path -> (payload, first_ts)
+_flusher: Optional[threading.Thread] = None
+# path -> In-Process-Lock: gehalten vom Pop aus _PENDING bis der Write fertig ist,
+# sowie von load_json / atomic_update_json_list -> kein Fenster, in dem ein
+# Eintrag weder pending noch auf der Platte ist (kein Lost Update durch alten Flush)
+_PATH_LOCKS: Dict[Path, threading.RLock] = {}
+
+
+def _path_lock(p: Path) -> threading.RLock:
+    lk = _PATH_LOCKS.get(p)
+    if lk is None:
+        with _pending_lock:
+            lk = _PATH_LOCKS.setdefault(p, threading.RLock())
+    return lk
+
+
+def _enqueue_write(p: Path, payload: bytes) -> None:
+    global _flusher
+    with _pending_lock:
+        prev = _PENDING.get(p)
+        _PENDING[p] = (payload, prev[1] if prev else time.time())
+        if _flusher is None:
+            _flusher = threading.Thread(target=_flush_loop, name="storage-flush", daemon=True)
+            _flusher.start()
+            atexit.register(flush_pending)
+    log.debug("save_json_atomic deferred: %s bytes=%d coalesced=%s", p, len(payload), prev is not None)
+
+
+def _pending_payload(p: Path) -> Optional[bytes]:
+    with _pending_lock:
+        entry = _PENDING.get(p)
+    return entry[0] if entry else None
+
+
+def _flush_loop() -> None:
+    interval = FLUSH_INTERVAL_MS / 1000.0
+    while True:
+        time.sleep(interval)
         try:
-            if hasattr(os, "O_DIRECTORY"):
-                dfd = os.open(str(p.parent), os.O_DIRECTORY)
-                try:
-                    os.fsync(dfd)
-                finally:
-                    os.close(dfd)
-        except Exception:
-            pass
+            flush_pending()
+        except Exception as e:
+            log.error("flush_pending failed: %s", e)
+
 
-    log.info("save_json_atomic: %s bytes=%d sha256=%s", p, len(payload), payload_hash)
+def flush_pending(path: Any = None) -> int:
+    """
+    Schreibt ausstehende (gecoalescte) Saves auf die Platte.
+    path=None -> alle; sonst nur diese Datei. Gibt Anzahl geschriebener Dateien zurück.
+    """
+    if path is None:
+        with _pending_lock:
+            paths = list(_PENDING)
+    else:
+        paths = [to_path(path)]
+
+    written = 0
+    dirs = set()
+    for p in paths:
+        # Pop + Write unter dem Pfad-Lock (wartet auch auf einen laufenden Flush derselben Datei)
+        with _path_lock(p):
+            with _pending_lock:
+                entry = _PENDING.pop(p, None)
+            if entry is None:
+                continue
+            payload, first_ts = entry
+            try:
+                if _write_locked(p, payload):
+                    written += 1
+                    dirs.add(p.parent)
+                    log.info("flush_pending: %s bytes=%d age=%.3fs", p, len(payload), time.time() - first_ts)
+            except Exception as e:
+                log.error("flush_pending write failed (%s): %s", p, e)
+    for d in dirs:
+        _fsync_dir(d)
+    return written
 
 
 # ─────────────────────────────────────────────────────────────
@@ -372,10 +671,10 @@ def load_json_any(path: Any, fallback: Any = None) -> Any:
     return load_json(path, fallback)
 
 
-def save_json_any(path: Any, data: Any) -> None:
+def save_json_any(path: Any, data: Any, pretty: bool = True) -> None:
     """Alias für save_json_atomic für beliebige JSON-Daten."""
 
-    save_json_atomic(path, data)
+    save_json_atomic(path, data, pretty)
 
 
 def load_json_list(path: Any, fallback: List[Any] | None = None) -> List[Any]:
@@ -403,7 +702,19 @@ def atomic_update_json_list(
     """
     p = to_path(path)
     _ensure_parent_dir(p)
+    if FLUSH_INTERVAL_MS > 0:
+        # Pfad-Lock über Flush + Read→Transform→Write: ein paralleler Flush dieser
+        # Datei kann das Ergebnis sonst mit seinem älteren Stand überschreiben
+        with _path_lock(p):
+            flush_pending(p)
+            return _update_json_list_locked(p, transform_fn)
+    return _update_json_list_locked(p, transform_fn)
+
 
+def _update_json_list_locked(
+    p: Path,
+    transform_fn: Callable[[List[Any]], Tuple[List[Any], Any]],
+) -> Tuple[List[Any], Any]:
     with FileLock(p):
         current = load_json_list(p, fallback=[])
         log.debug("atomic_update_json_list: loaded %s len=%d", p, len(current))
@@ -413,22 +724,14 @@ def atomic_update_json_list(
         cur_bytes = _canon_json_bytes(current)
         new_bytes = _canon_json_bytes(new_list)
 
-        if sha256_bytes(cur_bytes) != sha256_bytes(new_bytes):
+        if cur_bytes != new_bytes:
             tmp = p.with_suffix(p.suffix + ".tmp")
             with open(tmp, "wb") as f:
-                f.write(json.dumps(new_list, indent=2, ensure_ascii=False).encode("utf-8"))
+                f.write(_json_dumps_bytes(new_list))
                 f.flush()
                 os.fsync(f.fileno())
             os.replace(tmp, p)
-            try:
-                if hasattr(os, "O_DIRECTORY"):
-                    dfd = os.open(str(p.parent), os.O_DIRECTORY)
-                    try:
-                        os.fsync(dfd)
-                    finally:
-                        os.close(dfd)
-            except Exception:
-                pass
+            _fsync_dir(p.parent)
             log.info("atomic_update_json_list: saved %s (len=%d)", p, len(new_list))
         else:
             log.debug("atomic_update_json_list: no change for %s", p)